@@ -37,7 +37,7 @@ from typing import Any, Dict, List, Optional, Union
 
 from ..endpoints import CompanyEndpoints, FilingsEndpoints, XbrlEndpoints
 from ..types import CompanyTicker
-from ..utils import HttpClient
+from ..utils import FileCache, HttpClient
 
 # Configure module logger
 logger = logging.getLogger(__name__)
@@ -63,6 +63,11 @@ class SecEdgarApi:
         rate_limit_delay: Delay between requests in seconds (default: 0.1)
         max_retries: Maximum number of retry attempts (default: 3)
         timeout: Request timeout in seconds (default: 30)
+        http2: Use HTTP/2 connection multiplexing when httpx is installed
+            (default: False)
+        http_client: Existing pooled HTTP client to share (default: None)
+        cache: Cache JSON responses on disk (default: False)
+        cache_dir: Cache directory (default: ~/.cache/sec-edgar-toolkit)
 
     Raises:
         ValueError: If user_agent is not provided or is invalid
@@ -79,6 +84,10 @@ class SecEdgarApi:
         rate_limit_delay: float = 0.1,
         max_retries: int = 3,
         timeout: int = 30,
+        http2: bool = False,
+        http_client: Optional[HttpClient] = None,
+        cache: bool = False,
+        cache_dir: Optional[str] = None,
     ) -> None:
         """
         Initialize SEC EDGAR API client.
@@ -89,6 +98,13 @@ class SecEdgarApi:
             rate_limit_delay: Minimum delay between requests in seconds
             max_retries: Maximum number of retry attempts for failed requests
             timeout: Request timeout in seconds
+            http2: Use HTTP/2 connection multiplexing when httpx is installed
+            http_client: Existing pooled HTTP client to share. When given, the
+                         connection settings above are ignored and the caller
+                         remains responsible for closing it.
+            cache: Cache submissions, filing index, XBRL and frames responses
+                   on disk, revalidating expired entries with If-Modified-Since
+            cache_dir: Cache directory (defaults to ~/.cache/sec-edgar-toolkit)
 
         Raises:
             ValueError: If user_agent is empty or doesn't contain contact info
@@ -114,12 +130,15 @@ class SecEdgarApi:
         self.rate_limit_delay = rate_limit_delay
         self.timeout = timeout
 
-        # Initialize HTTP client
-        self.http_client = HttpClient(
+        # Initialize HTTP client; all endpoints share its connection pool
+        self._owns_http_client = http_client is None
+        self.http_client = http_client or HttpClient(
             user_agent=user_agent,
             rate_limit_delay=rate_limit_delay,
             max_retries=max_retries,
             timeout=timeout,
+            http2=http2,
+            cache=FileCache(cache_dir) if cache else None,
         )
 
         # Initialize endpoint modules
@@ -129,6 +148,22 @@ class SecEdgarApi:
 
         logger.info(f"SEC EDGAR API client initialized with User-Agent: {user_agent}")
 
+    def close(self) -> None:
+        """Release pooled HTTP connections owned by this client."""
+        if self._owns_http_client:
+            self.http_client.close()
+
+    async def aclose(self) -> None:
+        """Release the async connection pool owned by this client."""
+        if self._owns_http_client:
+            await self.http_client.aclose()
+
+    def __enter__(self) -> SecEdgarApi:
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
     # Company information methods (delegate to company endpoints)
     def get_company_tickers(self, force_refresh: bool = False) -> Dict[str, Any]:
         """Get all company tickers with CIK mappings."""
@@ -146,6 +181,10 @@ class SecEdgarApi:
         """Search for companies by name."""
         return self.company.search_companies(query)
 
+    def search_companies_many(self, queries: List[str]) -> Dict[str, List[Any]]:
+        """Search for companies matching any of several name queries."""
+        return self.company.search_companies_many(queries)
+
     # Filing methods (delegate to filings endpoints)
     def get_company_submissions(
         self,
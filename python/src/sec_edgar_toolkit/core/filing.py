@@ -284,6 +284,9 @@ class Filing:
 
             >>> # Extract specific items only
             >>> items = filing.extract_items(["1", "1A", "7"])
+
+            >>> # 10-Q Part II items are keyed with their part
+            >>> risk_factors = company.get_filing("10-Q").get_item("II.1A")
         """
         if self._extracted_items is None:
             # Get the filing content
@@ -10,6 +10,7 @@ from __future__ import annotations
 import asyncio
 import logging
 from contextlib import asynccontextmanager
+from operator import itemgetter
 from typing import Any, AsyncGenerator, Dict, List, Optional, Union
 
 from .client import SecEdgarApi
@@ -18,6 +19,8 @@ from .types import CompanyTicker
 
 logger = logging.getLogger(__name__)
 
+_filed_key = itemgetter("filed")
+
 
 class EdgarClient:
     """
@@ -30,6 +33,9 @@ class EdgarClient:
         >>> client = EdgarClient("MyApp/1.0 (contact@example.com)")
         >>> company = client.companies.lookup("AAPL")
         >>> filings = company.filings.filter(form_types=["10-K"]).limit(5).fetch()
+
+        >>> with EdgarClient("MyApp/1.0 (contact@example.com)", http2=True) as client:
+        ...     companies = client.companies.batch_lookup(["AAPL", "MSFT"])
     """
 
     def __init__(self, user_agent: str, **kwargs: Any) -> None:
@@ -58,6 +64,16 @@ class EdgarClient:
         # Could update internal settings here
         return self
 
+    def close(self) -> None:
+        """Release pooled HTTP connections held by the underlying API client."""
+        self._api.close()
+
+    def __enter__(self) -> EdgarClient:
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
 
 class CompanyQueryBuilder:
     """Fluent interface for company queries."""
@@ -108,6 +124,25 @@ class CompanyQueryBuilder:
         """
         return CompanySearchBuilder(self._api, query)
 
+    def search_many(self, queries: List[str]) -> Dict[str, List[Company]]:
+        """
+        Search for several company names in a single pass over the ticker table.
+
+        Args:
+            queries: Search queries
+
+        Returns:
+            Dictionary mapping each query to its matching companies
+
+        Example:
+            >>> results = client.companies.search_many(["Apple", "Tesla"])
+            >>> apple_matches = results["Apple"]
+        """
+        return {
+            query: [Company(data, self._api) for data in matches]
+            for query, matches in self._api.search_companies_many(queries).items()
+        }
+
     def batch_lookup(
         self, identifiers: List[Union[str, int]]
     ) -> List[Optional[Company]]:
@@ -381,6 +416,8 @@ class Company:
     information through an intuitive, chainable API.
     """
 
+    SUMMARY_CONCEPTS = ("Assets", "Liabilities", "StockholdersEquity", "Revenues")
+
     def __init__(self, data: CompanyTicker, api: SecEdgarApi) -> None:
         self._data = data
         self._api = api
@@ -426,13 +463,14 @@ class Company:
             >>> summary = company.financial_summary()
             >>> print(f"Assets: ${summary['total_assets']:,.0f}")
         """
-        key_concepts = ["Assets", "Liabilities", "StockholdersEquity", "Revenues"]
         summary = {}
 
-        for concept in key_concepts:
+        for concept in self.SUMMARY_CONCEPTS:
             facts = self.facts.concept(concept).in_units("USD").fetch()
             if facts:
-                latest = max(facts, key=lambda x: x.get("filed", ""))
+                # Filing dates are ISO formatted, so string order is date order
+                dated = [fact for fact in facts if fact.get("filed")]
+                latest = max(dated, key=_filed_key) if dated else facts[0]
                 summary[f"total_{concept.lower()}"] = latest.get("value")
 
         return summary
@@ -640,6 +678,10 @@ class AsyncEdgarClient:
 
         return await asyncio.get_event_loop().run_in_executor(None, builder.execute)
 
+    def close(self) -> None:
+        """Release pooled HTTP connections."""
+        self._client.close()
+
     @asynccontextmanager
     async def batch_operations(self) -> AsyncGenerator[AsyncEdgarClient, None]:
         """Context manager for batch operations."""
@@ -3,10 +3,18 @@
 from __future__ import annotations
 
 import time
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
+
+try:
+    import ahocorasick
+
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    ahocorasick = None
+    AHOCORASICK_AVAILABLE = False
 
 from ..types import CompanyTicker
-from ..utils import HttpClient
+from ..utils import HttpClient, pad_cik
 
 
 class CompanyEndpoints:
@@ -20,7 +28,10 @@ class CompanyEndpoints:
     - Company tickers data with caching
 
     Args:
-        http_client: HTTP client instance for making requests
+        http_client: HTTP client instance for making requests. The endpoints
+            never create their own client; the caller owns its lifecycle and
+            should share one instance across endpoints so requests reuse the
+            same pooled connections.
 
     Example:
         >>> client = HttpClient("MyApp/1.0 (contact@example.com)")
@@ -35,6 +46,10 @@ class CompanyEndpoints:
         self.http_client = http_client
         self._company_tickers_cache: Optional[Dict[str, Any]] = None
         self._cache_timestamp: Optional[float] = None
+        self._ticker_index: Dict[str, List[Any]] = {}
+        self._cik_index: Dict[int, List[Any]] = {}
+        self._rows: List[List[Any]] = []
+        self._names_lower: List[str] = []
 
     def get_company_tickers(self, force_refresh: bool = False) -> Dict[str, Any]:
         """
@@ -69,9 +84,66 @@ class CompanyEndpoints:
         # Cache the data
         self._company_tickers_cache = data
         self._cache_timestamp = time.time()
+        self._build_indices(data)
 
         return data
 
+    def _build_indices(self, tickers_data: Dict[str, Any]) -> None:
+        """Index ticker rows by ticker/CIK and precompute lowercased names."""
+        self._ticker_index = {}
+        self._cik_index = {}
+        self._rows = []
+        self._names_lower = []
+
+        field_indices = self._field_indices(tickers_data)
+        if field_indices is None:
+            return
+
+        cik_idx, name_idx, ticker_idx, _ = field_indices
+        min_length = max(field_indices) + 1
+
+        for company_data in tickers_data.get("data", []):
+            if len(company_data) >= min_length:
+                # Keep the first row for duplicate keys, as a linear scan would
+                self._ticker_index.setdefault(company_data[ticker_idx], company_data)
+                self._cik_index.setdefault(company_data[cik_idx], company_data)
+                self._rows.append(company_data)
+                self._names_lower.append(company_data[name_idx].lower())
+
+    @staticmethod
+    def _field_indices(
+        tickers_data: Dict[str, Any],
+    ) -> Optional[Tuple[int, int, int, int]]:
+        """Return the (cik, name, ticker, exchange) column positions."""
+        fields = tickers_data.get("fields", [])
+        if not fields:
+            return None
+
+        try:
+            return (
+                fields.index("cik"),
+                fields.index("name"),
+                fields.index("ticker"),
+                fields.index("exchange"),
+            )
+        except ValueError:
+            return None
+
+    @staticmethod
+    def _to_company_ticker(
+        company_data: List[Any], field_indices: Tuple[int, int, int, int]
+    ) -> CompanyTicker:
+        """Convert a raw ticker row to our expected format."""
+        cik_idx, name_idx, ticker_idx, exchange_idx = field_indices
+        return {
+            "cik_str": pad_cik(company_data[cik_idx]),
+            "ticker": company_data[ticker_idx],
+            "title": company_data[name_idx],
+            "exchange": company_data[exchange_idx]
+            if exchange_idx < len(company_data)
+            else None,
+        }
+
     def get_company_by_ticker(self, ticker: str) -> Optional[CompanyTicker]:
         """
         Get company information by ticker symbol.
@@ -89,35 +161,12 @@ class CompanyEndpoints:
         ticker = ticker.upper()
         tickers_data = self.get_company_tickers()
 
-        fields = tickers_data.get("fields", [])
-        if not fields:
+        field_indices = self._field_indices(tickers_data)
+        company_data = self._ticker_index.get(ticker)
+        if field_indices is None or company_data is None:
             return None
 
-        # Find field indices
-        try:
-            cik_idx = fields.index("cik")
-            name_idx = fields.index("name")
-            ticker_idx = fields.index("ticker")
-            exchange_idx = fields.index("exchange")
-        except ValueError:
-            return None
-
-        for company_data in tickers_data.get("data", []):
-            if (
-                len(company_data) > max(cik_idx, name_idx, ticker_idx, exchange_idx)
-                and company_data[ticker_idx] == ticker
-            ):
-                # Convert to our expected format
-                return {
-                    "cik_str": str(company_data[cik_idx]).zfill(10),
-                    "ticker": company_data[ticker_idx],
-                    "title": company_data[name_idx],
-                    "exchange": company_data[exchange_idx]
-                    if exchange_idx < len(company_data)
-                    else None,
-                }  # type: ignore[no-any-return]
-
-        return None
+        return self._to_company_ticker(company_data, field_indices)
 
     def get_company_by_cik(self, cik: Union[str, int]) -> Optional[CompanyTicker]:
         """
@@ -137,35 +186,12 @@ class CompanyEndpoints:
         target_cik = int(str(cik).lstrip("0")) if str(cik).strip() else 0
         tickers_data = self.get_company_tickers()
 
-        fields = tickers_data.get("fields", [])
-        if not fields:
+        field_indices = self._field_indices(tickers_data)
+        company_data = self._cik_index.get(target_cik)
+        if field_indices is None or company_data is None:
             return None
 
-        # Find field indices
-        try:
-            cik_idx = fields.index("cik")
-            name_idx = fields.index("name")
-            ticker_idx = fields.index("ticker")
-            exchange_idx = fields.index("exchange")
-        except ValueError:
-            return None
-
-        for company_data in tickers_data.get("data", []):
-            if (
-                len(company_data) > max(cik_idx, name_idx, ticker_idx, exchange_idx)
-                and company_data[cik_idx] == target_cik
-            ):
-                # Convert to our expected format
-                return {
-                    "cik_str": str(company_data[cik_idx]).zfill(10),
-                    "ticker": company_data[ticker_idx],
-                    "title": company_data[name_idx],
-                    "exchange": company_data[exchange_idx]
-                    if exchange_idx < len(company_data)
-                    else None,
-                }  # type: ignore[no-any-return]
-
-        return None
+        return self._to_company_ticker(company_data, field_indices)
 
     def search_companies(self, query: str) -> List[CompanyTicker]:
         """
@@ -184,34 +210,71 @@ class CompanyEndpoints:
         """
         query = query.lower()
         tickers_data = self.get_company_tickers()
-        results: List[CompanyTicker] = []
 
-        fields = tickers_data.get("fields", [])
-        if not fields:
-            return results
+        field_indices = self._field_indices(tickers_data)
+        if field_indices is None:
+            return []
 
-        # Find field indices
-        try:
-            cik_idx = fields.index("cik")
-            name_idx = fields.index("name")
-            ticker_idx = fields.index("ticker")
-            exchange_idx = fields.index("exchange")
-        except ValueError:
+        return [
+            self._to_company_ticker(company_data, field_indices)
+            for company_data, name in zip(self._rows, self._names_lower)
+            if query in name
+        ]
+
+    def search_companies_many(
+        self, queries: List[str]
+    ) -> Dict[str, List[CompanyTicker]]:
+        """
+        Search for companies matching any of several name queries.
+
+        The ticker table is scanned once for all queries (using an Aho-Corasick
+        automaton when ``pyahocorasick`` is installed) rather than once per query.
+
+        Args:
+            queries: Search queries (partial company names)
+
+        Returns:
+            Dictionary mapping each query to its list of matching companies
+
+        Example:
+            >>> results = endpoints.search_companies_many(["Apple", "Tesla"])
+            >>> print(len(results["Apple"]))
+        """
+        results: Dict[str, List[CompanyTicker]] = {query: [] for query in queries}
+        tickers_data = self.get_company_tickers()
+
+        field_indices = self._field_indices(tickers_data)
+        if field_indices is None or not queries:
             return results
 
-        for company_data in tickers_data.get("data", []):
-            if len(company_data) > max(cik_idx, name_idx, ticker_idx, exchange_idx):
-                company_name = company_data[name_idx].lower()
-                if query in company_name:
-                    # Convert to our expected format
-                    company_dict: CompanyTicker = {
-                        "cik_str": str(company_data[cik_idx]).zfill(10),
-                        "ticker": company_data[ticker_idx],
-                        "title": company_data[name_idx],
-                        "exchange": company_data[exchange_idx]
-                        if exchange_idx < len(company_data)
-                        else None,
-                    }
-                    results.append(company_dict)
+        # Lowercased needle -> original queries sharing it
+        needles: Dict[str, List[str]] = {}
+        for query in results:
+            needles.setdefault(query.lower(), []).append(query)
+
+        if AHOCORASICK_AVAILABLE and "" not in needles:
+            automaton = ahocorasick.Automaton()
+            for needle in needles:
+                automaton.add_word(needle, needle)
+            automaton.make_automaton()
+
+            def matches(name: str) -> Iterator[str]:
+                return (needle for _, needle in automaton.iter(name))
+
+        else:
+
+            def matches(name: str) -> Iterator[str]:
+                return (needle for needle in needles if needle in name)
+
+        for company_data, name in zip(self._rows, self._names_lower):
+            hits = set(matches(name))
+            if not hits:
+                continue
+
+            for needle in hits:
+                for query in needles[needle]:
+                    results[query].append(
+                        self._to_company_ticker(company_data, field_indices)
+                    )
 
         return results
@@ -3,9 +3,8 @@
 from __future__ import annotations
 
 from typing import Any, Dict, Optional, Union
-from urllib.parse import urljoin
 
-from ..utils import FilingFilter, HttpClient
+from ..utils import FilingFilter, HttpClient, pad_cik
 
 
 class FilingsEndpoints:
@@ -19,7 +18,10 @@ class FilingsEndpoints:
     - Filtering and search capabilities
 
     Args:
-        http_client: HTTP client instance for making requests
+        http_client: HTTP client instance for making requests. The endpoints
+            never create their own client; the caller owns its lifecycle and
+            should share one instance across endpoints so requests reuse the
+            same pooled connections.
 
     Example:
         >>> client = HttpClient("MyApp/1.0 (contact@example.com)")
@@ -29,6 +31,10 @@ class FilingsEndpoints:
 
     DATA_URL = "https://data.sec.gov/"
 
+    # Cache lifetimes in seconds; filing indexes are immutable per accession
+    SUBMISSIONS_TTL = 86400
+    FILING_INDEX_TTL = None
+
     def __init__(self, http_client: HttpClient) -> None:
         """Initialize filings endpoints."""
         self.http_client = http_client
@@ -64,10 +70,10 @@ class FilingsEndpoints:
             >>> print(f"Total filings: {len(subs['filings']['recent'])}")
         """
         # Normalize CIK to 10-digit string
-        cik_str = str(cik).zfill(10)
+        cik_str = pad_cik(cik)
 
-        url = urljoin(self.DATA_URL, f"submissions/CIK{cik_str}.json")
-        data = self.http_client.get(url)
+        url = f"{self.DATA_URL}submissions/CIK{cik_str}.json"
+        data = self.http_client.get_cached(url, "submissions", self.SUBMISSIONS_TTL)
 
         # Apply filters if provided
         if submission_type or from_date or to_date:
@@ -103,12 +109,12 @@ class FilingsEndpoints:
             >>> print(f"Form type: {filing['form']}")
             >>> print(f"Filed on: {filing['filingDate']}")
         """
-        cik_str = str(cik).zfill(10)
+        cik_str = pad_cik(cik)
         accession = accession_number.replace("-", "")
 
-        url = urljoin(
-            self.DATA_URL,
-            f"Archives/edgar/data/{cik_str}/{accession}/{accession_number}-index.json",
+        url = (
+            f"{self.DATA_URL}Archives/edgar/data/"
+            f"{cik_str}/{accession}/{accession_number}-index.json"
         )
 
-        return self.http_client.get(url)
+        return self.http_client.get_cached(url, "filings", self.FILING_INDEX_TTL)
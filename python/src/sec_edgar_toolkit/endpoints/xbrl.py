@@ -2,10 +2,12 @@
 
 from __future__ import annotations
 
-from typing import Any, Dict, Optional, Union
-from urllib.parse import urljoin
+import asyncio
+import time
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
 
-from ..utils import HttpClient
+from ..utils import HttpClient, pad_cik
 
 
 class XbrlEndpoints:
@@ -19,7 +21,12 @@ class XbrlEndpoints:
     - XBRL taxonomies and tags
 
     Args:
-        http_client: HTTP client instance for making requests
+        http_client: HTTP client instance for making requests. The endpoints
+            never create their own client; the caller owns its lifecycle and
+            should share one instance across endpoints so requests reuse the
+            same pooled connections.
+        memory_cache_size: Number of decoded company facts/concept payloads
+            kept in memory (0 disables the in-memory cache)
 
     Example:
         >>> client = HttpClient("MyApp/1.0 (contact@example.com)")
@@ -30,9 +37,65 @@ class XbrlEndpoints:
     BASE_URL = "https://data.sec.gov/api/xbrl/"
     DATA_URL = "https://data.sec.gov/"
 
-    def __init__(self, http_client: HttpClient) -> None:
+    # Cache lifetimes in seconds
+    COMPANY_FACTS_TTL = 86400
+    FRAMES_TTL = 3600
+
+    def __init__(self, http_client: HttpClient, memory_cache_size: int = 32) -> None:
         """Initialize XBRL endpoints."""
         self.http_client = http_client
+        self.memory_cache_size = memory_cache_size
+        self._memory_cache: OrderedDict[
+            Tuple[str, ...], Tuple[float, Dict[str, Any]]
+        ] = OrderedDict()
+
+    def _recall(self, key: Tuple[str, ...]) -> Optional[Dict[str, Any]]:
+        """Return a fresh decoded payload from the in-memory cache."""
+        entry = self._memory_cache.get(key)
+        if entry is not None and (time.time() - entry[0]) < self.COMPANY_FACTS_TTL:
+            self._memory_cache.move_to_end(key)
+            return entry[1]
+        return None
+
+    def _remember(self, key: Tuple[str, ...], data: Dict[str, Any]) -> None:
+        """Store a decoded payload in the in-memory cache, evicting the oldest."""
+        if self.memory_cache_size > 0:
+            self._memory_cache[key] = (time.time(), data)
+            self._memory_cache.move_to_end(key)
+            while len(self._memory_cache) > self.memory_cache_size:
+                self._memory_cache.popitem(last=False)
+
+    def _get_memoized(
+        self, key: Tuple[str, ...], url: str, namespace: str
+    ) -> Dict[str, Any]:
+        """Fetch a payload, reusing the decoded copy of recent requests."""
+        data = self._recall(key)
+        if data is None:
+            data = self.http_client.get_cached(url, namespace, self.COMPANY_FACTS_TTL)
+            self._remember(key, data)
+        return data
+
+    @staticmethod
+    def _filter_units(data: Dict[str, Any], unit: Optional[str]) -> Dict[str, Any]:
+        """Restrict concept data to one unit (on a copy, payloads are shared)."""
+        if (
+            unit
+            and "units" in data
+            and isinstance(data["units"], dict)
+            and unit in data["units"]
+        ):
+            return {**data, "units": {unit: data["units"][unit]}}
+        return data
+
+    @staticmethod
+    def _frames_period(year: int, quarter: Optional[int], instantaneous: bool) -> str:
+        """Build the frames period identifier (e.g. ``CY2023Q4I``)."""
+        if quarter:
+            period = f"CY{year}Q{quarter}"
+            if instantaneous:
+                period += "I"
+            return period
+        return f"CY{year}"
 
     def get_company_facts(self, cik: Union[str, int]) -> Dict[str, Any]:
         """
@@ -45,16 +108,17 @@ class XbrlEndpoints:
             cik: Company CIK number
 
         Returns:
-            Dictionary containing company facts organized by taxonomy
+            Dictionary containing company facts organized by taxonomy. Recent
+            results are shared from an in-memory cache and must not be mutated.
 
         Example:
             >>> facts = endpoints.get_company_facts("0000789019")
             >>> gaap = facts['facts']['us-gaap']
             >>> print(f"Available GAAP items: {len(gaap)}")
         """
-        cik_str = str(cik).zfill(10)
-        url = urljoin(self.DATA_URL, f"api/xbrl/companyfacts/CIK{cik_str}.json")
-        return self.http_client.get(url)
+        cik_str = pad_cik(cik)
+        url = f"{self.DATA_URL}api/xbrl/companyfacts/CIK{cik_str}.json"
+        return self._get_memoized(("companyfacts", cik_str), url, "companyfacts")
 
     def get_company_concept(
         self,
@@ -83,23 +147,86 @@ class XbrlEndpoints:
             >>> for item in data['units']['USD'][-5:]:
             ...     print(f"{item['fy']}: ${item['val']:,.0f}")
         """
-        cik_str = str(cik).zfill(10)
-        url = urljoin(
-            self.BASE_URL, f"companyconcept/CIK{cik_str}/{taxonomy}/{tag}.json"
-        )
+        cik_str = pad_cik(cik)
+        url = f"{self.BASE_URL}companyconcept/CIK{cik_str}/{taxonomy}/{tag}.json"
 
-        data = self.http_client.get(url)
+        data = self._get_memoized(
+            ("companyconcept", cik_str, taxonomy, tag), url, "companyconcept"
+        )
 
         # Filter by unit if specified
-        if (
-            unit
-            and "units" in data
-            and isinstance(data["units"], dict)
-            and unit in data["units"]
-        ):
-            data["units"] = {unit: data["units"][unit]}
+        return self._filter_units(data, unit)
 
-        return data
+    async def aget_company_concept(
+        self,
+        cik: Union[str, int],
+        taxonomy: str,
+        tag: str,
+        unit: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """
+        Asynchronous variant of ``get_company_concept``.
+
+        Shares the in-memory cache with the synchronous method but bypasses
+        the on-disk cache.
+
+        Args:
+            cik: Company CIK number
+            taxonomy: Taxonomy name (e.g., 'us-gaap', 'dei')
+            tag: XBRL tag name (e.g., 'Assets', 'Revenues')
+            unit: Unit of measurement (e.g., 'USD', 'shares')
+
+        Returns:
+            Historical data for the specified concept
+
+        Example:
+            >>> data = await endpoints.aget_company_concept("320193", "us-gaap", "Assets")
+        """
+        cik_str = pad_cik(cik)
+        key = ("companyconcept", cik_str, taxonomy, tag)
+
+        data = self._recall(key)
+        if data is None:
+            url = f"{self.BASE_URL}companyconcept/CIK{cik_str}/{taxonomy}/{tag}.json"
+            data = await self.http_client.aget(url)
+            self._remember(key, data)
+
+        return self._filter_units(data, unit)
+
+    async def aget_many_concepts(
+        self,
+        cik: Union[str, int],
+        specs: Sequence[Tuple[str, str, Optional[str]]],
+        max_concurrency: int = 8,
+    ) -> List[Dict[str, Any]]:
+        """
+        Fetch several concepts for a company concurrently.
+
+        Requests run over one pooled ``httpx.AsyncClient`` with at most
+        ``max_concurrency`` in flight, still subject to the client's rate limit.
+
+        Args:
+            cik: Company CIK number
+            specs: ``(taxonomy, tag, unit)`` tuples; unit may be None
+            max_concurrency: Maximum number of requests in flight
+
+        Returns:
+            Concept data for each spec, in the same order
+
+        Example:
+            >>> concepts = await endpoints.aget_many_concepts(
+            ...     "320193",
+            ...     [("us-gaap", "Assets", "USD"), ("us-gaap", "Revenues", None)],
+            ... )
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def bounded(spec: Tuple[str, str, Optional[str]]) -> Dict[str, Any]:
+            taxonomy, tag, unit = spec
+            async with semaphore:
+                return await self.aget_company_concept(cik, taxonomy, tag, unit)
+
+        return list(await asyncio.gather(*(bounded(spec) for spec in specs)))
 
     def get_frames(
         self,
@@ -131,13 +258,38 @@ class XbrlEndpoints:
             >>> frame = endpoints.get_frames("us-gaap", "Assets", "USD", 2023, 4)
             >>> print(f"Total companies: {len(frame['data'])}")
         """
-        if quarter:
-            period = f"CY{year}Q{quarter}"
-            if instantaneous:
-                period += "I"
-        else:
-            period = f"CY{year}"
+        period = self._frames_period(year, quarter, instantaneous)
+        url = f"{self.BASE_URL}frames/{taxonomy}/{tag}/{unit}/{period}.json"
+
+        return self.http_client.get_cached(url, "frames", self.FRAMES_TTL)
 
-        url = urljoin(self.BASE_URL, f"frames/{taxonomy}/{tag}/{unit}/{period}.json")
+    async def aget_frames(
+        self,
+        taxonomy: str,
+        tag: str,
+        unit: str,
+        year: int,
+        quarter: Optional[int] = None,
+        instantaneous: bool = False,
+    ) -> Dict[str, Any]:
+        """
+        Asynchronous variant of ``get_frames`` (bypasses the on-disk cache).
+
+        Args:
+            taxonomy: Taxonomy name (e.g., 'us-gaap')
+            tag: XBRL tag name (e.g., 'Assets')
+            unit: Unit of measurement (e.g., 'USD')
+            year: Calendar year (e.g., 2023)
+            quarter: Quarter number (1-4), or None for annual
+            instantaneous: Whether to get instantaneous values
+
+        Returns:
+            Aggregated data for all companies
+
+        Example:
+            >>> frame = await endpoints.aget_frames("us-gaap", "Assets", "USD", 2023, 4)
+        """
+        period = self._frames_period(year, quarter, instantaneous)
+        url = f"{self.BASE_URL}frames/{taxonomy}/{tag}/{unit}/{period}.json"
 
-        return self.http_client.get(url)
+        return await self.http_client.aget(url)
@@ -5,7 +5,34 @@ from __future__ import annotations
 import logging
 import re
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from functools import cached_property, lru_cache
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Match,
+    Optional,
+    Pattern,
+    Tuple,
+    Union,
+)
+
+try:
+    import numpy as np
+
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+try:
+    import ahocorasick
+
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    ahocorasick = None
+    AHOCORASICK_AVAILABLE = False
 
 from ..types.current_events import (
     Acquisition,
@@ -18,27 +45,358 @@ from ..types.current_events import (
 
 logger = logging.getLogger(__name__)
 
+# Byte patterns run on the raw filing; ``\s`` is widened to what it matches in
+# latin-1 text so results are identical to scanning the decoded string
+_LATIN1_WS = rb"[\s\x1c-\x1f\x85\xa0]"
+
+# Item headings
+_ITEM_HEADING_RE = re.compile(
+    rb"(?i:ITEM)\s+(?P<item_number>\d+\.\d+)\s+(?P<item_title>[^\n\r]+)".replace(
+        rb"\s", _LATIN1_WS
+    )
+)
+
+# Header fields: literal anchor (located with ``bytes.find``) and the value
+# pattern matched right after it
+_HEADER_FIELDS: Tuple[Tuple[str, bytes, Pattern[bytes]], ...] = tuple(
+    (name, anchor, re.compile(value.replace(rb"\s", _LATIN1_WS)))
+    for name, anchor, value in (
+        ("cik", b"CENTRAL INDEX KEY:", rb"\s*(?P<value>\d+)"),
+        ("company_name", b"COMPANY CONFORMED NAME:", rb"\s*(?P<value>[^\n\r]+)"),
+        ("form_type", b"FORM TYPE:", rb"\s*(?P<value>[^\n\r]+)"),
+        ("filing_date", b"FILED AS OF DATE:", rb"\s*(?P<value>\d{8})"),
+        ("period", b"CONFORMED PERIOD OF REPORT:", rb"\s*(?P<value>\d{8})"),
+    )
+)
+
+# Item headings and section anchors
+_NEXT_ITEM_RE = re.compile(r"ITEM")
+_AGREEMENT_SECTION_RE = re.compile(
+    r"ITEM 1\.01|MATERIAL AGREEMENT|DEFINITIVE AGREEMENT", re.IGNORECASE
+)
+_EXECUTIVE_SECTION_RE = re.compile(
+    r"ITEM 5\.02|DEPARTURE.*DIRECTOR|APPOINTMENT.*OFFICER", re.IGNORECASE
+)
+_ACQUISITION_SECTION_RE = re.compile(
+    r"ITEM 2\.01|ACQUISITION|MERGER|DIVESTITURE", re.IGNORECASE
+)
+_EARNINGS_SECTION_RE = re.compile(
+    r"ITEM 2\.02|RESULTS.*OPERATIONS|EARNINGS", re.IGNORECASE
+)
+_SECTION_PATTERNS: Dict[str, Pattern[str]] = {
+    "agreement": _AGREEMENT_SECTION_RE,
+    "executive": _EXECUTIVE_SECTION_RE,
+    "acquisition": _ACQUISITION_SECTION_RE,
+    "earnings": _EARNINGS_SECTION_RE,
+}
+
+# The same anchors as (lowercase literals, (prefix, suffix) pairs standing for
+# ``PREFIX.*SUFFIX`` on one line), for the Aho-Corasick scan
+_SECTION_ANCHORS: Dict[str, Tuple[Tuple[str, ...], Tuple[Tuple[str, str], ...]]] = {
+    "agreement": (("item 1.01", "material agreement", "definitive agreement"), ()),
+    "executive": (
+        ("item 5.02",),
+        (("departure", "director"), ("appointment", "officer")),
+    ),
+    "acquisition": (("item 2.01", "acquisition", "merger", "divestiture"), ()),
+    "earnings": (("item 2.02", "earnings"), (("results", "operations"),)),
+}
+
+# Section content
+_AGREEMENT_RE = re.compile(r"agreement.*?with\s+([^,.]+)", re.IGNORECASE)
+_NAME_ACTION_RE = re.compile(
+    r"([A-Z][a-z]+\s+[A-Z][a-z]+).*?(appointed|resigned|terminated)",
+    re.IGNORECASE,
+)
+_VALUE_RE = re.compile(
+    r"\$([0-9,]+(?:\.[0-9]+)?)\s*(?:million|billion)?", re.IGNORECASE
+)
+_TARGET_RE = re.compile(
+    r"(?:acquire|purchase|merger with)\s+([A-Z][^,.]{10,50})", re.IGNORECASE
+)
+_GUIDANCE_RE = re.compile(
+    r"(?:guidance|expects?).*?([a-zA-Z\s]+).*?(\$[0-9,]+|\d+%)",
+    re.IGNORECASE,
+)
+
+# Significance keywords, most significant first
+_HIGH_KEYWORDS = ("acquisition", "merger", "bankruptcy", "material adverse")
+_MEDIUM_KEYWORDS = ("agreement", "executive", "earnings", "results")
+
+# Earnings metric label alternations
+_REVENUE_METRIC = r"revenue|sales"
+_NET_INCOME_METRIC = r"net income|earnings"
+_EPS_METRIC = r"earnings per share|EPS"
+
+
+@lru_cache(maxsize=256)
+def _position_re(name: str) -> Pattern[str]:
+    """Compile the pattern matching the position held by a person."""
+    return re.compile(
+        rf"{name}.*?(CEO|CFO|President|Director|Officer|Vice President)",
+        re.IGNORECASE,
+    )
+
+
+@lru_cache(maxsize=256)
+def _metric_re(pattern: str) -> Pattern[str]:
+    """Compile the pattern matching a dollar amount following a metric label."""
+    return re.compile(rf"{pattern}.*?\$([0-9,]+(?:\.[0-9]+)?)", re.IGNORECASE)
+
+
+def _to_number(raw: str) -> float:
+    """Convert a matched amount such as ``"1,234.5"`` to a float."""
+    return float(raw.replace(",", "") if "," in raw else raw)
+
+
+def _count_keywords_kernel(buf: Any, needles: Any, offsets: Any) -> Any:
+    """
+    Count non-overlapping occurrences of each needle in a byte buffer.
+
+    Written for ``numba.njit``: ``buf`` and ``needles`` are ``uint8`` arrays,
+    needle ``k`` spans ``needles[offsets[k]:offsets[k + 1]]``.
+    """
+    num_needles = offsets.shape[0] - 1
+    counts = np.zeros(num_needles, dtype=np.int64)
+    size = buf.shape[0]
+
+    for k in range(num_needles):
+        start = offsets[k]
+        length = offsets[k + 1] - start
+        first = needles[start]
+        i = 0
+        while i <= size - length:
+            if buf[i] == first:
+                j = 1
+                while j < length and buf[i + j] == needles[start + j]:
+                    j += 1
+                if j == length:
+                    counts[k] += 1
+                    i += length
+                    continue
+            i += 1
+
+    return counts
+
+
+@lru_cache(maxsize=1)
+def _jit_keyword_counter() -> Optional[Callable[..., Any]]:
+    """Compile the keyword counter with Numba, or return None if unavailable."""
+    # Imported lazily: Numba adds about a second to import time
+    try:
+        import numba
+    except ImportError:
+        return None
+
+    return numba.njit(cache=True)(_count_keywords_kernel)  # type: ignore[no-any-return]
+
+
+def _build_section_automaton() -> Any:
+    """Build one automaton matching every section anchor keyword."""
+    entries: Dict[str, List[Tuple[str, str, str]]] = {}
+    for section, (keywords, compounds) in _SECTION_ANCHORS.items():
+        for keyword in keywords:
+            entries.setdefault(keyword, []).append((section, keyword, ""))
+        for prefix, suffix in compounds:
+            entries.setdefault(prefix, []).append((section, prefix, suffix))
+
+    automaton = ahocorasick.Automaton()
+    for word, value in entries.items():
+        automaton.add_word(word, value)
+    automaton.make_automaton()
+    return automaton
+
+
+_SECTION_AUTOMATON = _build_section_automaton() if AHOCORASICK_AVAILABLE else None
+
 
 class CurrentEventParser:
     """Parser for SEC 8-K current event forms."""
 
-    def __init__(self, raw_content: str) -> None:
+    # Longest section returned when no following ITEM heading bounds it
+    MAX_SECTION_LENGTH = 10000
+
+    def __init__(self, raw_content: Union[str, bytes]) -> None:
         """
         Initialize the current event parser.
 
         Args:
-            raw_content: Raw content of the 8-K filing
+            raw_content: Raw content of the 8-K filing, as text or as the
+                undecoded bytes returned by ``HttpClient.get_raw``
+        """
+        self._raw_bytes: Optional[bytes] = None
+        self._raw_text: Optional[str] = None
+        self._load(raw_content)
+
+    def _load(self, raw_content: Union[str, bytes]) -> None:
+        """Store the filing; UTF-8 bytes are decoded unless they are ASCII."""
+        if isinstance(raw_content, bytes) and raw_content.isascii():
+            # ASCII is its own latin-1 encoding, so the bytes are scanned as-is
+            self._raw_bytes = raw_content
+            self._raw_text = None
+        else:
+            if isinstance(raw_content, bytes):
+                raw_content = raw_content.decode("utf-8", errors="replace")
+            self._raw_bytes = None
+            self._raw_text = raw_content
+
+    @property
+    def raw_bytes(self) -> bytes:
+        """Raw filing as latin-1 bytes, one byte per character of ``raw_content``."""
+        if self._raw_bytes is None:
+            # "replace" keeps offsets aligned for characters outside latin-1
+            self._raw_bytes = self.raw_content.encode("latin-1", errors="replace")
+        return self._raw_bytes
+
+    @property
+    def raw_content(self) -> str:
+        """Raw filing as text, decoded lazily from ASCII bytes input."""
+        if self._raw_text is None:
+            self._raw_text = self.raw_bytes.decode("latin-1")
+        return self._raw_text
+
+    @raw_content.setter
+    def raw_content(self, raw_content: str) -> None:
+        """Replace the filing and drop everything parsed from the old one."""
+        self._load(raw_content)
+        for klass in type(self).__mro__:
+            for name, attribute in vars(klass).items():
+                if isinstance(attribute, cached_property):
+                    self.__dict__.pop(name, None)
+
+    def _group(self, match: Match[bytes], name: str) -> str:
+        """Return a token group as text."""
+        if self._raw_text is not None:
+            return self._raw_text[match.start(name) : match.end(name)]
+        return match.group(name).decode("latin-1")  # type: ignore[no-any-return]
+
+    @cached_property
+    def _index(self) -> Tuple[Dict[str, str], List[Tuple[str, str, int]]]:
+        """
+        Tokenize the filing.
+
+        Header fields are located by literal search, which is far cheaper than
+        running the regex engine over the whole document, and item headings by
+        one pass of the item pattern.
+
+        Returns:
+            Tuple of (first value of each header field, list of
+            ``(item_number, title, start)`` for every item heading)
+        """
+        header_fields: Dict[str, str] = {}
+        items: List[Tuple[str, str, int]] = []
+
+        data = self.raw_bytes
+
+        for name, anchor, value_re in _HEADER_FIELDS:
+            index = data.find(anchor)
+            while index != -1:
+                match = value_re.match(data, index + len(anchor))
+                if match:
+                    header_fields[name] = self._group(match, "value")
+                    break
+                index = data.find(anchor, index + 1)
+
+        for match in _ITEM_HEADING_RE.finditer(data):
+            items.append(
+                (
+                    self._group(match, "item_number"),
+                    self._group(match, "item_title"),
+                    match.start(),
+                )
+            )
+
+        return header_fields, items
+
+    @cached_property
+    def _section_starts(self) -> Dict[str, int]:
+        """
+        Locate the first anchor of every section.
+
+        Uses one Aho-Corasick pass when ``pyahocorasick`` is installed, and
+        one search per precompiled section pattern otherwise.
+
+        Returns:
+            Offset of the first anchor of each section found
         """
-        self.raw_content = raw_content
+        automaton = _SECTION_AUTOMATON
+        if not AHOCORASICK_AVAILABLE or automaton is None:
+            return self._search_section_starts()
+
+        text = self.raw_content.lower()
+        # Lowercasing a few non-ASCII characters changes offsets; use regexes
+        if len(text) != len(self.raw_content):
+            return self._search_section_starts()
+
+        starts: Dict[str, int] = {}
+        for end, entries in automaton.iter(text):
+            for section, word, suffix in entries:
+                start = end - len(word) + 1
+                if section in starts and starts[section] <= start:
+                    continue
+                if suffix:
+                    # ``PREFIX.*SUFFIX``: the suffix must follow on the same line
+                    line_end = text.find("\n", end + 1)
+                    if line_end == -1:
+                        line_end = len(text)
+                    if text.find(suffix, end + 1, line_end) == -1:
+                        continue
+                starts[section] = start
+
+        return starts
+
+    def _search_section_starts(self) -> Dict[str, int]:
+        """Locate section anchors with the precompiled section patterns."""
+        starts: Dict[str, int] = {}
+        for section, pattern in _SECTION_PATTERNS.items():
+            match = pattern.search(self.raw_content)
+            if match:
+                starts[section] = match.start()
+        return starts
+
+    @cached_property
+    def header(self) -> Dict[str, Any]:
+        """Header information from the filing."""
+        header_fields, _ = self._index
+
+        return {
+            "cik": header_fields.get("cik", ""),
+            "company_name": header_fields.get("company_name", "").strip(),
+            "form_type": header_fields.get("form_type", "").strip(),
+            "ticker": "",  # Would need to extract from trading symbol
+            "filing_date": self.filing_date,
+        }
+
+    @cached_property
+    def filing_date(self) -> datetime:
+        """Filing date of the document."""
+        header_fields, _ = self._index
+        return self._parse_date(header_fields.get("filing_date"))
+
+    @cached_property
+    def reporting_period(self) -> str:
+        """Reporting period as a quarter label (e.g. ``"Q1 2024"``)."""
+        header_fields, _ = self._index
+        period = header_fields.get("period")
+        if period:
+            date = self._parse_date(period)
+            quarter = (date.month - 1) // 3 + 1
+            return f"Q{quarter} {date.year}"
+        return "Current Period"
 
     def parse_all(self) -> ParsedCurrentEvent:
         """
         Parse all current events from the 8-K filing.
 
+        Each part is computed lazily and cached on the parser, so callers that
+        only need the header (``parser.header``) or one section (e.g.
+        ``parser.material_agreements``) skip the remaining extraction work.
+        Cached results are shared between calls and should not be mutated.
+
         Returns:
             ParsedCurrentEvent containing all extracted information
         """
-        header = self._parse_header()
+        header = self.header
 
         return ParsedCurrentEvent(
             form_type=header["form_type"],
@@ -46,14 +404,35 @@ class CurrentEventParser:
             cik=header["cik"],
             company_name=header["company_name"],
             ticker=header["ticker"],
-            events=self.get_current_events(),
-            material_agreements=self.get_material_agreements(),
-            executive_changes=self.get_executive_changes(),
-            acquisitions=self.get_acquisitions(),
-            earnings_results=self.get_earnings_results(),
+            events=self.events,
+            material_agreements=self.material_agreements,
+            executive_changes=self.executive_changes,
+            acquisitions=self.acquisitions,
+            earnings_results=self.earnings_results,
         )
 
     def get_current_events(self) -> List[Event]:
+        """Return the cached ``events`` (backwards-compatible alias)."""
+        return self.events
+
+    def get_material_agreements(self) -> List[Agreement]:
+        """Return the cached ``material_agreements`` (backwards-compatible alias)."""
+        return self.material_agreements
+
+    def get_executive_changes(self) -> List[ExecutiveChange]:
+        """Return the cached ``executive_changes`` (backwards-compatible alias)."""
+        return self.executive_changes
+
+    def get_acquisitions(self) -> List[Acquisition]:
+        """Return the cached ``acquisitions`` (backwards-compatible alias)."""
+        return self.acquisitions
+
+    def get_earnings_results(self) -> Optional[EarningsData]:
+        """Return the cached ``earnings_results`` (backwards-compatible alias)."""
+        return self.earnings_results
+
+    @cached_property
+    def events(self) -> List[Event]:
         """
         Extract current events from the filing.
 
@@ -62,30 +441,31 @@ class CurrentEventParser:
         """
         events: List[Event] = []
 
-        # Extract Item numbers and descriptions
-        item_pattern = re.compile(r"ITEM\s+(\d+\.\d+)\s+([^\n\r]+)", re.IGNORECASE)
+        _, items = self._index
+        content = self.raw_content
 
-        for match in item_pattern.finditer(self.raw_content):
-            item_number = match.group(1)
-            description = match.group(2).strip()
+        # Extract Item numbers and descriptions
+        for (item_number, title, _), (start, end) in zip(items, self._item_spans):
+            description = title.strip()
 
             events.append(
                 Event(
                     type=self._map_item_to_event_type(item_number),
                     description=description,
-                    date=self._extract_filing_date(),
+                    date=self.filing_date,
                     item=f"Item {item_number}",
                     significance=self._assess_event_significance(description),
                     details={
                         "item_number": item_number,
-                        "full_text": self._extract_item_content(item_number),
+                        "full_text": content[start:end],
                     },
                 )
             )
 
         return events
 
-    def get_material_agreements(self) -> List[Agreement]:
+    @cached_property
+    def material_agreements(self) -> List[Agreement]:
         """
         Extract material agreements from the filing.
 
@@ -95,30 +475,28 @@ class CurrentEventParser:
         agreements: List[Agreement] = []
 
         # Look for agreement-related content
-        agreement_section = self._extract_section(
-            r"ITEM 1\.01|MATERIAL AGREEMENT|DEFINITIVE AGREEMENT"
-        )
+        agreement_section = self._extract_section("agreement")
 
         if agreement_section:
-            agreement_pattern = re.compile(
-                r"agreement.*?with\s+([^,.]+)", re.IGNORECASE
-            )
-
-            for match in agreement_pattern.finditer(agreement_section):
+            # Every agreement shares the section text; derive its fields once
+            description = agreement_section[:500]
+            value = self._extract_agreement_value(agreement_section)
+            for match in _AGREEMENT_RE.finditer(agreement_section):
                 agreements.append(
                     Agreement(
                         type="Material Agreement",
                         parties=[match.group(1).strip()],
-                        effective_date=self._extract_filing_date(),
-                        description=agreement_section[:500],
-                        value=self._extract_agreement_value(agreement_section),
+                        effective_date=self.filing_date,
+                        description=description,
+                        value=value,
                         currency="USD",
                     )
                 )
 
         return agreements
 
-    def get_executive_changes(self) -> List[ExecutiveChange]:
+    @cached_property
+    def executive_changes(self) -> List[ExecutiveChange]:
         """
         Extract executive changes from the filing.
 
@@ -128,17 +506,10 @@ class CurrentEventParser:
         changes: List[ExecutiveChange] = []
 
         # Look for executive change content
-        change_section = self._extract_section(
-            r"ITEM 5\.02|DEPARTURE.*DIRECTOR|APPOINTMENT.*OFFICER"
-        )
+        change_section = self._extract_section("executive")
 
         if change_section:
-            name_pattern = re.compile(
-                r"([A-Z][a-z]+\s+[A-Z][a-z]+).*?(appointed|resigned|terminated)",
-                re.IGNORECASE,
-            )
-
-            for match in name_pattern.finditer(change_section):
+            for match in _NAME_ACTION_RE.finditer(change_section):
                 name = match.group(1).strip()
                 action = match.group(2).lower()
 
@@ -157,13 +528,14 @@ class CurrentEventParser:
                             "name": name,
                             "position": self._extract_position(change_section, name),
                         },
-                        effective_date=self._extract_filing_date(),
+                        effective_date=self.filing_date,
                     )
                 )
 
         return changes
 
-    def get_acquisitions(self) -> List[Acquisition]:
+    @cached_property
+    def acquisitions(self) -> List[Acquisition]:
         """
         Extract acquisitions and mergers from the filing.
 
@@ -173,9 +545,7 @@ class CurrentEventParser:
         acquisitions: List[Acquisition] = []
 
         # Look for acquisition content
-        acquisition_section = self._extract_section(
-            r"ITEM 2\.01|ACQUISITION|MERGER|DIVESTITURE"
-        )
+        acquisition_section = self._extract_section("acquisition")
 
         if acquisition_section:
             acquisitions.append(
@@ -194,7 +564,8 @@ class CurrentEventParser:
 
         return acquisitions
 
-    def get_earnings_results(self) -> Optional[EarningsData]:
+    @cached_property
+    def earnings_results(self) -> Optional[EarningsData]:
         """
         Extract earnings results from the filing.
 
@@ -202,58 +573,36 @@ class CurrentEventParser:
             EarningsData object or None if no earnings data found
         """
         # Look for earnings-related content
-        earnings_section = self._extract_section(
-            r"ITEM 2\.02|RESULTS.*OPERATIONS|EARNINGS"
-        )
+        earnings_section = self._extract_section("earnings")
 
         if not earnings_section:
             return None
 
         return EarningsData(
-            period=self._extract_reporting_period(),
-            revenue=self._extract_metric(earnings_section, r"revenue|sales"),
-            net_income=self._extract_metric(earnings_section, r"net income|earnings"),
-            earnings_per_share=self._extract_metric(
-                earnings_section, r"earnings per share|EPS"
-            ),
+            period=self.reporting_period,
+            revenue=self._extract_metric(earnings_section, _REVENUE_METRIC),
+            net_income=self._extract_metric(earnings_section, _NET_INCOME_METRIC),
+            earnings_per_share=self._extract_metric(earnings_section, _EPS_METRIC),
             guidance=self._extract_guidance(earnings_section),
         )
 
     # Helper methods
 
-    def _parse_header(self) -> Dict[str, Any]:
-        """Parse header information from the filing."""
-        cik_match = re.search(r"CENTRAL INDEX KEY:\s*(\d+)", self.raw_content)
-        company_match = re.search(
-            r"COMPANY CONFORMED NAME:\s*([^\n\r]+)", self.raw_content
-        )
-        form_type_match = re.search(r"FORM TYPE:\s*([^\n\r]+)", self.raw_content)
-        filing_date_match = re.search(r"FILED AS OF DATE:\s*(\d{8})", self.raw_content)
-
-        return {
-            "cik": cik_match.group(1) if cik_match else "",
-            "company_name": company_match.group(1).strip() if company_match else "",
-            "form_type": form_type_match.group(1).strip() if form_type_match else "",
-            "ticker": "",  # Would need to extract from trading symbol
-            "filing_date": self._parse_date(
-                filing_date_match.group(1) if filing_date_match else None
-            ),
-        }
-
-    def _extract_section(self, pattern: str) -> str:
-        """Extract a section based on pattern."""
-        match = re.search(pattern, self.raw_content, re.IGNORECASE)
-        if not match:
+    def _extract_section(self, section: str) -> str:
+        """Extract a section starting at its first anchor."""
+        start_index = self._section_starts.get(section)
+        if start_index is None:
             return ""
 
-        start_index = match.start()
-        # Find next ITEM or end of document
-        next_item = re.search(r"ITEM", self.raw_content[start_index + 1 :])
-        end_index = (
-            start_index + 1 + next_item.start() if next_item else start_index + 10000
-        )
+        # Find next ITEM in place (no slice copy), else cap the section length
+        content = self.raw_content
+        next_item = _NEXT_ITEM_RE.search(content, start_index + 1)
+        if next_item:
+            end_index = next_item.start()
+        else:
+            end_index = min(start_index + self.MAX_SECTION_LENGTH, len(content))
 
-        return self.raw_content[start_index:end_index]
+        return content[start_index:end_index]
 
     def _map_item_to_event_type(self, item_number: str) -> str:
         """Map item number to event type."""
@@ -269,38 +618,78 @@ class CurrentEventParser:
 
         return item_map.get(item_number, "Other Event")
 
+    @staticmethod
+    def score_filings(raw_filings: Iterable[str]) -> List[Dict[str, int]]:
+        """
+        Count significance keywords across whole filings in one batch.
+
+        Uses a Numba-compiled byte scan when ``numba`` is installed, otherwise
+        plain ``str.count``; results are identical either way.
+
+        Args:
+            raw_filings: Raw contents of the 8-K filings to score
+
+        Returns:
+            One ``{"high": n, "medium": n}`` keyword hit count per filing
+
+        Example:
+            >>> scores = CurrentEventParser.score_filings(raw_8ks)
+            >>> ranked = sorted(zip(scores, raw_8ks), key=lambda s: -s[0]["high"])
+        """
+        keywords = _HIGH_KEYWORDS + _MEDIUM_KEYWORDS
+        num_high = len(_HIGH_KEYWORDS)
+        counter = _jit_keyword_counter()
+
+        if counter is not None:
+            encoded = [keyword.encode("utf-8") for keyword in keywords]
+            needles = np.frombuffer(b"".join(encoded), dtype=np.uint8)
+            offsets = np.cumsum([0] + [len(e) for e in encoded], dtype=np.int64)
+
+        scores: List[Dict[str, int]] = []
+        for raw in raw_filings:
+            text = raw.lower()
+            if counter is not None:
+                buf = np.frombuffer(text.encode("utf-8"), dtype=np.uint8)
+                counts = counter(buf, needles, offsets).tolist()
+            else:
+                counts = [text.count(keyword) for keyword in keywords]
+            scores.append(
+                {"high": sum(counts[:num_high]), "medium": sum(counts[num_high:])}
+            )
+
+        return scores
+
     def _assess_event_significance(self, description: str) -> str:
         """Assess the significance of an event."""
-        high_keywords = ["acquisition", "merger", "bankruptcy", "material adverse"]
-        medium_keywords = ["agreement", "executive", "earnings", "results"]
-
         text = description.lower()
 
-        if any(keyword in text for keyword in high_keywords):
+        if any(keyword in text for keyword in _HIGH_KEYWORDS):
             return "high"
-        elif any(keyword in text for keyword in medium_keywords):
+        elif any(keyword in text for keyword in _MEDIUM_KEYWORDS):
             return "medium"
 
         return "low"
 
-    def _extract_item_content(self, item_number: str) -> str:
-        """Extract content for a specific item."""
-        item_pattern = re.compile(
-            rf"ITEM\s+{re.escape(item_number)}[^]*?(?=ITEM|$)", re.IGNORECASE
-        )
-        match = item_pattern.search(self.raw_content)
-        return match.group(0) if match else ""
+    @cached_property
+    def _item_spans(self) -> List[Tuple[int, int]]:
+        """``(start, end)`` of each item body, running up to the next item heading."""
+        _, items = self._index
+        content = self.raw_content
+        document_end = len(content) - 1 if content.endswith("\n") else len(content)
 
-    def _extract_filing_date(self) -> datetime:
-        """Extract filing date from the document."""
-        date_match = re.search(r"FILED AS OF DATE:\s*(\d{8})", self.raw_content)
-        return self._parse_date(date_match.group(1) if date_match else None)
+        starts = [start for _, _, start in items]
+        return list(zip(starts, starts[1:] + [document_end]))
 
     def _parse_date(self, date_str: Optional[str]) -> datetime:
         """Parse date from YYYYMMDD format."""
         if not date_str:
             return datetime.now()
 
+        if len(date_str) == 8 and date_str.isdigit():
+            # One int() and integer arithmetic instead of three slices and int()s
+            value = int(date_str)
+            return datetime(value // 10000, value // 100 % 100, value % 100)
+
         year = int(date_str[0:4])
         month = int(date_str[4:6])
         day = int(date_str[6:8])
@@ -309,16 +698,14 @@ class CurrentEventParser:
 
     def _extract_agreement_value(self, text: str) -> Optional[float]:
         """Extract monetary value from text."""
-        value_pattern = re.compile(
-            r"\$([0-9,]+(?:\.[0-9]+)?)\s*(?:million|billion)?", re.IGNORECASE
-        )
-        match = value_pattern.search(text)
+        match = _VALUE_RE.search(text)
 
         if match:
-            value = float(match.group(1).replace(",", ""))
-            if "million" in text.lower():
+            value = _to_number(match.group(1))
+            text_lower = text.lower()
+            if "million" in text_lower:
                 value *= 1_000_000
-            elif "billion" in text.lower():
+            elif "billion" in text_lower:
                 value *= 1_000_000_000
             return value
 
@@ -326,54 +713,28 @@ class CurrentEventParser:
 
     def _extract_position(self, text: str, name: str) -> str:
         """Extract position/title for a person."""
-        position_pattern = re.compile(
-            rf"{name}.*?(CEO|CFO|President|Director|Officer|Vice President)",
-            re.IGNORECASE,
-        )
-        match = position_pattern.search(text)
+        match = _position_re(name).search(text)
         return match.group(1) if match else "Executive"
 
     def _extract_target_name(self, text: str) -> str:
         """Extract target company name from acquisition text."""
-        target_pattern = re.compile(
-            r"(?:acquire|purchase|merger with)\s+([A-Z][^,.]{10,50})", re.IGNORECASE
-        )
-        match = target_pattern.search(text)
+        match = _TARGET_RE.search(text)
         return match.group(1).strip() if match else "Target Company"
 
     def _extract_transaction_value(self, text: str) -> Optional[float]:
         """Extract transaction value."""
         return self._extract_agreement_value(text)
 
-    def _extract_reporting_period(self) -> str:
-        """Extract reporting period."""
-        period_match = re.search(
-            r"CONFORMED PERIOD OF REPORT:\s*(\d{8})", self.raw_content
-        )
-        if period_match:
-            date = self._parse_date(period_match.group(1))
-            quarter = (date.month - 1) // 3 + 1
-            return f"Q{quarter} {date.year}"
-        return "Current Period"
-
     def _extract_metric(self, text: str, pattern: str) -> Optional[float]:
         """Extract a financial metric from text."""
-        metric_pattern = re.compile(
-            rf"{pattern}.*?\$([0-9,]+(?:\.[0-9]+)?)", re.IGNORECASE
-        )
-        match = metric_pattern.search(text)
-        return float(match.group(1).replace(",", "")) if match else None
+        match = _metric_re(pattern).search(text)
+        return _to_number(match.group(1)) if match else None
 
     def _extract_guidance(self, text: str) -> List[Dict[str, str]]:
         """Extract guidance information."""
         guidance: List[Dict[str, str]] = []
 
-        guidance_pattern = re.compile(
-            r"(?:guidance|expects?).*?([a-zA-Z\s]+).*?(\$[0-9,]+|\d+%)",
-            re.IGNORECASE,
-        )
-
-        for match in guidance_pattern.finditer(text):
+        for match in _GUIDANCE_RE.finditer(text):
             guidance.append(
                 {
                     "metric": match.group(1).strip(),
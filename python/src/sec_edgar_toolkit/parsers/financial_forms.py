@@ -2,10 +2,26 @@
 
 from __future__ import annotations
 
+import io
 import logging
+import os
 import re
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Any, Dict, List, Optional, Union
+from functools import cached_property, lru_cache
+from operator import itemgetter
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Pattern,
+    Tuple,
+    TypeVar,
+    Union,
+)
 
 from ..types.financial_forms import (
     BalanceSheet,
@@ -22,20 +38,303 @@ from ..types.financial_forms import (
     XBRLFact,
 )
 
+try:
+    import ahocorasick
+
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    ahocorasick = None
+    AHOCORASICK_AVAILABLE = False
+
+try:
+    from lxml import etree
+
+    LXML_AVAILABLE = True
+except ImportError:
+    etree = None
+    LXML_AVAILABLE = False
+
+try:
+    import re2
+
+    RE2_AVAILABLE = True
+except ImportError:
+    re2 = None
+    RE2_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
+# RE2 memory budget; the default is too small for the bounded repetitions of
+# the statement patterns and makes RE2 fall back to its slower NFA.
+RE2_MAX_MEM = 64 << 20
+
+_ItemT = TypeVar("_ItemT", BalanceSheetItem, IncomeStatementItem, CashFlowItem)
+
+# Setting this environment variable to "1" makes ``parse_all`` compute the
+# independent sections on a thread pool. It is off by default: the stdlib
+# ``re`` engine holds the GIL while matching, so threads only overlap the
+# parts that release it (RE2 scans and lxml parsing).
+PARALLEL_ENV_VAR = "SEC_PARSE_PARALLEL"
+
+# Cached properties ``parse_all`` can compute concurrently; none of them
+# depends on another, only on the shared lowercased content.
+_PARALLEL_SECTIONS = (
+    "balance_sheet",
+    "income_statement",
+    "cash_flow_statement",
+    "business_segments",
+    "risk_factors",
+    "management_discussion",
+    "xbrl_facts",
+)
+
+# Patterns below are lowercase and run without re.IGNORECASE against the
+# lowercased filing (``FinancialFormParser._lower_content``); captured text is
+# read back from the original content at the same offsets.
+
+# Every line item is a label pattern followed by a dollar amount on the same
+# line. Wildcards are bounded so a miss costs a short scan instead of a walk to
+# the end of the line (inline XBRL filings have lines of over a megabyte).
+_LABEL_GAP = r"[^\n$]{0,120}"
+_AMOUNT_SUFFIX = r"[^\n$]{0,200}?\$\d[\d,]*"
+
+
+def _bounded(pattern: str) -> str:
+    """Replace the ``.*`` wildcards of a label pattern with a bounded gap."""
+    return pattern.replace(".*", _LABEL_GAP)
+
+
+def _compile_linear(pattern: str) -> Pattern[str]:
+    """
+    Compile a pattern that is scanned over whole filings or large sections.
+
+    Uses RE2 when ``google-re2`` is installed, which matches in linear time
+    and outside the interpreter loop. The pattern must not use lookarounds or
+    backreferences. Falls back to the standard ``re`` module otherwise.
+    """
+    if RE2_AVAILABLE:
+        options = re2.Options()
+        options.max_mem = RE2_MAX_MEM
+        return re2.compile(pattern, options)
+    return re.compile(pattern)
+
+
+_LINE_ITEMS: Dict[str, Dict[str, str]] = {
+    "balance_sheet": {
+        "current_assets": r"current.*assets",
+        "non_current_assets": r"non.?current.*assets|property.*plant.*equipment",
+        "total_assets": r"total.*assets",
+        "current_liabilities": r"current.*liabilities",
+        "non_current_liabilities": r"non.?current.*liabilities|long.?term.*debt",
+        "total_liabilities": r"total.*liabilities",
+        "total_equity": r"total.*equity|shareholders.*equity",
+        "retained_earnings": r"retained.*earnings",
+    },
+    "income_statement": {
+        "revenue": r"revenue|net.*sales|total.*revenue",
+        "gross_profit": r"gross.*profit|gross.*margin",
+        "operating_income": r"operating.*income|income.*from.*operations",
+        "net_income": r"net.*income|net.*earnings",
+        "earnings_per_share": r"earnings.*per.*share|basic.*earnings.*per.*share",
+        "operating_expenses": (
+            r"operating.*expenses|research.*development|sales.*marketing"
+        ),
+    },
+    "cash_flow": {
+        "operating_activities": r"operating.*activities|cash.*from.*operations",
+        "investing_activities": r"investing.*activities|cash.*from.*investing",
+        "financing_activities": r"financing.*activities|cash.*from.*financing",
+        "net_cash_flow": r"net.*cash.*flow|net.*increase.*decrease.*cash",
+    },
+}
+
+# One alternation per statement, scanned once; ``match.lastgroup`` names the
+# line item that matched.
+_STATEMENT_PATTERNS: Dict[str, Pattern[str]] = {
+    statement: _compile_linear(
+        "(?:"
+        + "|".join(f"(?P<{name}>{_bounded(label)})" for name, label in items.items())
+        + ")"
+        + _AMOUNT_SUFFIX
+    )
+    for statement, items in _LINE_ITEMS.items()
+}
+
+
+def _anchor_re(pattern: str) -> Pattern[str]:
+    """Compile a section anchor that needs wildcards."""
+    return re.compile(_bounded(pattern))
+
+
+# Section anchors. Plain strings are located with ``str.find``; the section
+# starts at the earliest anchor found.
+_SECTION_ANCHORS: Dict[str, Tuple[Union[str, Pattern[str]], ...]] = {
+    "balance_sheet": ("balance sheet", "consolidated balance sheet"),
+    "income_statement": (
+        "income statement",
+        _anchor_re("consolidated statement.*operations"),
+        _anchor_re("statement.*earnings"),
+    ),
+    "cash_flow": ("cash flow", _anchor_re("consolidated statement.*cash.*flow")),
+    "segments": (
+        "segment",
+        _anchor_re("business.*segment"),
+        _anchor_re("geographic.*information"),
+    ),
+    "risk_factors": ("risk factors", "item 1a"),
+    "management_discussion": (
+        _anchor_re("management.*discussion"),
+        "item 2",
+        "md&a",
+    ),
+}
+
+# Header fields: literal anchor (located with ``str.find``) and the value
+# pattern matched right after it
+_HEADER_FIELDS: Tuple[Tuple[str, str, Pattern[str]], ...] = (
+    ("cik", "CENTRAL INDEX KEY:", re.compile(r"\s*(\d+)")),
+    ("company_name", "COMPANY CONFORMED NAME:", re.compile(r"\s*([^\n\r]+)")),
+    ("form_type", "FORM TYPE:", re.compile(r"\s*([^\n\r]+)")),
+    ("filing_date", "FILED AS OF DATE:", re.compile(r"\s*(\d{8})")),
+    ("period", "CONFORMED PERIOD OF REPORT:", re.compile(r"\s*(\d{8})")),
+)
+
+_YEAR_RE = re.compile(r"(\d{4})")
+
+_SEGMENT_RE = re.compile(
+    r"(\w+(?:\s+\w+){0,4})\s+segment[^\n]{0,200}?revenue[^\n]{0,200}?\$?(\d[\d,]*)"
+)
+# Subsection boundaries; sections are sliced at each match start. The risk
+# boundary stays a lookahead so that every position counts (``"12."`` starts
+# a new piece at both digits), exactly like the ``re.split`` it replaced.
+_RISK_BOUNDARY_RE = re.compile(r"(?=•|·|\d+\.|\n\n)")
+_MDA_BOUNDARY_RE = re.compile(
+    r"overview|results of operations|financial condition|liquidity"
+)
+# Only the first risk factors are reported
+_MAX_RISK_FACTORS = 10
+
+_item_value = itemgetter("value")
+_METRIC_CHANGE_RE = re.compile(
+    r"(\w+(?:\s+\w+){0,4})\s+(?:increased|decreased|changed)\s+by\s+([\d.]+%)",
+    re.IGNORECASE,
+)
+
+# Inline XBRL facts, used when lxml is not installed: the opening tag (whose
+# attributes may come in any order) and the text up to the next tag
+_XBRL_TAG_RE = _compile_linear(r"<ix:nonfraction\b([^>]*)>([^<]*)")
+_XML_ATTRIBUTE_RE = re.compile(r'([\w:.-]+)\s*=\s*"([^"]*)"')
+
+# Values displayed as a dash (ixt:fixed-zero)
+_XBRL_ZERO_VALUES = frozenset(("", "-", "\u2013", "\u2014"))
+
+# Risk factor keywords, in priority order
+_RISK_SEVERITY_KEYWORDS: Tuple[Tuple[str, Tuple[str, ...]], ...] = (
+    (
+        "high",
+        (
+            "material adverse",
+            "significant risk",
+            "substantial risk",
+            "could result in",
+        ),
+    ),
+    ("medium", ("may affect", "potential impact", "could impact")),
+)
+_RISK_CATEGORY_KEYWORDS: Tuple[Tuple[str, Tuple[str, ...]], ...] = (
+    ("Market Risk", ("market", "competition", "customer")),
+    ("Regulatory Risk", ("regulation", "compliance", "legal")),
+    ("Technology Risk", ("technology", "cyber", "security")),
+    ("Financial Risk", ("financial", "credit", "liquidity")),
+    ("Operational Risk", ("operational", "supply chain", "manufacturing")),
+)
+
+
+def _build_risk_automaton() -> Any:
+    """Build one automaton tagging risk severity and category keywords."""
+    entries: Dict[str, List[Tuple[int, int]]] = {}
+    for kind, groups in enumerate((_RISK_SEVERITY_KEYWORDS, _RISK_CATEGORY_KEYWORDS)):
+        for rank, (_, keywords) in enumerate(groups):
+            for keyword in keywords:
+                entries.setdefault(keyword, []).append((kind, rank))
+
+    automaton = ahocorasick.Automaton()
+    for word, value in entries.items():
+        automaton.add_word(word, value)
+    automaton.make_automaton()
+    return automaton
+
+
+_RISK_AUTOMATON = _build_risk_automaton() if AHOCORASICK_AVAILABLE else None
+
+
+def _first(items: List[_ItemT]) -> Optional[_ItemT]:
+    """Return the first item of a list, or None if it is empty."""
+    return items[0] if items else None
+
+
+@lru_cache(maxsize=16)
+def _parse_decimals(decimals: str) -> int:
+    """
+    Parse an XBRL ``decimals`` attribute.
+
+    Negative values (``"-6"`` for millions) are kept; ``"INF"`` and other
+    non-integers give 0. A filing only uses a handful of distinct values.
+    """
+    try:
+        return int(decimals)
+    except ValueError:
+        return 0
+
+
+def _split_before(
+    pattern: Pattern[str], text: str, search_text: Optional[str] = None
+) -> Iterator[str]:
+    """
+    Lazily split ``text`` before every match of ``pattern``.
+
+    Args:
+        pattern: Boundary pattern
+        text: Text to slice
+        search_text: Text to search instead of ``text``, with the same offsets
+            (e.g. its lowercased copy)
+
+    Yields:
+        Consecutive pieces of ``text``, the first one possibly empty
+    """
+    start = 0
+    for match in pattern.finditer(text if search_text is None else search_text):
+        end = match.start()
+        if end > start:
+            yield text[start:end]
+            start = end
+    yield text[start:]
+
 
 class FinancialFormParser:
     """Parser for SEC financial forms (10-K, 10-Q)."""
 
-    def __init__(self, raw_content: str) -> None:
+    def __init__(self, raw_content: Union[str, bytes]) -> None:
         """
         Initialize the financial form parser.
 
         Args:
-            raw_content: Raw content of the financial form
+            raw_content: Raw content of the financial form, as text or as the
+                undecoded bytes returned by ``HttpClient.get_raw``
         """
-        self.raw_content = raw_content
+        # UTF-8 bytes of the filing, kept from bytes input so lxml can parse
+        # them without encoding the text again
+        self._utf8_content: Optional[bytes] = None
+        if isinstance(raw_content, bytes):
+            try:
+                text = raw_content.decode("utf-8")
+                self._utf8_content = raw_content
+            except UnicodeDecodeError:
+                text = raw_content.decode("utf-8", errors="ignore")
+            raw_content = text
+
+        self.raw_content: str = raw_content
+        self._section_cache: Dict[str, Tuple[str, str]] = {}
 
     def get_financial_statements(
         self,
@@ -47,116 +346,70 @@ class FinancialFormParser:
             Dictionary containing balance sheet, income statement, and cash flow statement
         """
         return {
-            "balance_sheet": self.parse_balance_sheet(),
-            "income_statement": self.parse_income_statement(),
-            "cash_flow_statement": self.parse_cash_flow_statement(),
+            "balance_sheet": self.balance_sheet,
+            "income_statement": self.income_statement,
+            "cash_flow_statement": self.cash_flow_statement,
         }
 
-    def parse_balance_sheet(self) -> BalanceSheet:
+    @cached_property
+    def balance_sheet(self) -> BalanceSheet:
         """Parse balance sheet data."""
-        balance_sheet_section = self._extract_section(
-            r"BALANCE SHEET|CONSOLIDATED BALANCE SHEET"
-        )
+        items = self._extract_statement_items("balance_sheet", BalanceSheetItem)
 
         return BalanceSheet(
             assets={
-                "current_assets": self._extract_balance_sheet_items(
-                    balance_sheet_section, r"current.*assets"
-                ),
-                "non_current_assets": self._extract_balance_sheet_items(
-                    balance_sheet_section,
-                    r"non.?current.*assets|property.*plant.*equipment",
-                ),
-                "total_assets": self._extract_balance_sheet_item(
-                    balance_sheet_section, r"total.*assets"
-                ),
+                "current_assets": items["current_assets"],
+                "non_current_assets": items["non_current_assets"],
+                "total_assets": _first(items["total_assets"]),
             },
             liabilities={
-                "current_liabilities": self._extract_balance_sheet_items(
-                    balance_sheet_section, r"current.*liabilities"
-                ),
-                "non_current_liabilities": self._extract_balance_sheet_items(
-                    balance_sheet_section, r"non.?current.*liabilities|long.?term.*debt"
-                ),
-                "total_liabilities": self._extract_balance_sheet_item(
-                    balance_sheet_section, r"total.*liabilities"
-                ),
+                "current_liabilities": items["current_liabilities"],
+                "non_current_liabilities": items["non_current_liabilities"],
+                "total_liabilities": _first(items["total_liabilities"]),
             },
             equity={
-                "total_equity": self._extract_balance_sheet_item(
-                    balance_sheet_section, r"total.*equity|shareholders.*equity"
-                ),
-                "retained_earnings": self._extract_balance_sheet_item(
-                    balance_sheet_section, r"retained.*earnings"
-                ),
+                "total_equity": _first(items["total_equity"]),
+                "retained_earnings": _first(items["retained_earnings"]),
             },
         )
 
-    def parse_income_statement(self) -> IncomeStatement:
+    @cached_property
+    def income_statement(self) -> IncomeStatement:
         """Parse income statement data."""
-        income_section = self._extract_section(
-            r"INCOME STATEMENT|CONSOLIDATED STATEMENT.*OPERATIONS|STATEMENT.*EARNINGS"
-        )
+        items = self._extract_statement_items("income_statement", IncomeStatementItem)
 
         return IncomeStatement(
-            revenue=self._extract_income_statement_item(
-                income_section, r"revenue|net.*sales|total.*revenue"
-            ),
-            gross_profit=self._extract_income_statement_item(
-                income_section, r"gross.*profit|gross.*margin"
-            ),
-            operating_income=self._extract_income_statement_item(
-                income_section, r"operating.*income|income.*from.*operations"
-            ),
-            net_income=self._extract_income_statement_item(
-                income_section, r"net.*income|net.*earnings"
-            ),
-            earnings_per_share=self._extract_income_statement_item(
-                income_section, r"earnings.*per.*share|basic.*earnings.*per.*share"
-            ),
-            operating_expenses=self._extract_income_statement_items(
-                income_section,
-                r"operating.*expenses|research.*development|sales.*marketing",
-            ),
+            revenue=_first(items["revenue"]),
+            gross_profit=_first(items["gross_profit"]),
+            operating_income=_first(items["operating_income"]),
+            net_income=_first(items["net_income"]),
+            earnings_per_share=_first(items["earnings_per_share"]),
+            operating_expenses=items["operating_expenses"],
         )
 
-    def parse_cash_flow_statement(self) -> CashFlowStatement:
+    @cached_property
+    def cash_flow_statement(self) -> CashFlowStatement:
         """Parse cash flow statement data."""
-        cash_flow_section = self._extract_section(
-            r"CASH FLOW|CONSOLIDATED STATEMENT.*CASH.*FLOW"
-        )
+        items = self._extract_statement_items("cash_flow", CashFlowItem)
 
         return CashFlowStatement(
-            operating_activities=self._extract_cash_flow_items(
-                cash_flow_section, r"operating.*activities|cash.*from.*operations"
-            ),
-            investing_activities=self._extract_cash_flow_items(
-                cash_flow_section, r"investing.*activities|cash.*from.*investing"
-            ),
-            financing_activities=self._extract_cash_flow_items(
-                cash_flow_section, r"financing.*activities|cash.*from.*financing"
-            ),
-            net_cash_flow=self._extract_cash_flow_item(
-                cash_flow_section, r"net.*cash.*flow|net.*increase.*decrease.*cash"
-            ),
+            operating_activities=items["operating_activities"],
+            investing_activities=items["investing_activities"],
+            financing_activities=items["financing_activities"],
+            net_cash_flow=_first(items["net_cash_flow"]),
         )
 
-    def get_business_segments(self) -> List[BusinessSegment]:
+    @cached_property
+    def business_segments(self) -> List[BusinessSegment]:
         """Extract business segments information."""
-        segment_section = self._extract_section(
-            r"SEGMENT|BUSINESS.*SEGMENT|GEOGRAPHIC.*INFORMATION"
-        )
+        segment_section, lower_section = self._section("segments")
         segments: List[BusinessSegment] = []
 
         # Extract segment data using pattern matching
-        segment_pattern = re.compile(
-            r"(\w+(?:\s+\w+)*)\s+segment.*?revenue.*?\$?([\d,]+)", re.IGNORECASE
-        )
-
-        for match in segment_pattern.finditer(segment_section):
+        for match in _SEGMENT_RE.finditer(lower_section):
             segments.append(
                 BusinessSegment(
-                    name=match.group(1).strip(),
+                    name=segment_section[match.start(1) : match.end(1)].strip(),
                     revenue=self._parse_number(match.group(2)),
                     operating_income=0.0,  # Would need more sophisticated parsing
                     assets=0.0,  # Would need more sophisticated parsing
@@ -166,43 +419,39 @@ class FinancialFormParser:
 
         return segments
 
-    def get_risk_factors(self) -> List[RiskFactor]:
+    @cached_property
+    def risk_factors(self) -> List[RiskFactor]:
         """Extract risk factors."""
-        risk_section = self._extract_section(r"RISK FACTORS|ITEM 1A")
+        risk_section = self._extract_section("risk_factors")
         risk_factors: List[RiskFactor] = []
 
-        # Split by common risk factor patterns
-        factors = [
-            factor.strip()
-            for factor in re.split(r"(?=•|·|\d+\.|\n\n)", risk_section)
-            if len(factor.strip()) > 50
-        ]
+        # Split by common risk factor patterns, stopping at the limit
+        for piece in _split_before(_RISK_BOUNDARY_RE, risk_section):
+            factor = piece.strip()
+            if len(factor) <= 50:
+                continue
 
-        for factor in factors:
-            severity = self._assess_risk_severity(factor)
+            severity, category = self._classify_risk(factor)
             risk_factors.append(
                 RiskFactor(
-                    category=self._extract_risk_category(factor),
+                    category=category,
                     description=factor[:500],
                     severity=severity,
                 )
             )
+            if len(risk_factors) == _MAX_RISK_FACTORS:
+                break
 
-        return risk_factors[:10]  # Limit to top 10 risk factors
+        return risk_factors
 
-    def get_management_discussion(self) -> List[MDSection]:
+    @cached_property
+    def management_discussion(self) -> List[MDSection]:
         """Extract Management Discussion & Analysis sections."""
-        mda_section = self._extract_section(r"MANAGEMENT.*DISCUSSION|ITEM 2|MD&A")
+        mda_section, mda_lower = self._section("management_discussion")
         sections: List[MDSection] = []
 
         # Split into subsections
-        subsections = re.split(
-            r"(?=OVERVIEW|RESULTS OF OPERATIONS|FINANCIAL CONDITION|LIQUIDITY)",
-            mda_section,
-            flags=re.IGNORECASE,
-        )
-
-        for section in subsections:
+        for section in _split_before(_MDA_BOUNDARY_RE, mda_section, mda_lower):
             if len(section.strip()) > 100:
                 title = self._extract_section_title(section)
                 sections.append(
@@ -215,47 +464,160 @@ class FinancialFormParser:
 
         return sections
 
-    def get_xbrl_facts(self) -> List[XBRLFact]:
-        """Extract XBRL facts (simplified version)."""
+    @cached_property
+    def xbrl_facts(self) -> List[XBRLFact]:
+        """
+        Extract numeric inline XBRL facts (``ix:nonFraction``).
+
+        The filing is streamed through ``lxml.etree.iterparse`` so attribute
+        order and nested markup do not matter; a regex scan is used when lxml
+        is not available. Facts whose displayed value is not a number (e.g.
+        spelled-out numbers) are skipped.
+        """
         xbrl_facts: List[XBRLFact] = []
 
-        # Extract XBRL data if present
-        xbrl_pattern = re.compile(
-            r'<ix:nonFraction[^>]*name="([^"]*)"[^>]*contextRef="([^"]*)"[^>]*decimals="([^"]*)"[^>]*unitRef="([^"]*)"[^>]*>([^<]*)',
-            re.IGNORECASE,
+        if "<ix:nonfraction" not in self._lower_content:
+            return xbrl_facts
+
+        raw_facts = (
+            self._iter_xbrl_facts() if LXML_AVAILABLE else self._scan_xbrl_facts()
         )
+        # Facts share a few dozen contexts; resolve each context's period once
+        periods: Dict[str, str] = {}
+        for name, context_ref, decimals, units, text in raw_facts:
+            text = text.strip()
+            try:
+                value = 0.0 if text in _XBRL_ZERO_VALUES else self._parse_number(text)
+            except ValueError:
+                logger.debug(f"Skipping XBRL fact {name} with value {text!r}")
+                continue
+
+            period = periods.get(context_ref)
+            if period is None:
+                period = periods[context_ref] = self._extract_period_from_context(
+                    context_ref
+                )
 
-        for match in xbrl_pattern.finditer(self.raw_content):
             xbrl_facts.append(
                 XBRLFact(
-                    name=match.group(1),
-                    value=self._parse_number(match.group(5)),
-                    units=match.group(4),
-                    context_ref=match.group(2),
-                    decimals=int(match.group(3)) if match.group(3).isdigit() else 0,
-                    period=self._extract_period_from_context(match.group(2)),
+                    name=name,
+                    value=value,
+                    units=units,
+                    context_ref=context_ref,
+                    decimals=_parse_decimals(decimals),
+                    period=period,
                 )
             )
 
         return xbrl_facts
 
-    def get_financial_metrics(self) -> FinancialMetrics:
-        """Calculate financial metrics."""
-        balance_sheet = self.parse_balance_sheet()
-        income_statement = self.parse_income_statement()
+    def _iter_xbrl_facts(self) -> Iterator[Tuple[str, str, str, str, str]]:
+        """
+        Stream ``ix:nonFraction`` elements with lxml.
 
-        return FinancialMetrics(
-            market_cap=None,  # Would need stock price data
-            pe_ratio=None,  # Would need stock price data
-            debt_to_equity=self._calculate_debt_to_equity(balance_sheet),
-            return_on_equity=self._calculate_roe(income_statement, balance_sheet),
-            current_ratio=self._calculate_current_ratio(balance_sheet),
-            quick_ratio=self._calculate_quick_ratio(balance_sheet),
+        Yields:
+            Tuples of name, context reference, decimals, unit and text
+        """
+        # A filing holds several top-level SGML blocks; give them one root
+        content = self._utf8_content or self.raw_content.encode("utf-8")
+        data = b"<filing>" + content + b"</filing>"
+        events = etree.iterparse(
+            io.BytesIO(data),
+            events=("start", "end"),
+            tag=("{*}nonFraction", "{*}nonNumeric"),
+            huge_tree=True,
+            recover=True,
+        )
+        # Facts can nest; an enclosing fact still needs the text of the
+        # facts inside it, so markup is only dropped at the outermost level
+        depth = 0
+        try:
+            for event, element in events:
+                if event == "start":
+                    depth += 1
+                    continue
+                depth -= 1
+                if element.tag.endswith("}nonFraction"):
+                    yield (
+                        element.get("name", ""),
+                        element.get("contextRef", ""),
+                        element.get("decimals", ""),
+                        element.get("unitRef", ""),
+                        "".join(element.itertext()),
+                    )
+                if depth == 0:
+                    # Drop parsed markup so memory stays bounded on large filings
+                    element.clear(keep_tail=True)
+                    while element.getprevious() is not None:
+                        del element.getparent()[0]
+        except etree.XMLSyntaxError as e:
+            logger.warning(f"Stopped reading inline XBRL facts: {str(e)}")
+
+    def _scan_xbrl_facts(self) -> Iterator[Tuple[str, str, str, str, str]]:
+        """
+        Scan ``ix:nonFraction`` tags with a regex (fallback without lxml).
+
+        Yields:
+            Tuples of name, context reference, decimals, unit and text
+        """
+        content = self.raw_content
+        for match in _XBRL_TAG_RE.finditer(self._lower_content):
+            attributes = dict(
+                _XML_ATTRIBUTE_RE.findall(content, match.start(1), match.end(1))
+            )
+            yield (
+                attributes.get("name", ""),
+                attributes.get("contextRef", ""),
+                attributes.get("decimals", ""),
+                attributes.get("unitRef", ""),
+                content[match.start(2) : match.end(2)],
+            )
+
+    @cached_property
+    def financial_metrics(self) -> FinancialMetrics:
+        """Financial metrics calculated from the cached statements."""
+        return self._calculate_metrics(self.balance_sheet, self.income_statement)
+
+    def get_financial_metrics(
+        self,
+        balance_sheet: Optional[BalanceSheet] = None,
+        income_statement: Optional[IncomeStatement] = None,
+    ) -> FinancialMetrics:
+        """
+        Calculate financial metrics.
+
+        Args:
+            balance_sheet: Already parsed balance sheet (default: this filing's)
+            income_statement: Already parsed income statement (default: this
+                filing's)
+
+        Returns:
+            Financial metrics; the cached ``financial_metrics`` when no
+            statement is given
+        """
+        if balance_sheet is None and income_statement is None:
+            return self.financial_metrics
+
+        return self._calculate_metrics(
+            balance_sheet if balance_sheet is not None else self.balance_sheet,
+            income_statement if income_statement is not None else self.income_statement,
         )
 
     def parse_all(self) -> ParsedFinancialForm:
-        """Parse complete financial form."""
-        header = self._parse_header()
+        """
+        Parse complete financial form.
+
+        Each part is computed lazily and cached on the parser, so calling
+        ``parse_all`` after (or alongside) the individual accessors does not
+        scan the filing again. Cached results should not be mutated.
+
+        With ``SEC_PARSE_PARALLEL=1`` set in the environment the independent
+        sections are computed on a thread pool first.
+        """
+        if os.environ.get(PARALLEL_ENV_VAR) == "1":
+            self._compute_sections_parallel()
+
+        header = self.header
         financial_statements = self.get_financial_statements()
 
         return ParsedFinancialForm(
@@ -268,147 +630,201 @@ class FinancialFormParser:
             balance_sheet=financial_statements["balance_sheet"],
             income_statement=financial_statements["income_statement"],
             cash_flow_statement=financial_statements["cash_flow_statement"],
-            business_segments=self.get_business_segments(),
-            risk_factors=self.get_risk_factors(),
-            management_discussion=self.get_management_discussion(),
-            xbrl_facts=self.get_xbrl_facts(),
-            financial_metrics=self.get_financial_metrics(),
+            business_segments=self.business_segments,
+            risk_factors=self.risk_factors,
+            management_discussion=self.management_discussion,
+            xbrl_facts=self.xbrl_facts,
+            financial_metrics=self.financial_metrics,
         )
 
+    def parse_balance_sheet(self) -> BalanceSheet:
+        """Return the cached ``balance_sheet`` (backwards-compatible alias)."""
+        return self.balance_sheet
+
+    def parse_income_statement(self) -> IncomeStatement:
+        """Return the cached ``income_statement`` (backwards-compatible alias)."""
+        return self.income_statement
+
+    def parse_cash_flow_statement(self) -> CashFlowStatement:
+        """Return the cached ``cash_flow_statement`` (backwards-compatible alias)."""
+        return self.cash_flow_statement
+
+    def get_business_segments(self) -> List[BusinessSegment]:
+        """Return the cached ``business_segments`` (backwards-compatible alias)."""
+        return self.business_segments
+
+    def get_risk_factors(self) -> List[RiskFactor]:
+        """Return the cached ``risk_factors`` (backwards-compatible alias)."""
+        return self.risk_factors
+
+    def get_management_discussion(self) -> List[MDSection]:
+        """Return the cached ``management_discussion`` (backwards-compatible alias)."""
+        return self.management_discussion
+
+    def get_xbrl_facts(self) -> List[XBRLFact]:
+        """Return the cached ``xbrl_facts`` (backwards-compatible alias)."""
+        return self.xbrl_facts
+
     # Helper methods
 
-    def _extract_section(self, pattern: str) -> str:
-        """Extract a section from the document using regex pattern."""
-        match = re.search(pattern, self.raw_content, re.IGNORECASE)
-        if not match:
-            return ""
-
-        start_index = match.start()
-        end_index = self.raw_content.find("</DOCUMENT>", start_index)
-
-        if end_index == -1:
-            end_index = start_index + 50000
-
-        return self.raw_content[start_index:end_index]
-
-    def _extract_balance_sheet_items(
-        self, section: str, pattern: str
-    ) -> List[BalanceSheetItem]:
-        """Extract balance sheet items matching the pattern."""
-        items: List[BalanceSheetItem] = []
-        regex = re.compile(pattern + r".*?\$([\\d,]+)", re.IGNORECASE)
-
-        for match in regex.finditer(section):
-            label = match.group(0).split("$")[0].strip()
-            items.append(
-                BalanceSheetItem(
-                    label=label,
-                    value=self._parse_number(match.group(1)),
-                    units="USD",
-                    period=self._extract_period(section),
-                    filed=self._extract_filing_date(),
-                )
+    def _compute_sections_parallel(self) -> None:
+        """Fill the section caches of ``parse_all`` on a thread pool."""
+        # Build the shared lowercase view once before the workers need it
+        _ = self._lower_content
+        with ThreadPoolExecutor(max_workers=len(_PARALLEL_SECTIONS)) as pool:
+            futures = [pool.submit(getattr, self, name) for name in _PARALLEL_SECTIONS]
+            for future in futures:
+                future.result()
+
+    @cached_property
+    def _lower_content(self) -> str:
+        """Lowercased content whose offsets match ``raw_content``."""
+        lower = self.raw_content.lower()
+        if len(lower) != len(self.raw_content):
+            # U+0130 is the only character that grows when lowercased
+            lower = self.raw_content.replace("\u0130", "i").lower()
+        return lower
+
+    def _find_section_start(self, name: str) -> int:
+        """Return the offset of the earliest anchor of a section, or -1."""
+        start = -1
+        for anchor in _SECTION_ANCHORS[name]:
+            if isinstance(anchor, str):
+                index = self._lower_content.find(anchor)
+            else:
+                match = anchor.search(self._lower_content)
+                index = match.start() if match else -1
+            if index != -1 and (start == -1 or index < start):
+                start = index
+        return start
+
+    def _section(self, name: str) -> Tuple[str, str]:
+        """
+        Extract a section (key of ``_SECTION_ANCHORS``) from the document.
+
+        Returns:
+            Tuple of the section text and its lowercased copy
+        """
+        section = self._section_cache.get(name)
+        if section is not None:
+            return section
+
+        start_index = self._find_section_start(name)
+        if start_index == -1:
+            section = ("", "")
+        else:
+            end_index = self.raw_content.find("</DOCUMENT>", start_index)
+
+            if end_index == -1:
+                end_index = start_index + 50000
+
+            section = (
+                self.raw_content[start_index:end_index],
+                self._lower_content[start_index:end_index],
             )
 
-        return items
+        self._section_cache[name] = section
+        return section
 
-    def _extract_balance_sheet_item(
-        self, section: str, pattern: str
-    ) -> Optional[BalanceSheetItem]:
-        """Extract a single balance sheet item."""
-        items = self._extract_balance_sheet_items(section, pattern)
-        return items[0] if items else None
-
-    def _extract_income_statement_items(
-        self, section: str, pattern: str
-    ) -> List[IncomeStatementItem]:
-        """Extract income statement items matching the pattern."""
-        items: List[IncomeStatementItem] = []
-        regex = re.compile(pattern + r".*?\$([\\d,]+)", re.IGNORECASE)
-
-        for match in regex.finditer(section):
-            label = match.group(0).split("$")[0].strip()
-            items.append(
-                IncomeStatementItem(
-                    label=label,
-                    value=self._parse_number(match.group(1)),
-                    units="USD",
-                    period=self._extract_period(section),
-                    filed=self._extract_filing_date(),
-                )
-            )
+    def _extract_section(self, name: str) -> str:
+        """Extract a section (key of ``_SECTION_ANCHORS``) from the document."""
+        return self._section(name)[0]
 
-        return items
+    def _extract_statement_items(
+        self, statement: str, factory: Callable[..., _ItemT]
+    ) -> Dict[str, List[_ItemT]]:
+        """
+        Extract the line items of a financial statement in a single pass.
+
+        Args:
+            statement: Statement name (key of ``_LINE_ITEMS``)
+            factory: Item type to build (e.g. ``BalanceSheetItem``)
 
-    def _extract_income_statement_item(
-        self, section: str, pattern: str
-    ) -> Optional[IncomeStatementItem]:
-        """Extract a single income statement item."""
-        items = self._extract_income_statement_items(section, pattern)
-        return items[0] if items else None
-
-    def _extract_cash_flow_items(
-        self, section: str, pattern: str
-    ) -> List[CashFlowItem]:
-        """Extract cash flow items matching the pattern."""
-        items: List[CashFlowItem] = []
-        regex = re.compile(pattern + r".*?\$([\\d,]+)", re.IGNORECASE)
-
-        for match in regex.finditer(section):
-            label = match.group(0).split("$")[0].strip()
-            items.append(
-                CashFlowItem(
-                    label=label,
-                    value=self._parse_number(match.group(1)),
+        Returns:
+            Dictionary mapping each line item name to its matches in
+            document order
+        """
+        section, lower_section = self._section(statement)
+        items: Dict[str, List[_ItemT]] = {name: [] for name in _LINE_ITEMS[statement]}
+
+        matches = list(_STATEMENT_PATTERNS[statement].finditer(lower_section))
+        if not matches:
+            return items
+
+        # Period and filing date are the same for every item of the section
+        period = self._extract_period(section)
+        filed = self.filing_date
+
+        for match in matches:
+            text = section[match.start() : match.end()]
+            items[match.lastgroup].append(  # type: ignore[index]
+                factory(
+                    label=text.split("$", 1)[0].strip(),
+                    value=self._parse_number(text.rpartition("$")[2]),
                     units="USD",
-                    period=self._extract_period(section),
-                    filed=self._extract_filing_date(),
+                    period=period,
+                    filed=filed,
                 )
             )
 
         return items
 
-    def _extract_cash_flow_item(
-        self, section: str, pattern: str
-    ) -> Optional[CashFlowItem]:
-        """Extract a single cash flow item."""
-        items = self._extract_cash_flow_items(section, pattern)
-        return items[0] if items else None
-
-    def _parse_header(self) -> Dict[str, Any]:
+    @cached_property
+    def _header_fields(self) -> Dict[str, str]:
+        """Raw header values, located with ``str.find`` on their anchors."""
+        fields: Dict[str, str] = {}
+        content = self.raw_content
+
+        for name, anchor, value_re in _HEADER_FIELDS:
+            index = content.find(anchor)
+            while index != -1:
+                match = value_re.match(content, index + len(anchor))
+                if match:
+                    fields[name] = match.group(1)
+                    break
+                index = content.find(anchor, index + 1)
+
+        return fields
+
+    @cached_property
+    def header(self) -> Dict[str, Any]:
         """Parse document header information."""
-        cik_match = re.search(r"CENTRAL INDEX KEY:\s*(\d+)", self.raw_content)
-        company_match = re.search(
-            r"COMPANY CONFORMED NAME:\s*([^\n\r]+)", self.raw_content
-        )
-        form_type_match = re.search(r"FORM TYPE:\s*([^\n\r]+)", self.raw_content)
-        filing_date_match = re.search(r"FILED AS OF DATE:\s*(\d{8})", self.raw_content)
-        period_match = re.search(
-            r"CONFORMED PERIOD OF REPORT:\s*(\d{8})", self.raw_content
-        )
+        fields = self._header_fields
 
         return {
-            "cik": cik_match.group(1) if cik_match else "",
-            "company_name": company_match.group(1).strip() if company_match else "",
-            "form_type": form_type_match.group(1).strip() if form_type_match else "",
+            "cik": fields.get("cik", ""),
+            "company_name": fields.get("company_name", "").strip(),
+            "form_type": fields.get("form_type", "").strip(),
             "ticker": "",  # Would need to extract from trading symbol
-            "filing_date": self._parse_date(
-                filing_date_match.group(1) if filing_date_match else None
-            ),
-            "period_end_date": self._parse_date(
-                period_match.group(1) if period_match else None
-            ),
+            "filing_date": self.filing_date,
+            "period_end_date": self._parse_date(fields.get("period")),
         }
 
     def _parse_number(self, value: str) -> float:
-        """Parse number from string, removing commas and dollar signs."""
-        return float(re.sub(r"[,$]", "", value)) if value else 0.0
+        """
+        Parse number from string, removing commas and dollar signs.
+
+        Amounts in parentheses, the accounting notation for negatives (e.g.
+        ``(1,234)``), are returned as negative numbers.
+        """
+        if not value:
+            return 0.0
+        # Chained str.replace is cheaper than re.sub or str.translate here
+        cleaned = value.replace(",", "").replace("$", "").strip()
+        if cleaned.startswith("(") and cleaned.endswith(")"):
+            return -float(cleaned[1:-1] or 0)
+        return float(cleaned) if cleaned else 0.0
 
     def _parse_date(self, date_str: Optional[str]) -> datetime:
         """Parse date from YYYYMMDD format."""
         if not date_str:
             return datetime.now()
 
+        if len(date_str) == 8 and date_str.isdigit():
+            # One int() and integer arithmetic instead of three slices and int()s
+            value = int(date_str)
+            return datetime(value // 10000, value // 100 % 100, value % 100)
+
         # Parse YYYYMMDD format
         year = int(date_str[:4])
         month = int(date_str[4:6])
@@ -418,72 +834,84 @@ class FinancialFormParser:
 
     def _extract_period(self, section: str) -> str:
         """Extract period from section."""
-        period_match = re.search(r"(\d{4})", section)
+        period_match = _YEAR_RE.search(section)
         return period_match.group(1) if period_match else str(datetime.now().year)
 
-    def _extract_filing_date(self) -> datetime:
-        """Extract filing date from document."""
-        date_match = re.search(r"FILED AS OF DATE:\s*(\d{8})", self.raw_content)
-        return self._parse_date(date_match.group(1) if date_match else None)
+    @cached_property
+    def filing_date(self) -> datetime:
+        """Filing date from the document header."""
+        return self._parse_date(self._header_fields.get("filing_date"))
+
+    def _classify_risk(self, risk_text: str) -> Tuple[str, str]:
+        """
+        Assess the severity and category of a risk factor.
+
+        With ``pyahocorasick`` installed, all keywords are found in a single
+        pass over the text instead of one substring scan per keyword.
+
+        Args:
+            risk_text: Risk factor text
+
+        Returns:
+            Tuple of severity ("high", "medium" or "low") and category
+        """
+        automaton = _RISK_AUTOMATON
+        if not AHOCORASICK_AVAILABLE or automaton is None:
+            return (
+                self._assess_risk_severity(risk_text),
+                self._extract_risk_category(risk_text),
+            )
+
+        # Best (lowest) rank found so far for severity and for category
+        best = [len(_RISK_SEVERITY_KEYWORDS), len(_RISK_CATEGORY_KEYWORDS)]
+        for _, tags in automaton.iter(risk_text.lower()):
+            for kind, rank in tags:
+                if rank < best[kind]:
+                    best[kind] = rank
+            if best == [0, 0]:
+                break
+
+        severity_rank, category_rank = best
+        return (
+            (
+                _RISK_SEVERITY_KEYWORDS[severity_rank][0]
+                if severity_rank < len(_RISK_SEVERITY_KEYWORDS)
+                else "low"
+            ),
+            (
+                _RISK_CATEGORY_KEYWORDS[category_rank][0]
+                if category_rank < len(_RISK_CATEGORY_KEYWORDS)
+                else "General Risk"
+            ),
+        )
 
     def _assess_risk_severity(self, risk_text: str) -> str:
         """Assess risk severity based on keywords."""
-        high_risk_keywords = [
-            "material adverse",
-            "significant risk",
-            "substantial risk",
-            "could result in",
-        ]
-        medium_risk_keywords = ["may affect", "potential impact", "could impact"]
-
         text = risk_text.lower()
 
-        if any(keyword in text for keyword in high_risk_keywords):
-            return "high"
-        elif any(keyword in text for keyword in medium_risk_keywords):
-            return "medium"
+        for severity, keywords in _RISK_SEVERITY_KEYWORDS:
+            if any(keyword in text for keyword in keywords):
+                return severity
 
         return "low"
 
     def _extract_risk_category(self, risk_text: str) -> str:
         """Extract risk category based on keywords."""
-        categories = [
-            {
-                "keywords": ["market", "competition", "customer"],
-                "category": "Market Risk",
-            },
-            {
-                "keywords": ["regulation", "compliance", "legal"],
-                "category": "Regulatory Risk",
-            },
-            {
-                "keywords": ["technology", "cyber", "security"],
-                "category": "Technology Risk",
-            },
-            {
-                "keywords": ["financial", "credit", "liquidity"],
-                "category": "Financial Risk",
-            },
-            {
-                "keywords": ["operational", "supply chain", "manufacturing"],
-                "category": "Operational Risk",
-            },
-        ]
-
         text = risk_text.lower()
 
-        for cat in categories:
-            if any(keyword in text for keyword in cat["keywords"]):
-                return cat["category"]
+        for category, keywords in _RISK_CATEGORY_KEYWORDS:
+            if any(keyword in text for keyword in keywords):
+                return category
 
         return "General Risk"
 
     def _extract_section_title(self, section: str) -> str:
         """Extract section title from text."""
-        lines = section.split("\n")
-        for line in lines[:5]:
-            if 10 < len(line.strip()) < 100:
-                return line.strip()
+        # maxsplit stops after the five lines inspected; the rest stays one piece
+        for line in section.split("\n", 5)[:5]:
+            line = line.strip()
+            if 10 < len(line) < 100:
+                return line
         return "Management Discussion"
 
     def _extract_key_metrics(self, section: str) -> List[Dict[str, str]]:
@@ -491,12 +919,7 @@ class FinancialFormParser:
         metrics: List[Dict[str, str]] = []
 
         # Extract percentage changes
-        change_pattern = re.compile(
-            r"(\w+(?:\s+\w+)*)\s+(?:increased|decreased|changed)\s+by\s+([\d.]+%)",
-            re.IGNORECASE,
-        )
-
-        for match in change_pattern.finditer(section):
+        for match in _METRIC_CHANGE_RE.finditer(section):
             metrics.append(
                 {
                     "metric": match.group(1).strip(),
@@ -509,9 +932,39 @@ class FinancialFormParser:
 
     def _extract_period_from_context(self, context_ref: str) -> str:
         """Extract period from context reference."""
-        period_match = re.search(r"(\d{4})", context_ref)
+        period_match = _YEAR_RE.search(context_ref)
         return period_match.group(1) if period_match else str(datetime.now().year)
 
+    def _calculate_metrics(
+        self, balance_sheet: BalanceSheet, income_statement: IncomeStatement
+    ) -> FinancialMetrics:
+        """Calculate financial metrics from parsed statements."""
+        current_assets, current_liabilities = self._current_totals(balance_sheet)
+
+        return FinancialMetrics(
+            market_cap=None,  # Would need stock price data
+            pe_ratio=None,  # Would need stock price data
+            debt_to_equity=self._calculate_debt_to_equity(balance_sheet),
+            return_on_equity=self._calculate_roe(income_statement, balance_sheet),
+            current_ratio=self._calculate_current_ratio(
+                current_assets, current_liabilities
+            ),
+            quick_ratio=self._calculate_quick_ratio(
+                current_assets, current_liabilities
+            ),
+        )
+
+    def _current_totals(self, balance_sheet: BalanceSheet) -> Tuple[float, float]:
+        """Sum the current assets and current liabilities of a balance sheet."""
+        # map() with an itemgetter avoids a generator frame per item
+        current_assets = sum(
+            map(_item_value, balance_sheet["assets"]["current_assets"])
+        )
+        current_liabilities = sum(
+            map(_item_value, balance_sheet["liabilities"]["current_liabilities"])
+        )
+        return current_assets, current_liabilities
+
     def _calculate_debt_to_equity(self, balance_sheet: BalanceSheet) -> Optional[float]:
         """Calculate debt-to-equity ratio."""
         total_liabilities = balance_sheet["liabilities"]["total_liabilities"]
@@ -546,32 +999,20 @@ class FinancialFormParser:
 
         return None
 
-    def _calculate_current_ratio(self, balance_sheet: BalanceSheet) -> Optional[float]:
+    def _calculate_current_ratio(
+        self, current_assets: float, current_liabilities: float
+    ) -> Optional[float]:
         """Calculate current ratio."""
-        current_assets = sum(
-            asset["value"] for asset in balance_sheet["assets"]["current_assets"]
-        )
-        current_liabilities = sum(
-            liability["value"]
-            for liability in balance_sheet["liabilities"]["current_liabilities"]
-        )
-
         if current_assets and current_liabilities and current_liabilities != 0:
             return current_assets / current_liabilities
 
         return None
 
-    def _calculate_quick_ratio(self, balance_sheet: BalanceSheet) -> Optional[float]:
+    def _calculate_quick_ratio(
+        self, current_assets: float, current_liabilities: float
+    ) -> Optional[float]:
         """Calculate quick ratio (simplified)."""
         # Simplified calculation - would need more sophisticated asset classification
-        current_assets = sum(
-            asset["value"] for asset in balance_sheet["assets"]["current_assets"]
-        )
-        current_liabilities = sum(
-            liability["value"]
-            for liability in balance_sheet["liabilities"]["current_liabilities"]
-        )
-
         if current_assets and current_liabilities and current_liabilities != 0:
             return (
                 current_assets * 0.8
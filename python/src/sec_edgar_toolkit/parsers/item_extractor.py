@@ -6,9 +6,63 @@ based on standard item numbering and structure.
 """
 
 import re
+from bisect import bisect_left
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Dict, List, Tuple, Union
+from functools import lru_cache, partial
+from itertools import takewhile
+from operator import gt
+from typing import (
+    AbstractSet,
+    Dict,
+    Iterator,
+    List,
+    Match,
+    Optional,
+    Pattern,
+    Set,
+    Tuple,
+    Union,
+)
+
+try:
+    import re2
+
+    RE2_AVAILABLE = True
+except ImportError:
+    re2 = None
+    RE2_AVAILABLE = False
+
+# RE2 memory budget, as for the financial statement patterns
+RE2_MAX_MEM = 64 << 20
+
+# Patterns used on every filing, compiled once at import
+_HTML_TAG_RE = re.compile(r"<[^>]+>")
+_ITEM_HEADING_RE = re.compile(r"(Item\s+\d+[A-Z]?\.)", re.IGNORECASE)
+_TOC_RE = re.compile(
+    r"TABLE\s+OF\s+CONTENTS(.*?)(?:Item\s+1\.|PART\s+I\s)",
+    re.IGNORECASE | re.DOTALL,
+)
+_TOC_ITEM_RE = re.compile(r"Item\s+(\d+[A-Z]?)\.\s*([^\n\r\.]+)", re.IGNORECASE)
+# The trailing letter is a lookahead so that ``finditer`` also reports a
+# heading that starts right after another one; only match starts are used.
+# Item numbers have at most three digits, so numbers in tables (such as
+# "Item 2024:") do not end an item and long digit runs are not backtracked
+_NEXT_ITEM_RE = re.compile(
+    r"(?<!\d)Item\s+\d{1,3}[A-Z]?[\.:]\s*(?=[A-Z])", re.IGNORECASE
+)
+# Every heading pattern starts with "Item <number>"; one scan for this prefix
+# gives all positions where any of them can match
+_ITEM_PREFIX_RE = re.compile(r"Item\s+(\d+)", re.IGNORECASE)
+_LEADING_DIGITS_RE = re.compile(r"\d+")
+# Part headings of a 10-Q, not cross references such as "Part II, Item 7"
+_PART_I_RE = re.compile(r"PART\s+I\b(?!\s*,)", re.IGNORECASE)
+_PART_II_RE = re.compile(r"PART\s+II\b(?!\s*,)", re.IGNORECASE)
+# Longest title ("Other Information") allowed between a part and its first item
+_PART_TITLE_MAX_LENGTH = 100
+_BLANK_LINES_RE = re.compile(r"\n\s*\n\s*\n")
+# Groups of an item heading pattern, from the most specific form to the loosest
+_HEADING_LEVELS = {"title": 0, "heading": 1, "loose": 2}
 
 
 class FormType(Enum):
@@ -21,6 +75,62 @@ class FormType(Enum):
     FORM_40F = "40-F"
 
 
+# Exact spellings, looked up before the substring matching of variations
+_FORM_TYPE_NAMES = {
+    name: form_type
+    for form_type in FormType
+    for name in (form_type.value, form_type.value.replace("-", ""))
+}
+
+
+def _compile_re2(pattern: Pattern[str]) -> Pattern[str]:
+    """Compile a lookaround-free ``re`` pattern with RE2, keeping its flags."""
+    options = re2.Options()
+    options.max_mem = RE2_MAX_MEM
+    options.case_sensitive = not pattern.flags & re.IGNORECASE
+    options.dot_nl = bool(pattern.flags & re.DOTALL)
+    return re2.compile(pattern.pattern, options)  # type: ignore[no-any-return]
+
+
+def _lower_offsets(content: str) -> str:
+    """
+    Lowercase text for literal searches that stand in for ``re.IGNORECASE``.
+
+    The dotted and dotless Turkish i are mapped to "i" first, since both
+    match "i" case-insensitively and lowercasing the dotted one would add a
+    combining dot and shift every later offset.
+    """
+    return content.replace("\u0130", "i").replace("\u0131", "i").lower()
+
+
+@lru_cache(maxsize=32)
+def _parse_form_type(form_type_str: str) -> FormType:
+    """
+    Parse a form type name, including variations such as ``"10-K/A"``.
+
+    Callers pass the same few names over and over, so results are cached.
+    """
+    form_type_upper = form_type_str.upper()
+
+    form_type = _FORM_TYPE_NAMES.get(form_type_upper)
+    if form_type is not None:
+        return form_type
+
+    # Handle variations
+    if "10-K" in form_type_upper or "10K" in form_type_upper:
+        return FormType.FORM_10K
+    elif "10-Q" in form_type_upper or "10Q" in form_type_upper:
+        return FormType.FORM_10Q
+    elif "8-K" in form_type_upper or "8K" in form_type_upper:
+        return FormType.FORM_8K
+    elif "20-F" in form_type_upper or "20F" in form_type_upper:
+        return FormType.FORM_20F
+    elif "40-F" in form_type_upper or "40F" in form_type_upper:
+        return FormType.FORM_40F
+    else:
+        raise ValueError(f"Unknown form type: {form_type_str}")
+
+
 @dataclass
 class ItemDefinition:
     """Definition of an SEC filing item."""
@@ -29,12 +139,63 @@ class ItemDefinition:
     title: str
     aliases: List[str] = field(default_factory=list)
     required: bool = True
+    part: Optional[str] = None
+    _patterns: Optional[List[Pattern[str]]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    @property
+    def key(self) -> str:
+        """
+        Key of the item in extraction results.
+
+        Items outside Part I are qualified with their part (e.g. ``"II.1A"``)
+        so that forms numbering items per part, like the 10-Q, do not collide.
+        """
+        if self.part in (None, "I"):
+            return self.number
+        return f"{self.part}.{self.number}"
+
+    @property
+    def patterns(self) -> List[Pattern[str]]:
+        """
+        Patterns locating the item: the heading, then one per alias.
+
+        The heading pattern starts with ``Item <number>`` and names the group
+        of the most specific form that matched (see ``_HEADING_LEVELS``). The
+        patterns are compiled on first use and kept on the definition, so the
+        class-level definitions compile them once per process.
+        """
+        if self._patterns is None:
+            number = re.escape(self.number)
+            patterns = [
+                rf"Item\s+{number}(?:"
+                rf"(?P<title>\.\s*{re.escape(self.title)})"
+                r"|(?P<heading>\.\s*(?=[A-Z]))"
+                r"|(?P<loose>[\.:\s]))"
+            ]
+            patterns.extend(re.escape(alias) for alias in self.aliases)
+            self._patterns = [
+                re.compile(pattern, re.IGNORECASE | re.MULTILINE)
+                for pattern in patterns
+            ]
+        return self._patterns
 
 
 @dataclass
 class ExtractedItem:
     """Represents an extracted item from a filing."""
 
+    # Written out rather than ``dataclass(slots=True)``, which needs 3.10;
+    # no field has a default, so the slots do not clash with class attributes
+    __slots__ = (
+        "item_number",
+        "title",
+        "content",
+        "start_position",
+        "end_position",
+    )
+
     item_number: str
     title: str
     content: str
@@ -77,25 +238,41 @@ class ItemExtractor:
 
     # 10-Q Item definitions
     FORM_10Q_ITEMS = [
-        ItemDefinition("1", "Financial Statements"),
-        ItemDefinition("2", "Management's Discussion and Analysis", aliases=["MD&A"]),
+        ItemDefinition("1", "Financial Statements", part="I"),
+        ItemDefinition(
+            "2", "Management's Discussion and Analysis", aliases=["MD&A"], part="I"
+        ),
         ItemDefinition(
-            "3", "Quantitative and Qualitative Disclosures About Market Risk"
+            "3", "Quantitative and Qualitative Disclosures About Market Risk", part="I"
         ),
-        ItemDefinition("4", "Controls and Procedures"),
-        ItemDefinition("1", "Legal Proceedings", aliases=["Part II, Item 1"]),
-        ItemDefinition("1A", "Risk Factors", aliases=["Part II, Item 1A"]),
+        ItemDefinition("4", "Controls and Procedures", part="I"),
         ItemDefinition(
-            "2", "Unregistered Sales of Equity Securities", aliases=["Part II, Item 2"]
+            "1", "Legal Proceedings", aliases=["Part II, Item 1"], part="II"
         ),
+        ItemDefinition("1A", "Risk Factors", aliases=["Part II, Item 1A"], part="II"),
         ItemDefinition(
-            "3", "Defaults Upon Senior Securities", aliases=["Part II, Item 3"]
+            "2",
+            "Unregistered Sales of Equity Securities",
+            aliases=["Part II, Item 2"],
+            part="II",
         ),
         ItemDefinition(
-            "4", "Mine Safety Disclosures", aliases=["Part II, Item 4"], required=False
+            "3",
+            "Defaults Upon Senior Securities",
+            aliases=["Part II, Item 3"],
+            part="II",
         ),
-        ItemDefinition("5", "Other Information", aliases=["Part II, Item 5"]),
-        ItemDefinition("6", "Exhibits", aliases=["Part II, Item 6"]),
+        ItemDefinition(
+            "4",
+            "Mine Safety Disclosures",
+            aliases=["Part II, Item 4"],
+            required=False,
+            part="II",
+        ),
+        ItemDefinition(
+            "5", "Other Information", aliases=["Part II, Item 5"], part="II"
+        ),
+        ItemDefinition("6", "Exhibits", aliases=["Part II, Item 6"], part="II"),
     ]
 
     # 8-K Item definitions (most common items)
@@ -119,13 +296,42 @@ class ItemExtractor:
         ItemDefinition("9.01", "Financial Statements and Exhibits"),
     ]
 
-    def __init__(self):
-        """Initialize the item extractor."""
-        self.form_items = {
-            FormType.FORM_10K: self.FORM_10K_ITEMS,
-            FormType.FORM_10Q: self.FORM_10Q_ITEMS,
-            FormType.FORM_8K: self.FORM_8K_ITEMS,
-        }
+    # Shared by all instances, so the patterns each definition compiles on
+    # first use are reused by every extractor in the process
+    form_items = {
+        FormType.FORM_10K: FORM_10K_ITEMS,
+        FormType.FORM_10Q: FORM_10Q_ITEMS,
+        FormType.FORM_8K: FORM_8K_ITEMS,
+    }
+
+    def __init__(self, regex_backend: str = "re") -> None:
+        """
+        Initialize the item extractor.
+
+        Args:
+            regex_backend: ``"re"`` (default) or ``"re2"``. With ``"re2"``,
+                the whole-filing scans that ``re`` can backtrack on (tag
+                removal and the table of contents search) use RE2, which
+                matches in linear time. RE2 is slower on ordinary filings, so
+                it is only worth it for untrusted or malformed input.
+
+        Raises:
+            ValueError: If the backend is unknown
+            ImportError: If ``"re2"`` is requested without ``google-re2``
+        """
+        if regex_backend == "re":
+            self._html_tag_re = _HTML_TAG_RE
+            self._toc_re = _TOC_RE
+        elif regex_backend == "re2":
+            if not RE2_AVAILABLE:
+                raise ImportError(
+                    "google-re2 is required for the re2 backend. "
+                    "Install with: pip install sec-edgar-toolkit[re2]"
+                )
+            self._html_tag_re = _compile_re2(_HTML_TAG_RE)
+            self._toc_re = _compile_re2(_TOC_RE)
+        else:
+            raise ValueError(f"Unknown regex backend: {regex_backend}")
 
     def extract_items(
         self, content: str, form_type: Union[str, FormType]
@@ -147,6 +353,34 @@ class ItemExtractor:
                 "2": "Item 2. Properties\n..."
             }
         """
+        return self._extract(content, form_type)
+
+    def extract_specific_items(
+        self, content: str, form_type: Union[str, FormType], item_numbers: List[str]
+    ) -> Dict[str, str]:
+        """
+        Extract specific items from a filing.
+
+        Only the requested items are searched for; the rest of the filing is
+        still scanned once to find where each item ends.
+
+        Args:
+            content: The filing content
+            form_type: The type of form
+            item_numbers: List of item numbers to extract (e.g., ["1", "1A", "7"])
+
+        Returns:
+            Dictionary with only the requested items
+        """
+        return self._extract(content, form_type, set(item_numbers))
+
+    def _extract(
+        self,
+        content: str,
+        form_type: Union[str, FormType],
+        item_numbers: Optional[AbstractSet[str]] = None,
+    ) -> Dict[str, str]:
+        """Extract the items of a filing, optionally only the given numbers."""
         # Convert string form type to enum
         if isinstance(form_type, str):
             form_type = self._parse_form_type(form_type)
@@ -154,6 +388,10 @@ class ItemExtractor:
         if form_type not in self.form_items:
             raise ValueError(f"Unsupported form type: {form_type}")
 
+        # Skip cleaning filings that cannot contain any item
+        if not self._may_contain_items(content, self.form_items[form_type]):
+            return {}
+
         # Clean content
         clean_content = self._clean_content(content)
 
@@ -161,58 +399,38 @@ class ItemExtractor:
         toc_items = self._extract_table_of_contents(clean_content)
 
         # Extract items
-        items = self._extract_items_from_content(clean_content, form_type, toc_items)
+        items = self._extract_items_from_content(
+            clean_content, form_type, toc_items, item_numbers
+        )
 
         # Post-process and validate
         return self._post_process_items(items, form_type)
 
-    def extract_specific_items(
-        self, content: str, form_type: Union[str, FormType], item_numbers: List[str]
-    ) -> Dict[str, str]:
-        """
-        Extract specific items from a filing.
-
-        Args:
-            content: The filing content
-            form_type: The type of form
-            item_numbers: List of item numbers to extract (e.g., ["1", "1A", "7"])
-
-        Returns:
-            Dictionary with only the requested items
-        """
-        all_items = self.extract_items(content, form_type)
-        return {k: v for k, v in all_items.items() if k in item_numbers}
-
     def _parse_form_type(self, form_type_str: str) -> FormType:
         """Parse string form type to FormType enum."""
-        form_type_upper = form_type_str.upper()
-
-        # Handle variations
-        if "10-K" in form_type_upper or "10K" in form_type_upper:
-            return FormType.FORM_10K
-        elif "10-Q" in form_type_upper or "10Q" in form_type_upper:
-            return FormType.FORM_10Q
-        elif "8-K" in form_type_upper or "8K" in form_type_upper:
-            return FormType.FORM_8K
-        elif "20-F" in form_type_upper or "20F" in form_type_upper:
-            return FormType.FORM_20F
-        elif "40-F" in form_type_upper or "40F" in form_type_upper:
-            return FormType.FORM_40F
-        else:
-            raise ValueError(f"Unknown form type: {form_type_str}")
+        return _parse_form_type(form_type_str)
 
     def _clean_content(self, content: str) -> str:
         """Clean HTML content for better text extraction."""
-        # Remove HTML tags but preserve structure
-        content = re.sub(r"<[^>]+>", " ", content)
-
-        # Normalize whitespace
-        content = re.sub(r"\s+", " ", content)
-
-        # Preserve line breaks for item boundaries
-        content = re.sub(
-            r"(Item\s+\d+[A-Z]?\.)", r"\n\n\1", content, flags=re.IGNORECASE
-        )
+        # Remove HTML tags but preserve structure; plain-text filings skip the
+        # regex scan after a single memchr-speed membership test
+        if "<" in content:
+            content = self._html_tag_re.sub(" ", content)
+
+        # Normalize whitespace; str.split() splits on the same characters as
+        # \s and is about three times faster than a regex substitution
+        content = " ".join(content.split())
+
+        # Preserve line breaks for item boundaries; the heading pattern is
+        # only tried where the word "item" occurs
+        parts = []
+        last = 0
+        for pos in self._find_item_words(content):
+            if _ITEM_HEADING_RE.match(content, pos):
+                parts.append(content[last:pos])
+                last = pos
+        parts.append(content[last:])
+        content = "\n\n".join(parts)
 
         return content.strip()
 
@@ -226,101 +444,265 @@ class ItemExtractor:
         toc_items = []
 
         # Look for table of contents section
-        toc_match = re.search(
-            r"TABLE\s+OF\s+CONTENTS(.*?)(?:Item\s+1\.|PART\s+I\s)",
-            content,
-            re.IGNORECASE | re.DOTALL,
-        )
+        toc_match = self._toc_re.search(content)
 
         if toc_match:
-            toc_content = toc_match.group(1)
+            # Scan the TOC in place instead of copying it out; positions stay
+            # relative to the start of the TOC
+            toc_start, toc_end = toc_match.span(1)
 
             # Extract item references from TOC
-            item_pattern = r"Item\s+(\d+[A-Z]?)\.\s*([^\n\r\.]+)"
-            for match in re.finditer(item_pattern, toc_content, re.IGNORECASE):
+            for match in _TOC_ITEM_RE.finditer(content, toc_start, toc_end):
                 item_num = match.group(1).upper()
-                toc_items.append((item_num, match.start()))
+                toc_items.append((item_num, match.start() - toc_start))
 
         return toc_items
 
     def _extract_items_from_content(
-        self, content: str, form_type: FormType, toc_items: List[Tuple[str, int]]
+        self,
+        content: str,
+        form_type: FormType,
+        toc_items: List[Tuple[str, int]],
+        item_numbers: Optional[AbstractSet[str]] = None,
     ) -> Dict[str, ExtractedItem]:
-        """Extract items from the main content."""
+        """
+        Extract items (all, or only ``item_numbers``) from the main content.
+
+        Items of a part are only searched on their side of the "Part II"
+        heading (see ``_find_part_ii_start``); without one, every item is
+        searched in the whole filing and Part II items found at a Part I
+        item's heading are dropped.
+        """
         items = {}
         item_definitions = self.form_items[form_type]
 
-        # Create patterns for each item
+        # Single pass over the filing: "Item <n>" positions keyed by the
+        # digits, and the starts of all item headings for the end search
+        prefix_starts: Dict[str, List[int]] = {}
+        boundaries: List[int] = []
+        # Rough heuristic: matches before the last TOC item + buffer are in it
+        toc_end = max(pos for _, pos in toc_items) + 500 if toc_items else 0
+        for pos in self._find_item_words(content):
+            match = _ITEM_PREFIX_RE.match(content, pos)
+            if match:
+                prefix_starts.setdefault(match.group(1), []).append(pos)
+                if _NEXT_ITEM_RE.match(content, pos):
+                    boundaries.append(pos)
+
+        part_ranges: Dict[str, Tuple[int, int]] = {}
+        # Without a "Part II" heading, Part I headings are located even when
+        # not requested so Part II items landing on them can be dropped
+        track_part_i = False
+        if any(item_def.part == "II" for item_def in item_definitions):
+            part_ii_start = self._find_part_ii_start(content, boundaries, toc_end)
+            if part_ii_start is not None:
+                part_ranges = {
+                    "I": (0, part_ii_start),
+                    "II": (part_ii_start, len(content)),
+                }
+            else:
+                track_part_i = True
+        part_i_starts: Set[int] = set()
+
         for item_def in item_definitions:
-            # Build pattern with item number and possible variations
-            patterns = [
-                rf"Item\s+{re.escape(item_def.number)}\.\s*{re.escape(item_def.title)}",
-                rf"Item\s+{re.escape(item_def.number)}\.\s*(?=[A-Z])",
-                rf"Item\s+{re.escape(item_def.number)}(?:\.|:|\s)",
+            requested = item_numbers is None or item_def.key in item_numbers
+            if not requested and not (track_part_i and item_def.part == "I"):
+                continue
+
+            lo, hi = part_ranges.get(item_def.part or "", (0, len(content)))
+            digits = _LEADING_DIGITS_RE.match(item_def.number)
+            candidates = [
+                pos
+                for pos in prefix_starts.get(digits.group() if digits else "", [])
+                if lo <= pos < hi
             ]
+            start_pos = self._find_heading(content, item_def, candidates, toc_end)
 
-            # Add alias patterns
-            for alias in item_def.aliases:
-                patterns.append(rf"{re.escape(alias)}")
-
-            # Try each pattern
-            for pattern in patterns:
-                matches = list(
-                    re.finditer(pattern, content, re.IGNORECASE | re.MULTILINE)
+            # Fall back to the aliases; their matches are generated lazily
+            # since at most the first one and the first one after the TOC
+            # are used
+            for pattern in item_def.patterns[1:]:
+                if start_pos is not None:
+                    break
+                # Alias matches may run past ``hi``; only the start counts, so
+                # starts are taken while ``hi > start``
+                starts = takewhile(
+                    partial(gt, hi),
+                    (match.start() for match in pattern.finditer(content, lo)),
                 )
-
-                if matches:
-                    # Use the first match after TOC (if TOC exists)
-                    match = matches[0]
-                    if len(matches) > 1 and toc_items:
-                        # Skip matches that appear in TOC
-                        for m in matches[1:]:
-                            if not self._is_in_toc(m.start(), toc_items):
-                                match = m
-                                break
-
-                    start_pos = match.start()
-
-                    # Find the end position (start of next item)
-                    end_pos = self._find_item_end(content, start_pos, item_definitions)
-
-                    # Extract content
-                    item_content = content[start_pos:end_pos].strip()
-
-                    items[item_def.number] = ExtractedItem(
-                        item_number=item_def.number,
-                        title=item_def.title,
-                        content=item_content,
-                        start_position=start_pos,
-                        end_position=end_pos,
+                start_pos = next(starts, None)
+                if start_pos is not None and toc_items and start_pos < toc_end:
+                    # Skip matches that appear in TOC
+                    start_pos = next(
+                        (pos for pos in starts if pos >= toc_end), start_pos
                     )
-                    break
+
+            if start_pos is None:
+                continue
+            if item_def.part == "I":
+                part_i_starts.add(start_pos)
+            elif item_def.part == "II" and start_pos in part_i_starts:
+                # The same heading as a Part I item (e.g. "Item 1" of a 10-Q)
+                continue
+            if not requested:
+                continue
+
+            # Find the end position (start of next item)
+            end_pos = self._find_item_end(
+                content, start_pos, item_definitions, boundaries
+            )
+
+            # Extract content; the bounds are trimmed first so that the item,
+            # which can run to megabytes, is copied once rather than sliced
+            # and then stripped
+            first, last = start_pos, end_pos
+            while first < last and content[first].isspace():
+                first += 1
+            while last > first and content[last - 1].isspace():
+                last -= 1
+            item_content = content[first:last]
+
+            items[item_def.key] = ExtractedItem(
+                item_number=item_def.number,
+                title=item_def.title,
+                content=item_content,
+                start_position=start_pos,
+                end_position=end_pos,
+            )
 
         return items
 
-    def _is_in_toc(self, position: int, toc_items: List[Tuple[str, int]]) -> bool:
-        """Check if a position is within the table of contents."""
-        if not toc_items:
-            return False
+    def _find_part_ii_start(
+        self, content: str, boundaries: List[int], toc_end: int
+    ) -> Optional[int]:
+        """
+        Find the "Part II" heading of a 10-Q, or None if it has none.
+
+        A part is only taken for a heading when an item heading follows it,
+        past at most a short title, which rules out references such as
+        "Part II of our Annual Report". A table of contents lists both parts
+        before the body does, so the search starts at the last Part I heading.
+        """
+
+        def is_heading(match: Match[str]) -> bool:
+            index = bisect_left(boundaries, match.end())
+            return (
+                index < len(boundaries)
+                and boundaries[index] - match.end() <= _PART_TITLE_MAX_LENGTH
+            )
+
+        search_from = toc_end
+        for match in _PART_I_RE.finditer(content, toc_end):
+            if is_heading(match):
+                search_from = match.end()
+        for match in _PART_II_RE.finditer(content, search_from):
+            if is_heading(match):
+                return match.start()
+        return None
+
+    def _find_heading(
+        self,
+        content: str,
+        item_def: ItemDefinition,
+        candidates: List[int],
+        toc_end: int,
+    ) -> Optional[int]:
+        """
+        Find the heading of an item among the "Item <n>" positions.
 
-        # Rough heuristic: if position is before the last TOC item + buffer
-        if toc_items:
-            last_toc_pos = max(item[1] for item in toc_items)
-            return position < last_toc_pos + 500
+        The heading pattern tells at each position how specific the match is
+        (with the title, followed by a letter, or followed by punctuation or
+        space). A more specific match anywhere wins over a looser one, and
+        for each level the first match past the table of contents is
+        preferred, so one pass over the candidates serves every level.
+        """
+        pattern = item_def.patterns[0]
+        first: List[Optional[int]] = [None] * len(_HEADING_LEVELS)
+        after_toc: List[Optional[int]] = [None] * len(_HEADING_LEVELS)
+
+        for pos in candidates:
+            match = pattern.match(content, pos)
+            # Every heading match ends in one of the level groups
+            if match is None or match.lastgroup is None:
+                continue
+            # A match at some level also matches every looser level
+            for level in range(_HEADING_LEVELS[match.lastgroup], len(first)):
+                if first[level] is None:
+                    first[level] = pos
+                if after_toc[level] is None and pos >= toc_end:
+                    after_toc[level] = pos
+            if after_toc[0] is not None:
+                break
+
+        for level_first, level_after_toc in zip(first, after_toc):
+            if level_first is not None:
+                return level_after_toc if level_after_toc is not None else level_first
+        return None
+
+    def _may_contain_items(
+        self, content: str, item_definitions: List[ItemDefinition]
+    ) -> bool:
+        """
+        Tell whether any item heading or alias can occur in the filing.
 
-        return False
+        Cleaning only replaces tags and whitespace, so text without spaces
+        found in the cleaned filing is also present in the raw one. Every
+        heading contains the word "item"; aliases with spaces are assumed to
+        be present.
+        """
+        lowered = _lower_offsets(content)
+        if "item" in lowered:
+            return True
+        return any(
+            any(char.isspace() for char in alias) or _lower_offsets(alias) in lowered
+            for item_def in item_definitions
+            for alias in item_def.aliases
+        )
+
+    def _find_item_words(self, content: str) -> Iterator[int]:
+        """
+        Yield every position where the word "item" starts, in any case.
+
+        The item patterns all begin with "Item" and are matched with
+        ``re.IGNORECASE``, which also accepts the dotted and dotless Turkish
+        i. A literal search of a lowercased copy (with both mapped to "i",
+        which keeps the offsets) finds candidates far faster than a
+        case-insensitive regex scan; callers confirm them with ``match``.
+        Matches never overlap, since no item pattern can span a second
+        "item", so this gives the same results as ``finditer``.
+        """
+        lowered = _lower_offsets(content)
+        pos = lowered.find("item")
+        while pos != -1:
+            yield pos
+            pos = lowered.find("item", pos + 4)
 
     def _find_item_end(
-        self, content: str, start_pos: int, item_definitions: List[ItemDefinition]
-    ) -> int:  # noqa: ARG002
-        """Find where an item ends (usually the start of the next item)."""
-        # Look for the next item
-        next_item_pattern = r"Item\s+\d+[A-Z]?[\.:]\s*[A-Z]"
+        self,
+        content: str,
+        start_pos: int,
+        item_definitions: List[ItemDefinition],  # noqa: ARG002
+        boundaries: Optional[List[int]] = None,
+    ) -> int:
+        """
+        Find where an item ends (usually the start of the next item).
+
+        Args:
+            content: Cleaned filing content
+            start_pos: Start of the item
+            item_definitions: Item definitions of the form
+            boundaries: Sorted starts of all item headings in ``content``; when
+                given, the next one is found by bisection instead of a search
+        """
+        if boundaries is not None:
+            index = bisect_left(boundaries, start_pos + 10)
+            return boundaries[index] if index < len(boundaries) else len(content)
 
-        match = re.search(next_item_pattern, content[start_pos + 10 :], re.IGNORECASE)
+        # Look for the next item; searching from an offset avoids copying the tail
+        match = _NEXT_ITEM_RE.search(content, start_pos + 10)
 
         if match:
-            return start_pos + 10 + match.start()
+            return match.start()
         else:
             # No next item found, return end of content
             return len(content)
@@ -335,8 +717,11 @@ class ItemExtractor:
             # Clean up the content
             content = extracted_item.content
 
-            # Remove excessive whitespace
-            content = re.sub(r"\n\s*\n\s*\n", "\n\n", content)
+            # Remove excessive whitespace; cleaned content only carries the
+            # paragraph breaks inserted before headings, so a run of blank
+            # lines (three newlines at least) is rare
+            if content.count("\n") > 2:
+                content = _BLANK_LINES_RE.sub("\n\n", content)
 
             # Ensure we have some content
             if len(content.strip()) > 50:  # Minimum content threshold
@@ -7,19 +7,310 @@ by officers, directors, and significant shareholders.
 Form 3: Initial statement of beneficial ownership
 Form 4: Changes in beneficial ownership
 Form 5: Annual statement of changes in beneficial ownership
+
+With lxml, documents are parsed without loading external DTDs or entities,
+without network access and without indexing ID attributes. Ownership forms
+use none of these, and a crafted document cannot make the parser read local
+files or fetch URLs.
 """
 
 from __future__ import annotations
 
 import logging
+import re
+import threading
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
-from typing import Any, Dict, List, Optional, Union
+from functools import cached_property, partial
+from io import BytesIO
+from sys import intern
+from typing import (
+    Any,
+    BinaryIO,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Type,
+    Union,
+)
+
+try:
+    import numpy as np
+
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
 
 from ..exceptions import SecEdgarApiError
-from ..utils.xml_parser import EnhancedXMLParser, parse_xml
+from ..utils.xml_parser import LXML_AVAILABLE, EnhancedXMLParser, etree
 
 logger = logging.getLogger(__name__)
 
+# Top-level document fields, kept as text on the first occurrence
+_DOCUMENT_FIELDS = (
+    "schemaVersion",
+    "documentType",
+    "periodOfReport",
+    "dateOfOriginalSubmission",
+    "notSubjectToSection16",
+)
+
+# Relative element paths compiled to lxml XPath on first use; evaluating a
+# compiled expression is several times faster than ``find``, which parses
+# the path again on every call
+_XPATHS: Dict[str, Any] = {}
+# Same, returning the text of the first element (or "") from a single C call
+_TEXT_XPATHS: Dict[str, Any] = {}
+
+# Spellings of a true boolean element, checked before any case folding
+_TRUE_VALUES = frozenset(("true", "1", "True", "TRUE"))
+
+# Date formats tried when a date is not a plain ISO date
+_DATE_FORMATS = (
+    "%Y-%m-%d",  # 2024-1-15
+    "%m/%d/%Y",  # 01/15/2024
+    "%m-%d-%Y",  # 01-15-2024
+)
+
+# lxml parsers must not be shared between threads, so each thread keeps one
+_PARSER_LOCAL = threading.local()
+
+# A text input is re-encoded as UTF-8, so its declaration must not name
+# another encoding
+_XML_DECLARATION_RE = re.compile(r"\A\s*<\?xml[^>]*\?>")
+
+
+def _shared_parser() -> EnhancedXMLParser:
+    """Return the XML parser of the current thread, creating it on first use."""
+    parser: Optional[EnhancedXMLParser] = getattr(_PARSER_LOCAL, "parser", None)
+    if parser is None:
+        parser = EnhancedXMLParser(
+            recover=True,
+            remove_blank_text=True,
+            resolve_entities=False,
+            collect_ids=False,
+        )
+        _PARSER_LOCAL.parser = parser
+    return parser
+
+
+def _is_true(text: str) -> bool:
+    """
+    Interpret the text of a boolean element.
+
+    The ownership schemas allow both ``true`` and ``1``; the usual spellings
+    are set lookups, other casings of "true" still count.
+    """
+    return text in _TRUE_VALUES or (len(text) == 4 and text.lower() == "true")
+
+
+def _parse_date(date_text: str) -> Optional[datetime]:
+    """Convert the text of a date element to a datetime object."""
+    if not date_text:
+        return None
+
+    # Almost every filing uses ISO dates; build them without strptime
+    if (
+        len(date_text) == 10
+        and date_text[4] == date_text[7] == "-"
+        and date_text[:4].isdigit()
+        and date_text[5:7].isdigit()
+        and date_text[8:].isdigit()
+    ):
+        try:
+            return datetime(int(date_text[:4]), int(date_text[5:7]), int(date_text[8:]))
+        except ValueError:
+            pass
+
+    for fmt in _DATE_FORMATS:
+        try:
+            return datetime.strptime(date_text, fmt)
+        except ValueError:
+            continue
+
+    logger.warning(f"Could not parse date: {date_text}")
+    return None
+
+
+def _to_float(text: str, default: float = 0.0) -> float:
+    """Convert element text to a float, or ``default`` if it is not one."""
+    if not text:
+        return default
+    try:
+        return float(text)
+    except ValueError:
+        return default
+
+
+# A record is built from groups of ``(group path, nested key, fields)``; each
+# field is ``(output key, path within the group, converter)``, where a None
+# converter keeps the text. Codes and titles that repeat across records are
+# interned, so the records of large batches share one string per value
+RecordField = Tuple[str, str, Optional[Callable[[str], Any]]]
+RecordSpec = Tuple[Tuple[str, Optional[str], Tuple[RecordField, ...]], ...]
+
+_REPORTING_OWNER: RecordSpec = (
+    (
+        "reportingOwnerId",
+        None,
+        (
+            ("cik", "rptOwnerCik", None),
+            ("name", "rptOwnerName", None),
+            ("street1", "rptOwnerStreet1", None),
+            ("street2", "rptOwnerStreet2", None),
+            ("city", "rptOwnerCity", None),
+            ("state", "rptOwnerState", None),
+            ("zip_code", "rptOwnerZipCode", None),
+            ("state_description", "rptOwnerStateDescription", None),
+        ),
+    ),
+    (
+        "reportingOwnerRelationship",
+        "relationship",
+        (
+            ("is_director", "isDirector", _is_true),
+            ("is_officer", "isOfficer", _is_true),
+            ("is_ten_percent_owner", "isTenPercentOwner", _is_true),
+            ("is_other", "isOther", _is_true),
+            ("officer_title", "officerTitle", intern),
+            ("other_text", "otherText", None),
+        ),
+    ),
+)
+
+_NON_DERIVATIVE_TRANSACTION: RecordSpec = (
+    ("securityTitle", None, (("security_title", "value", intern),)),
+    ("transactionDate", None, (("transaction_date", "value", _parse_date),)),
+    (
+        "transactionAmounts",
+        None,
+        (
+            ("shares", "transactionShares/value", _to_float),
+            ("price_per_share", "transactionPricePerShare/value", _to_float),
+            (
+                "acquired_disposed_code",
+                "transactionAcquiredDisposedCode/value",
+                intern,
+            ),
+        ),
+    ),
+    (
+        "transactionCoding",
+        None,
+        (
+            ("form_type", "transactionFormType", intern),
+            ("code", "transactionCode", intern),
+            ("equity_swap_involved", "equitySwapInvolved", _is_true),
+        ),
+    ),
+    (
+        "postTransactionAmounts",
+        None,
+        (
+            (
+                "shares_owned_following_transaction",
+                "sharesOwnedFollowingTransaction/value",
+                _to_float,
+            ),
+            (
+                "direct_or_indirect_ownership",
+                "directOrIndirectOwnership/value",
+                intern,
+            ),
+        ),
+    ),
+    ("ownershipNature", None, (("nature_of_ownership", "value", None),)),
+)
+
+_NON_DERIVATIVE_HOLDING: RecordSpec = (
+    ("securityTitle", None, (("security_title", "value", intern),)),
+    ("sharesOwned", None, (("shares_owned", "value", _to_float),)),
+    (
+        "directOrIndirectOwnership",
+        None,
+        (("direct_or_indirect_ownership", "value", intern),),
+    ),
+    ("ownershipNature", None, (("nature_of_ownership", "value", None),)),
+)
+
+_DERIVATIVE_TRANSACTION: RecordSpec = (
+    ("securityTitle", None, (("security_title", "value", intern),)),
+    (
+        "conversionOrExercisePrice",
+        None,
+        (("conversion_or_exercise_price", "value", _to_float),),
+    ),
+    ("transactionDate", None, (("transaction_date", "value", _parse_date),)),
+    (
+        "transactionAmounts",
+        None,
+        (
+            ("shares", "transactionShares/value", _to_float),
+            ("total_value", "transactionTotalValue/value", _to_float),
+            (
+                "acquired_disposed_code",
+                "transactionAcquiredDisposedCode/value",
+                intern,
+            ),
+        ),
+    ),
+    ("exerciseDate", None, (("exercise_date", "value", _parse_date),)),
+    ("expirationDate", None, (("expiration_date", "value", _parse_date),)),
+    (
+        "underlyingSecurity",
+        "underlying_security",
+        (
+            ("title", "underlyingSecurityTitle/value", None),
+            ("shares", "underlyingSecurityShares/value", _to_float),
+        ),
+    ),
+)
+
+
+def _parse_document(
+    parser_class: Type[OwnershipFormParser], document: Union[str, bytes]
+) -> Dict[str, Any]:
+    """Parse one form in a worker process of ``parse_many``."""
+    return parser_class(document).parse_all()
+
+
+def _record_columns(records: List[Dict[str, Any]], spec: RecordSpec) -> Dict[str, Any]:
+    """
+    Turn records built from ``spec`` into one column per field.
+
+    Fields of a nested group are named ``{nested key}_{field}``.
+    """
+    if not NUMPY_AVAILABLE:
+        raise ImportError(
+            "numpy is required for record columns. Install with: pip install numpy"
+        )
+
+    columns: Dict[str, Any] = {}
+    count = len(records)
+    for _, nest_key, fields in spec:
+        rows = records
+        if nest_key is not None:
+            rows = [record.get(nest_key, {}) for record in records]
+        for key, _, convert in fields:
+            name = key if nest_key is None else f"{nest_key}_{key}"
+            if convert is _to_float:
+                columns[name] = np.fromiter(
+                    (row.get(key, np.nan) for row in rows),
+                    dtype=np.float64,
+                    count=count,
+                )
+            elif convert is _parse_date:
+                columns[name] = np.array(
+                    [row.get(key) for row in rows], dtype="datetime64[D]"
+                )
+            else:
+                columns[name] = [row.get(key) for row in rows]
+    return columns
+
 
 class OwnershipFormParseError(SecEdgarApiError):
     """Exception raised when parsing ownership forms fails."""
@@ -34,83 +325,225 @@ class OwnershipFormParser:
     This parser extracts structured data from XML ownership forms filed with the SEC.
     The forms contain information about insider transactions and stock holdings.
 
+    The document is read in a single streaming pass (``iterparse``) that
+    only reports the elements the form sections are built from; each one is
+    turned into its record and released, so the whole tree is never
+    searched and never held in memory.
+
     Attributes:
-        xml_content: Raw XML content as string or bytes
-        root: Parsed XML root element
+        xml_content: Raw XML content as string or bytes, or a binary file
+        root: Parsed XML root element, built on first access (not available
+            when parsing from a file)
         form_type: Type of form (3, 4, or 5)
     """
 
-    def __init__(self, xml_content: Union[str, bytes]) -> None:
+    def __init__(self, xml_content: Union[str, bytes, BinaryIO]) -> None:
         """
         Initialize the ownership form parser.
 
         Args:
-            xml_content: Raw XML content of the form
+            xml_content: Raw XML content of the form, or a binary file to
+                read it from. A file is read incrementally and never held in
+                memory as a whole.
 
         Raises:
             OwnershipFormParseError: If XML parsing fails
         """
         self.xml_content = xml_content
-        self.parser = EnhancedXMLParser(recover=True, remove_blank_text=True)
+        self.parser = _shared_parser()
+
+        source: BinaryIO
+        self._xml_bytes: Optional[bytes]
+        if isinstance(xml_content, str):
+            xml_content = _XML_DECLARATION_RE.sub("", xml_content, count=1)
+            self._xml_bytes = xml_content.encode("utf-8")
+            source = BytesIO(self._xml_bytes)
+        elif isinstance(xml_content, bytes):
+            self._xml_bytes = xml_content
+            source = BytesIO(self._xml_bytes)
+        else:
+            self._xml_bytes = None
+            source = xml_content
 
         try:
-            self.root = self.parser.parse_string(xml_content)
+            self._sections = self._parse_sections(source)
         except Exception as e:
             raise OwnershipFormParseError(f"Failed to parse XML: {e}") from e
 
         self.form_type = self._extract_form_type()
         logger.info(f"Initialized parser for Form {self.form_type}")
 
+    @classmethod
+    def parse_all_streaming(cls, source: Union[bytes, BinaryIO]) -> Dict[str, Any]:
+        """
+        Parse all information from a form without keeping the document.
+
+        Intended for large filings: a file is read in chunks, and each record
+        is released as soon as it has been parsed, so memory use stays
+        bounded by a single record rather than the whole document.
+
+        Args:
+            source: XML content as bytes, or a binary file to read it from
+
+        Returns:
+            Complete dictionary containing all parsed form data
+
+        Example:
+            >>> with open("form4.xml", "rb") as f:
+            ...     data = OwnershipFormParser.parse_all_streaming(f)
+            >>> with client.stream(form4_url) as body:  # straight off the network
+            ...     data = OwnershipFormParser.parse_all_streaming(body)
+        """
+        return cls(source).parse_all()
+
+    @classmethod
+    def parse_many(
+        cls,
+        documents: Iterable[Union[str, bytes]],
+        workers: Optional[int] = None,
+        chunksize: int = 16,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Parse many forms in parallel worker processes.
+
+        Parsing is CPU-bound, so threads would serialize on the GIL; each
+        worker process parses whole documents and sends back the result of
+        ``parse_all``. Documents are sent to the workers in chunks to
+        amortize the cost of pickling them.
+
+        Args:
+            documents: Raw XML contents of the forms. The iterable is consumed
+                up front, so pass a bounded batch.
+            workers: Number of worker processes (default: one per CPU)
+            chunksize: Documents sent to a worker at a time
+
+        Yields:
+            The parsed form data, in the order of ``documents``
+
+        Raises:
+            OwnershipFormParseError: If a document cannot be parsed; the
+                results before it have already been yielded
+
+        Example:
+            >>> for data in Form4Parser.parse_many(daily_form4s, workers=8):
+            ...     store(data)
+        """
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            yield from executor.map(
+                partial(_parse_document, cls), documents, chunksize=chunksize
+            )
+
+    @cached_property
+    def root(self) -> Any:
+        """Parsed XML root element, for callers that query the tree directly."""
+        if self._xml_bytes is None:
+            raise OwnershipFormParseError(
+                "The XML tree is not kept for forms parsed from a file"
+            )
+        if LXML_AVAILABLE:
+            return etree.fromstring(self._xml_bytes, parser=self.parser.parser)
+        return etree.fromstring(self._xml_bytes)
+
+    def _iter_elements(self, source: BinaryIO) -> Iterator[Any]:
+        """Yield the elements the sections are built from, in document order."""
+        for _, element in self.parser.iterparse(
+            source, tag=(*_DOCUMENT_FIELDS, *self._handlers)
+        ):
+            yield element
+
+    @property
+    def _handlers(self) -> Dict[str, Callable[[Any], Dict[str, Any]]]:
+        """Record builders by element name."""
+        return {
+            "issuer": self._parse_issuer,
+            "reportingOwner": self._parse_reporting_owner,
+            "nonDerivativeTransaction": self._parse_non_derivative_transaction,
+            "nonDerivativeHolding": self._parse_non_derivative_holding,
+            "derivativeTransaction": self._parse_derivative_transaction,
+        }
+
+    def _parse_sections(self, source: BinaryIO) -> Dict[str, Any]:
+        """Build every form section in one pass over the document."""
+        handlers = self._handlers
+        document_texts: Dict[str, str] = {}
+        records: Dict[str, List[Dict[str, Any]]] = {tag: [] for tag in handlers}
+
+        for element in self._iter_elements(source):
+            tag = element.tag
+            handler = handlers.get(tag)
+            if handler is not None:
+                records[tag].append(handler(element))
+            elif tag not in document_texts:
+                document_texts[tag] = self._get_text(element)
+
+        return {
+            "document_texts": document_texts,
+            "issuer_info": next(iter(records["issuer"]), {}),
+            "reporting_owner_info": next(iter(records["reportingOwner"]), {}),
+            "non_derivative_transactions": records["nonDerivativeTransaction"],
+            "non_derivative_holdings": records["nonDerivativeHolding"],
+            "derivative_transactions": records["derivativeTransaction"],
+        }
+
     def _extract_form_type(self) -> str:
         """Extract the form type from the XML document."""
+        document_texts = self._sections["document_texts"]
+
         # Try multiple possible locations for form type
-        form_type_elem = self.root.find(".//documentType")
-        if form_type_elem is not None and form_type_elem.text:
-            return form_type_elem.text.strip()
+        form_type = document_texts.get("documentType")
+        if form_type:
+            return form_type
 
         # Fallback: check schemaVersion or other indicators
-        schema_elem = self.root.find(".//schemaVersion")
-        if schema_elem is not None:
+        if "schemaVersion" in document_texts:
             # Assume it's a Form 4 if we can't find explicit type
             return "4"
 
         raise OwnershipFormParseError("Could not determine form type from XML")
 
+    def _find(self, element: Any, path: str) -> Optional[Any]:
+        """Find the first element at a path relative to ``element``."""
+        if not LXML_AVAILABLE:
+            return element.find(path)
+        xpath = _XPATHS.get(path)
+        if xpath is None:
+            xpath = _XPATHS[path] = etree.XPath(f"({path})[1]")
+        found = xpath(element)
+        return found[0] if found else None
+
+    def _find_text(self, element: Any, path: str) -> str:
+        """Extract the text of the first element at a relative path."""
+        if not LXML_AVAILABLE:
+            return self._get_text(element.find(path))
+        xpath = _TEXT_XPATHS.get(path)
+        if xpath is None:
+            # Plain strings, so results do not keep the tree alive; the values
+            # read this way are leaf elements, whose string value is their text
+            xpath = _TEXT_XPATHS[path] = etree.XPath(
+                f"string(({path})[1])", smart_strings=False
+            )
+        return xpath(element).strip()  # type: ignore[no-any-return]
+
     def _get_text(self, element: Optional[Any], default: str = "") -> str:
         """Safely extract text from an XML element."""
         return self.parser.get_text(element, default)
 
     def _get_float(self, element: Optional[Any], default: float = 0.0) -> float:
         """Safely extract float value from an XML element."""
-        text = self._get_text(element)
-        if not text:
-            return default
-        try:
-            return float(text)
-        except ValueError:
-            return default
+        return self._to_float(self._get_text(element), default)
+
+    @staticmethod
+    def _to_float(text: str, default: float) -> float:
+        """Convert element text to a float, or ``default`` if it is not one."""
+        return _to_float(text, default)
 
     def _get_date(self, element: Optional[Any]) -> Optional[datetime]:
         """Extract date from XML element and convert to datetime object."""
-        date_text = self._get_text(element)
-        if not date_text:
-            return None
-
-        # Try different date formats
-        date_formats = [
-            "%Y-%m-%d",  # 2024-01-15
-            "%m/%d/%Y",  # 01/15/2024
-            "%m-%d-%Y",  # 01-15-2024
-        ]
-
-        for fmt in date_formats:
-            try:
-                return datetime.strptime(date_text, fmt)
-            except ValueError:
-                continue
+        return self._parse_date(self._get_text(element))
 
-        logger.warning(f"Could not parse date: {date_text}")
-        return None
+    def _parse_date(self, date_text: str) -> Optional[datetime]:
+        """Convert the text of a date element to a datetime object."""
+        return _parse_date(date_text)
 
     def parse_document_info(self) -> Dict[str, Any]:
         """
@@ -119,21 +552,23 @@ class OwnershipFormParser:
         Returns:
             Dictionary containing document metadata
         """
+        document_texts = self._sections["document_texts"]
         doc_info: Dict[str, Any] = {
             "form_type": self.form_type,
-            "schema_version": self._get_text(self.root.find(".//schemaVersion")),
-            "document_type": self._get_text(self.root.find(".//documentType")),
-            "period_of_report": self._get_date(self.root.find(".//periodOfReport")),
-            "date_of_original_submission": self._get_date(
-                self.root.find(".//dateOfOriginalSubmission")
+            "schema_version": document_texts.get("schemaVersion", ""),
+            "document_type": document_texts.get("documentType", ""),
+            "period_of_report": self._parse_date(
+                document_texts.get("periodOfReport", "")
+            ),
+            "date_of_original_submission": self._parse_date(
+                document_texts.get("dateOfOriginalSubmission", "")
             ),
         }
 
         # Add notSubjectToSection16 flag if present
-        not_subject_elem = self.root.find(".//notSubjectToSection16")
-        if not_subject_elem is not None:
-            doc_info["not_subject_to_section16"] = (
-                self._get_text(not_subject_elem).lower() == "true"
+        if "notSubjectToSection16" in document_texts:
+            doc_info["not_subject_to_section16"] = _is_true(
+                document_texts["notSubjectToSection16"]
             )
 
         return doc_info
@@ -145,14 +580,15 @@ class OwnershipFormParser:
         Returns:
             Dictionary containing issuer information
         """
-        issuer_elem = self.root.find(".//issuer")
-        if issuer_elem is None:
-            return {}
+        issuer_info: Dict[str, Any] = self._sections["issuer_info"]
+        return issuer_info
 
+    def _parse_issuer(self, issuer_elem: Any) -> Dict[str, Any]:
+        """Build the issuer information from an ``issuer`` element."""
         return {
-            "cik": self._get_text(issuer_elem.find("issuerCik")),
-            "name": self._get_text(issuer_elem.find("issuerName")),
-            "trading_symbol": self._get_text(issuer_elem.find("issuerTradingSymbol")),
+            "cik": self._find_text(issuer_elem, "issuerCik"),
+            "name": self._find_text(issuer_elem, "issuerName"),
+            "trading_symbol": self._find_text(issuer_elem, "issuerTradingSymbol"),
         }
 
     def parse_reporting_owner_info(self) -> Dict[str, Any]:
@@ -162,50 +598,13 @@ class OwnershipFormParser:
         Returns:
             Dictionary containing reporting owner information
         """
-        owner_elem = self.root.find(".//reportingOwner")
-        if owner_elem is None:
-            return {}
-
-        owner_info: Dict[str, Any] = {}
-
-        # Parse owner identification
-        owner_id = owner_elem.find("reportingOwnerId")
-        if owner_id is not None:
-            owner_info.update(
-                {
-                    "cik": self._get_text(owner_id.find("rptOwnerCik")),
-                    "name": self._get_text(owner_id.find("rptOwnerName")),
-                    "street1": self._get_text(owner_id.find("rptOwnerStreet1")),
-                    "street2": self._get_text(owner_id.find("rptOwnerStreet2")),
-                    "city": self._get_text(owner_id.find("rptOwnerCity")),
-                    "state": self._get_text(owner_id.find("rptOwnerState")),
-                    "zip_code": self._get_text(owner_id.find("rptOwnerZipCode")),
-                    "state_description": self._get_text(
-                        owner_id.find("rptOwnerStateDescription")
-                    ),
-                }
-            )
-
-        # Parse owner relationship
-        relationship = owner_elem.find("reportingOwnerRelationship")
-        if relationship is not None:
-            owner_info["relationship"] = {
-                "is_director": self._get_text(relationship.find("isDirector")).lower()
-                == "true",
-                "is_officer": self._get_text(relationship.find("isOfficer")).lower()
-                == "true",
-                "is_ten_percent_owner": self._get_text(
-                    relationship.find("isTenPercentOwner")
-                ).lower()
-                == "true",
-                "is_other": self._get_text(relationship.find("isOther")).lower()
-                == "true",
-                "officer_title": self._get_text(relationship.find("officerTitle")),
-                "other_text": self._get_text(relationship.find("otherText")),
-            }
-
+        owner_info: Dict[str, Any] = self._sections["reporting_owner_info"]
         return owner_info
 
+    def _parse_reporting_owner(self, owner_elem: Any) -> Dict[str, Any]:
+        """Build the reporting owner information from a ``reportingOwner``."""
+        return self._parse_record(owner_elem, _REPORTING_OWNER)
+
     def parse_non_derivative_transactions(self) -> List[Dict[str, Any]]:
         """
         Parse non-derivative transactions from the form.
@@ -213,78 +612,39 @@ class OwnershipFormParser:
         Returns:
             List of dictionaries containing transaction information
         """
-        transactions = []
-
-        for transaction_elem in self.root.findall(".//nonDerivativeTransaction"):
-            transaction: Dict[str, Any] = {}
-
-            # Security title
-            security = transaction_elem.find("securityTitle")
-            if security is not None:
-                transaction["security_title"] = self._get_text(security.find("value"))
-
-            # Transaction date
-            trans_date = transaction_elem.find("transactionDate")
-            if trans_date is not None:
-                transaction["transaction_date"] = self._get_date(
-                    trans_date.find("value")
-                )
+        transactions: List[Dict[str, Any]] = self._sections[
+            "non_derivative_transactions"
+        ]
+        return transactions
 
-            # Transaction amounts
-            amounts = transaction_elem.find("transactionAmounts")
-            if amounts is not None:
-                transaction.update(
-                    {
-                        "shares": self._get_float(
-                            amounts.find("transactionShares/value")
-                        ),
-                        "price_per_share": self._get_float(
-                            amounts.find("transactionPricePerShare/value")
-                        ),
-                        "acquired_disposed_code": self._get_text(
-                            amounts.find("transactionAcquiredDisposedCode/value")
-                        ),
-                    }
-                )
+    def _parse_non_derivative_transaction(
+        self, transaction_elem: Any
+    ) -> Dict[str, Any]:
+        """Build a transaction record from a ``nonDerivativeTransaction``."""
+        return self._parse_record(transaction_elem, _NON_DERIVATIVE_TRANSACTION)
 
-            # Transaction coding
-            coding = transaction_elem.find("transactionCoding")
-            if coding is not None:
-                transaction.update(
-                    {
-                        "form_type": self._get_text(coding.find("transactionFormType")),
-                        "code": self._get_text(coding.find("transactionCode")),
-                        "equity_swap_involved": self._get_text(
-                            coding.find("equitySwapInvolved")
-                        ).lower()
-                        == "true",
-                    }
-                )
+    def parse_non_derivative_transactions_columns(self) -> Dict[str, Any]:
+        """
+        Parse non-derivative transactions into one column per field.
 
-            # Post-transaction amounts
-            post_trans = transaction_elem.find("postTransactionAmounts")
-            if post_trans is not None:
-                transaction.update(
-                    {
-                        "shares_owned_following_transaction": self._get_float(
-                            post_trans.find("sharesOwnedFollowingTransaction/value")
-                        ),
-                        "direct_or_indirect_ownership": self._get_text(
-                            post_trans.find("directOrIndirectOwnership/value")
-                        ),
-                    }
-                )
+        Numeric fields are NumPy float arrays and dates ``datetime64[D]``
+        arrays, with NaN or NaT where a transaction lacks the field; other
+        fields are lists, with None there. Building a DataFrame from these
+        columns is faster than from the list of transaction dictionaries.
 
-            # Ownership nature
-            ownership = transaction_elem.find("ownershipNature")
-            if ownership is not None:
-                transaction["nature_of_ownership"] = self._get_text(
-                    ownership.find("value")
-                )
+        Returns:
+            Dictionary mapping each transaction field to its column
 
-            transactions.append(transaction)
+        Raises:
+            ImportError: If NumPy is not installed
 
-        return transactions
+        Example:
+            >>> columns = parser.parse_non_derivative_transactions_columns()
+            >>> total = (columns["shares"] * columns["price_per_share"]).sum()
+        """
+        return _record_columns(
+            self.parse_non_derivative_transactions(), _NON_DERIVATIVE_TRANSACTION
+        )
 
     def parse_non_derivative_holdings(self) -> List[Dict[str, Any]]:
         """
@@ -293,36 +653,28 @@ class OwnershipFormParser:
         Returns:
             List of dictionaries containing holding information
         """
-        holdings = []
-
-        for holding_elem in self.root.findall(".//nonDerivativeHolding"):
-            holding: Dict[str, Any] = {}
-
-            # Security title
-            security = holding_elem.find("securityTitle")
-            if security is not None:
-                holding["security_title"] = self._get_text(security.find("value"))
-
-            # Shares owned
-            shares = holding_elem.find("sharesOwned")
-            if shares is not None:
-                holding["shares_owned"] = self._get_float(shares.find("value"))
-
-            # Direct or indirect ownership
-            ownership_type = holding_elem.find("directOrIndirectOwnership")
-            if ownership_type is not None:
-                holding["direct_or_indirect_ownership"] = self._get_text(
-                    ownership_type.find("value")
-                )
+        holdings: List[Dict[str, Any]] = self._sections["non_derivative_holdings"]
+        return holdings
 
-            # Nature of ownership
-            nature = holding_elem.find("ownershipNature")
-            if nature is not None:
-                holding["nature_of_ownership"] = self._get_text(nature.find("value"))
+    def _parse_non_derivative_holding(self, holding_elem: Any) -> Dict[str, Any]:
+        """Build a holding record from a ``nonDerivativeHolding`` element."""
+        return self._parse_record(holding_elem, _NON_DERIVATIVE_HOLDING)
 
-            holdings.append(holding)
+    def parse_non_derivative_holdings_columns(self) -> Dict[str, Any]:
+        """
+        Parse non-derivative holdings into one column per field.
 
-        return holdings
+        See ``parse_non_derivative_transactions_columns`` for the column types.
+
+        Returns:
+            Dictionary mapping each holding field to its column
+
+        Raises:
+            ImportError: If NumPy is not installed
+        """
+        return _record_columns(
+            self.parse_non_derivative_holdings(), _NON_DERIVATIVE_HOLDING
+        )
 
     def parse_derivative_transactions(self) -> List[Dict[str, Any]]:
         """
@@ -331,75 +683,50 @@ class OwnershipFormParser:
         Returns:
             List of dictionaries containing derivative transaction information
         """
-        transactions = []
-
-        for transaction_elem in self.root.findall(".//derivativeTransaction"):
-            transaction: Dict[str, Any] = {}
-
-            # Security title
-            security = transaction_elem.find("securityTitle")
-            if security is not None:
-                transaction["security_title"] = self._get_text(security.find("value"))
-
-            # Conversion or exercise price
-            conversion = transaction_elem.find("conversionOrExercisePrice")
-            if conversion is not None:
-                transaction["conversion_or_exercise_price"] = self._get_float(
-                    conversion.find("value")
-                )
-
-            # Transaction date
-            trans_date = transaction_elem.find("transactionDate")
-            if trans_date is not None:
-                transaction["transaction_date"] = self._get_date(
-                    trans_date.find("value")
-                )
+        transactions: List[Dict[str, Any]] = self._sections["derivative_transactions"]
+        return transactions
 
-            # Transaction amounts
-            amounts = transaction_elem.find("transactionAmounts")
-            if amounts is not None:
-                transaction.update(
-                    {
-                        "shares": self._get_float(
-                            amounts.find("transactionShares/value")
-                        ),
-                        "total_value": self._get_float(
-                            amounts.find("transactionTotalValue/value")
-                        ),
-                        "acquired_disposed_code": self._get_text(
-                            amounts.find("transactionAcquiredDisposedCode/value")
-                        ),
-                    }
-                )
+    def _parse_derivative_transaction(self, transaction_elem: Any) -> Dict[str, Any]:
+        """Build a transaction record from a ``derivativeTransaction``."""
+        return self._parse_record(transaction_elem, _DERIVATIVE_TRANSACTION)
 
-            # Exercise date and expiration date
-            exercise_date = transaction_elem.find("exerciseDate")
-            if exercise_date is not None:
-                transaction["exercise_date"] = self._get_date(
-                    exercise_date.find("value")
-                )
+    def _parse_record(self, element: Any, spec: RecordSpec) -> Dict[str, Any]:
+        """
+        Build a record from an element following a table of field groups.
 
-            expiration_date = transaction_elem.find("expirationDate")
-            if expiration_date is not None:
-                transaction["expiration_date"] = self._get_date(
-                    expiration_date.find("value")
-                )
+        A group's fields are only set when its element is present; values
+        missing inside a present group take the converter's default.
+        """
+        record: Dict[str, Any] = {}
+        for group_path, nest_key, fields in spec:
+            group = self._find(element, group_path)
+            if group is None:
+                continue
+            target = record
+            if nest_key is not None:
+                target = record[nest_key] = {}
+            for key, path, convert in fields:
+                text = self._find_text(group, path)
+                target[key] = text if convert is None else convert(text)
+        return record
+
+    def parse_derivative_transactions_columns(self) -> Dict[str, Any]:
+        """
+        Parse derivative transactions into one column per field.
 
-            # Underlying security
-            underlying = transaction_elem.find("underlyingSecurity")
-            if underlying is not None:
-                transaction["underlying_security"] = {
-                    "title": self._get_text(
-                        underlying.find("underlyingSecurityTitle/value")
-                    ),
-                    "shares": self._get_float(
-                        underlying.find("underlyingSecurityShares/value")
-                    ),
-                }
+        See ``parse_non_derivative_transactions_columns`` for the column types;
+        the underlying security fields are named ``underlying_security_title``
+        and ``underlying_security_shares``.
 
-            transactions.append(transaction)
+        Returns:
+            Dictionary mapping each transaction field to its column
 
-        return transactions
+        Raises:
+            ImportError: If NumPy is not installed
+        """
+        return _record_columns(
+            self.parse_derivative_transactions(), _DERIVATIVE_TRANSACTION
+        )
 
     def parse_all(self) -> Dict[str, Any]:
         """
@@ -425,7 +752,7 @@ class Form4Parser(OwnershipFormParser):
     Form 4 must be filed within 2 business days of a transaction.
     """
 
-    def __init__(self, xml_content: Union[str, bytes]) -> None:
+    def __init__(self, xml_content: Union[str, bytes, BinaryIO]) -> None:
         super().__init__(xml_content)
         if self.form_type != "4":
             logger.warning(f"Expected Form 4, but found Form {self.form_type}")
@@ -439,7 +766,7 @@ class Form5Parser(OwnershipFormParser):
     Form 4 reporting requirements.
     """
 
-    def __init__(self, xml_content: Union[str, bytes]) -> None:
+    def __init__(self, xml_content: Union[str, bytes, BinaryIO]) -> None:
         super().__init__(xml_content)
         if self.form_type != "5":
             logger.warning(f"Expected Form 5, but found Form {self.form_type}")
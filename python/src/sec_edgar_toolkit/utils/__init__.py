@@ -1,9 +1,13 @@
 """Utility functions and helpers."""
 
+from .cache import FileCache
+from .cik import pad_cik
 from .filters import FilingFilter
 from .http import HttpClient
 
 __all__ = [
+    "FileCache",
     "FilingFilter",
     "HttpClient",
+    "pad_cik",
 ]
@@ -0,0 +1,185 @@
+"""File-backed response cache for SEC EDGAR API requests."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, Tuple, Union
+
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    orjson = None
+    ORJSON_AVAILABLE = False
+
+# Configure module logger
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_DIR = Path("~/.cache/sec-edgar-toolkit").expanduser()
+
+# Fetch callback: receives the cached ``Last-Modified`` value (if any) and
+# returns ``(data, last_modified)``, or ``None`` when the server answered
+# ``304 Not Modified``.
+Fetcher = Callable[[Optional[str]], Optional[Tuple[Any, Optional[str]]]]
+
+
+class FileCache:
+    """
+    Persistent JSON response cache stored on the local filesystem.
+
+    Entries live under ``{directory}/{namespace}/{key}.json`` where ``key`` is
+    the MD5 digest of the request URL and query parameters. Each entry keeps
+    the time it was stored and the server's ``Last-Modified`` header so that
+    expired entries can be revalidated with ``If-Modified-Since``.
+
+    Args:
+        directory: Cache root directory (default: ``~/.cache/sec-edgar-toolkit``)
+
+    Example:
+        >>> cache = FileCache()
+        >>> data = cache.get_or_fetch("submissions", url, fetch, ttl=86400)
+    """
+
+    def __init__(self, directory: Optional[Union[str, Path]] = None) -> None:
+        """Initialize file cache."""
+        self.directory = (
+            Path(directory).expanduser() if directory else DEFAULT_CACHE_DIR
+        )
+
+    @staticmethod
+    def _key(url: str, params: Optional[Dict[str, Any]] = None) -> str:
+        """Build the cache key for a request."""
+        raw = json.dumps([url, params or {}], sort_keys=True)
+        return hashlib.md5(raw.encode("utf-8")).hexdigest()
+
+    def _path(
+        self, namespace: str, url: str, params: Optional[Dict[str, Any]] = None
+    ) -> Path:
+        """Return the file path of a cache entry."""
+        return self.directory / namespace / f"{self._key(url, params)}.json"
+
+    def load(
+        self, namespace: str, url: str, params: Optional[Dict[str, Any]] = None
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Load a cache entry.
+
+        Args:
+            namespace: Endpoint namespace (e.g. ``"submissions"``)
+            url: Request URL
+            params: Optional query parameters
+
+        Returns:
+            Entry with ``data``, ``stored_at`` and ``last_modified`` keys, or
+            None if missing or unreadable
+        """
+        path = self._path(namespace, url, params)
+        try:
+            if ORJSON_AVAILABLE:
+                return orjson.loads(path.read_bytes())  # type: ignore[no-any-return]
+            with path.open("r", encoding="utf-8") as f:
+                return json.load(f)  # type: ignore[no-any-return]
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable cache entry {path}: {str(e)}")
+            return None
+
+    def store(
+        self,
+        namespace: str,
+        url: str,
+        data: Any,
+        params: Optional[Dict[str, Any]] = None,
+        last_modified: Optional[str] = None,
+    ) -> None:
+        """
+        Store a cache entry.
+
+        The entry is written to a temporary file and moved into place so a
+        concurrent reader never sees a partial file.
+
+        Args:
+            namespace: Endpoint namespace (e.g. ``"submissions"``)
+            url: Request URL
+            data: JSON-serializable response data
+            params: Optional query parameters
+            last_modified: ``Last-Modified`` header returned by the server
+        """
+        path = self._path(namespace, url, params)
+        entry = {
+            "url": url,
+            "stored_at": time.time(),
+            "last_modified": last_modified,
+            "data": data,
+        }
+        tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            with tmp_path.open("w", encoding="utf-8") as f:
+                json.dump(entry, f)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.warning(f"Failed to write cache entry {path}: {str(e)}")
+
+    def get_or_fetch(
+        self,
+        namespace: str,
+        url: str,
+        fetch: Fetcher,
+        params: Optional[Dict[str, Any]] = None,
+        ttl: Optional[float] = None,
+    ) -> Any:
+        """
+        Return cached data, fetching (or revalidating) it when needed.
+
+        Args:
+            namespace: Endpoint namespace (e.g. ``"submissions"``)
+            url: Request URL
+            fetch: Callback performing the request, see ``Fetcher``
+            params: Optional query parameters
+            ttl: Seconds an entry stays fresh; None never expires
+
+        Returns:
+            Response data
+        """
+        entry = self.load(namespace, url, params)
+        if entry is not None:
+            age = time.time() - entry.get("stored_at", 0)
+            if ttl is None or age < ttl:
+                logger.debug(f"Cache hit for {url}")
+                return entry["data"]
+
+        result = fetch(entry.get("last_modified") if entry else None)
+
+        if result is None and entry is not None:
+            logger.debug(f"Cache revalidated for {url}")
+            data, last_modified = entry["data"], entry.get("last_modified")
+        elif result is None:
+            # 304 without a local copy should not happen; refetch unconditionally
+            result = fetch(None)
+            data, last_modified = result if result is not None else (None, None)
+        else:
+            data, last_modified = result
+
+        self.store(namespace, url, data, params, last_modified)
+        return data
+
+    def clear(self, namespace: Optional[str] = None) -> None:
+        """
+        Remove cached entries.
+
+        Args:
+            namespace: Only clear this namespace (default: all namespaces)
+        """
+        root = self.directory / namespace if namespace else self.directory
+        if not root.exists():
+            return
+        for path in root.rglob("*.json"):
+            path.unlink()
@@ -0,0 +1,22 @@
+"""CIK formatting helpers."""
+
+from __future__ import annotations
+
+from typing import Union
+
+
+def pad_cik(cik: Union[str, int]) -> str:
+    """
+    Format a CIK as the 10-digit zero-padded string used by SEC URLs.
+
+    Args:
+        cik: Company CIK number (string or int)
+
+    Returns:
+        Zero-padded 10-digit CIK string
+
+    Example:
+        >>> pad_cik(320193)
+        '0000320193'
+    """
+    return str(cik).zfill(10)
@@ -4,6 +4,16 @@ from __future__ import annotations
 
 from typing import Any, Dict, List, Optional
 
+try:
+    import numpy as np
+
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+# Below this many filings a plain Python scan beats building NumPy arrays
+VECTORIZE_MIN_FILINGS = 256
+
 
 class FilingFilter:
     """Utility class for filtering SEC filing data."""
@@ -41,6 +51,35 @@ class FilingFilter:
             return filings
 
         num_filings = len(filings["accessionNumber"])
+
+        if NUMPY_AVAILABLE and num_filings >= VECTORIZE_MIN_FILINGS:
+            filtered_indices = FilingFilter._match_vectorized(
+                filings, form_type, from_date, to_date
+            )
+        else:
+            filtered_indices = FilingFilter._match_loop(
+                filings, num_filings, form_type, from_date, to_date
+            )
+
+        # Create filtered result
+        result = {}
+        for key, values in filings.items():
+            if isinstance(values, list) and len(values) == num_filings:
+                result[key] = [values[i] for i in filtered_indices]
+            else:
+                result[key] = values
+
+        return result
+
+    @staticmethod
+    def _match_loop(
+        filings: Dict[str, List[Any]],
+        num_filings: int,
+        form_type: Optional[str],
+        from_date: Optional[str],
+        to_date: Optional[str],
+    ) -> List[int]:
+        """Return indices of matching filings using a row-by-row scan."""
         filtered_indices = []
 
         for i in range(num_filings):
@@ -61,12 +100,27 @@ class FilingFilter:
             if include:
                 filtered_indices.append(i)
 
-        # Create filtered result
-        result = {}
-        for key, values in filings.items():
-            if isinstance(values, list) and len(values) == num_filings:
-                result[key] = [values[i] for i in filtered_indices]
-            else:
-                result[key] = values
+        return filtered_indices
 
-        return result
+    @staticmethod
+    def _match_vectorized(
+        filings: Dict[str, List[Any]],
+        form_type: Optional[str],
+        from_date: Optional[str],
+        to_date: Optional[str],
+    ) -> List[int]:
+        """Return indices of matching filings using NumPy boolean masks."""
+        mask = np.ones(len(filings["accessionNumber"]), dtype=bool)
+
+        if form_type:
+            mask &= np.asarray(filings["form"], dtype=str) == form_type
+
+        if from_date or to_date:
+            # ISO dates order lexicographically, matching the scalar comparison
+            dates = np.asarray(filings["filingDate"], dtype=str)
+            if from_date:
+                mask &= dates >= from_date
+            if to_date:
+                mask &= dates <= to_date
+
+        return np.flatnonzero(mask).tolist()  # type: ignore[no-any-return]
@@ -2,24 +2,52 @@
 
 from __future__ import annotations
 
+import asyncio
+import functools
+import io
 import logging
+import threading
 import time
-from typing import Any, Dict, Optional
+from contextlib import contextmanager, suppress
+from typing import IO, Any, Dict, Iterator, Optional, Tuple, Type
 
 import requests
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
 
+try:
+    import httpx
+
+    HTTPX_AVAILABLE = True
+except ImportError:
+    httpx = None
+    HTTPX_AVAILABLE = False
+
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    orjson = None
+    ORJSON_AVAILABLE = False
+
 from ..exceptions import (
     AuthenticationError,
     NotFoundError,
     RateLimitError,
     SecEdgarApiError,
 )
+from .cache import FileCache
 
 # Configure module logger
 logger = logging.getLogger(__name__)
 
+_TRANSPORT_ERRORS: Tuple[Type[Exception], ...] = (
+    (requests.exceptions.RequestException, httpx.HTTPError)
+    if HTTPX_AVAILABLE
+    else (requests.exceptions.RequestException,)
+)
+
 
 class HttpClient:
     """
@@ -30,30 +58,53 @@ class HttpClient:
     - Automatic retry logic for transient failures
     - Proper error handling and status code management
     - Required headers for SEC EDGAR API access
+    - Persistent connection pooling, with optional HTTP/2 via httpx
 
     Args:
         user_agent: Required user agent string with contact information
-        rate_limit_delay: Minimum delay between requests in seconds
+        rate_limit_delay: Minimum delay between requests in seconds, on average
+        rate_limit_burst: Requests that may be sent back to back after an idle
+            period (default 1: every request waits ``rate_limit_delay``)
         max_retries: Maximum number of retry attempts
         timeout: Request timeout in seconds
+        http2: Use an HTTP/2 ``httpx.Client`` instead of ``requests`` (requires
+            ``httpx[http2]``)
+        max_connections: Maximum number of pooled connections
+        cache: Optional on-disk cache used by ``get_cached``
 
     Example:
         >>> client = HttpClient("MyApp/1.0 (contact@example.com)")
         >>> data = client.get("https://data.sec.gov/api/xbrl/companyfacts/CIK0000320193.json")
+        >>> client.close()
     """
 
     def __init__(
         self,
         user_agent: str,
         rate_limit_delay: float = 0.1,
+        rate_limit_burst: int = 1,
         max_retries: int = 3,
         timeout: int = 30,
+        http2: bool = False,
+        max_connections: int = 10,
+        cache: Optional[FileCache] = None,
     ) -> None:
         """Initialize HTTP client."""
         self.user_agent = user_agent
+        self.cache = cache
         self.rate_limit_delay = rate_limit_delay
+        self.rate_limit_burst = rate_limit_burst
         self.timeout = timeout
-        self._last_request_time = 0.0
+        # Token bucket shared by sync and async requests from every thread
+        self._rate_lock = threading.Lock()
+        self._tokens = float(rate_limit_burst)
+        self._tokens_updated = time.monotonic()
+        self._http2_client: Optional[Any] = None
+        self._http2 = http2
+        self._max_retries = max_retries
+        self._max_connections = max_connections
+        self._async_client: Optional[Any] = None
+        self._async_lock: Optional[asyncio.Lock] = None
 
         # Configure session with retry strategy
         self.session = requests.Session()
@@ -62,7 +113,11 @@ class HttpClient:
             backoff_factor=1.0,
             status_forcelist=[429, 500, 502, 503, 504],
         )
-        adapter = HTTPAdapter(max_retries=retry_strategy)
+        adapter = HTTPAdapter(
+            max_retries=retry_strategy,
+            pool_connections=max_connections,
+            pool_maxsize=max_connections,
+        )
         self.session.mount("http://", adapter)
         self.session.mount("https://", adapter)
 
@@ -75,19 +130,209 @@ class HttpClient:
             }
         )
 
+        if http2 and HTTPX_AVAILABLE:
+            # One multiplexed connection pool shared by every request. httpx
+            # only applies ``limits`` given to the transport itself, and raises
+            # ImportError here when it was installed without h2
+            with suppress(ImportError):
+                self._http2_client = httpx.Client(
+                    http2=True,
+                    headers=dict(self.session.headers),
+                    timeout=timeout,
+                    transport=httpx.HTTPTransport(
+                        http2=True,
+                        retries=max_retries,
+                        limits=httpx.Limits(
+                            max_connections=max_connections,
+                            max_keepalive_connections=max_connections,
+                        ),
+                    ),
+                )
+        if http2 and self._http2_client is None:
+            self._http2 = False
+            logger.warning(
+                "HTTP/2 requested but httpx[http2] is not installed. "
+                "Install httpx[http2] to enable HTTP/2; falling back to requests."
+            )
+
         logger.info(f"HTTP client initialized with User-Agent: {user_agent}")
 
+    def close(self) -> None:
+        """Close pooled connections held by the client."""
+        if self._http2_client is not None:
+            self._http2_client.close()
+        self.session.close()
+
+    async def aclose(self) -> None:
+        """Close the async connection pool opened by ``aget``, if any."""
+        if self._async_client is not None:
+            await self._async_client.aclose()
+            self._async_client = None
+        # The lock belongs to the event loop that created it
+        self._async_lock = None
+
+    def __enter__(self) -> HttpClient:
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def _reserve_request(self) -> float:
+        """
+        Take a token from the rate-limit bucket.
+
+        Tokens refill at one per ``rate_limit_delay`` up to
+        ``rate_limit_burst``. A request that finds the bucket empty still
+        takes its token, leaving a debt, so concurrent callers are handed
+        successive slots instead of all waking at once.
+
+        Returns:
+            Seconds to wait before sending the request
+        """
+        delay = self.rate_limit_delay
+        if delay <= 0:
+            return 0.0
+
+        with self._rate_lock:
+            now = time.monotonic()
+            tokens = min(
+                float(self.rate_limit_burst),
+                self._tokens + (now - self._tokens_updated) / delay,
+            )
+            self._tokens = tokens - 1.0
+            self._tokens_updated = now
+
+        return 0.0 if tokens >= 1.0 else (1.0 - tokens) * delay
+
     def _rate_limit(self) -> None:
         """Enforce rate limiting between requests."""
-        current_time = time.time()
-        elapsed = current_time - self._last_request_time
-
-        if elapsed < self.rate_limit_delay:
-            sleep_time = self.rate_limit_delay - elapsed
+        sleep_time = self._reserve_request()
+        if sleep_time > 0:
             logger.debug(f"Rate limiting: sleeping for {sleep_time:.3f} seconds")
             time.sleep(sleep_time)
 
-        self._last_request_time = time.time()
+    def _request(
+        self,
+        url: str,
+        params: Optional[Dict[str, Any]] = None,
+        **kwargs: Any,
+    ) -> Any:
+        """Issue a rate-limited GET request and map HTTP errors to exceptions."""
+        self._rate_limit()
+
+        try:
+            if self._http2_client is not None:
+                response = self._http2_client.get(url, params=params, **kwargs)
+            else:
+                response = self.session.get(
+                    url,
+                    params=params,
+                    timeout=self.timeout,
+                    **kwargs,
+                )
+
+            try:
+                self._check_response(response, url)
+            except Exception:
+                # Release a streamed connection back to the pool right away
+                response.close()
+                raise
+            return response
+
+        except _TRANSPORT_ERRORS as e:
+            logger.error(f"Request failed for {url}: {str(e)}")
+            raise SecEdgarApiError(f"API request failed: {str(e)}") from e
+
+    @staticmethod
+    def _check_response(response: Any, url: str) -> None:
+        """Map HTTP error status codes to exceptions."""
+        if response.status_code == 429:
+            raise RateLimitError(
+                "Rate limit exceeded. Please reduce request frequency."
+            )
+        elif response.status_code == 401:
+            raise AuthenticationError(
+                "Authentication failed. Ensure User-Agent header is set correctly."
+            )
+        elif response.status_code == 404:
+            raise NotFoundError(f"Resource not found: {url}")
+
+        response.raise_for_status()
+
+    def _get_async_client(self) -> Any:
+        """Return the shared ``httpx.AsyncClient``, creating it on first use."""
+        if self._async_client is None:
+            self._async_client = httpx.AsyncClient(
+                http2=self._http2,
+                headers=dict(self.session.headers),
+                timeout=self.timeout,
+                # ``limits`` only take effect when given to the transport
+                transport=httpx.AsyncHTTPTransport(
+                    http2=self._http2,
+                    retries=self._max_retries,
+                    limits=httpx.Limits(
+                        max_connections=self._max_connections,
+                        max_keepalive_connections=self._max_connections,
+                    ),
+                ),
+            )
+        return self._async_client
+
+    async def _arate_limit(self) -> None:
+        """Enforce rate limiting between concurrent async requests."""
+        sleep_time = self._reserve_request()
+        if sleep_time > 0:
+            await asyncio.sleep(sleep_time)
+
+    async def aget(
+        self,
+        url: str,
+        params: Optional[Dict[str, Any]] = None,
+        **kwargs: Any,
+    ) -> Dict[str, Any]:
+        """
+        Make an asynchronous HTTP GET request with rate limiting.
+
+        Concurrent calls share one ``httpx.AsyncClient`` connection pool and
+        the client's rate limit. Without httpx, the synchronous ``get`` runs in
+        a worker thread, one request at a time. Call ``aclose`` before the
+        event loop finishes.
+
+        Args:
+            url: The URL to request
+            params: Optional query parameters
+            **kwargs: Additional arguments to pass to httpx
+
+        Returns:
+            Parsed JSON response
+
+        Raises:
+            RateLimitError: If rate limit is exceeded
+            AuthenticationError: If authentication fails
+            NotFoundError: If resource is not found
+            SecEdgarApiError: For other API errors
+
+        Example:
+            >>> data = await client.aget("https://data.sec.gov/submissions/CIK0000320193.json")
+        """
+        if not HTTPX_AVAILABLE:
+            if self._async_lock is None:
+                self._async_lock = asyncio.Lock()
+            async with self._async_lock:
+                return await asyncio.get_event_loop().run_in_executor(
+                    None, functools.partial(self.get, url, params, **kwargs)
+                )
+
+        await self._arate_limit()
+
+        try:
+            response = await self._get_async_client().get(url, params=params, **kwargs)
+            self._check_response(response, url)
+        except _TRANSPORT_ERRORS as e:
+            logger.error(f"Request failed for {url}: {str(e)}")
+            raise SecEdgarApiError(f"API request failed: {str(e)}") from e
+
+        return self._decode_json(response, url)
 
     def get(
         self,
@@ -112,34 +357,86 @@ class HttpClient:
             NotFoundError: If resource is not found
             SecEdgarApiError: For other API errors
         """
-        self._rate_limit()
+        return self._decode_json(self._request(url, params, **kwargs), url)
 
+    @staticmethod
+    def _decode_json(response: Any, url: str) -> Dict[str, Any]:
+        """Decode a JSON response body, with orjson when it is installed."""
         try:
-            response = self.session.get(
-                url,
-                params=params,
-                timeout=self.timeout,
-                **kwargs,
-            )
+            if ORJSON_AVAILABLE:
+                return orjson.loads(response.content)  # type: ignore[no-any-return]
+            return response.json()  # type: ignore[no-any-return]
+        except ValueError as e:
+            # orjson.JSONDecodeError subclasses ValueError as well
+            logger.error(f"Invalid JSON response from {url}: {str(e)}")
+            raise SecEdgarApiError(f"API request failed: {str(e)}") from e
 
-            if response.status_code == 429:
-                raise RateLimitError(
-                    "Rate limit exceeded. Please reduce request frequency."
-                )
-            elif response.status_code == 401:
-                raise AuthenticationError(
-                    "Authentication failed. Ensure User-Agent header is set correctly."
-                )
-            elif response.status_code == 404:
-                raise NotFoundError(f"Resource not found: {url}")
+    def get_if_modified(
+        self,
+        url: str,
+        params: Optional[Dict[str, Any]] = None,
+        last_modified: Optional[str] = None,
+        **kwargs: Any,
+    ) -> Optional[Tuple[Dict[str, Any], Optional[str]]]:
+        """
+        Make a conditional HTTP GET request.
 
-            response.raise_for_status()
+        Args:
+            url: The URL to request
+            params: Optional query parameters
+            last_modified: ``Last-Modified`` value of a previously fetched copy,
+                sent as ``If-Modified-Since``
+            **kwargs: Additional arguments to pass to requests
 
-            return response.json()  # type: ignore[no-any-return]
+        Returns:
+            Tuple of parsed JSON response and its ``Last-Modified`` header, or
+            None if the server answered ``304 Not Modified``
+        """
+        if last_modified:
+            kwargs["headers"] = {
+                **(kwargs.get("headers") or {}),
+                "If-Modified-Since": last_modified,
+            }
 
-        except requests.exceptions.RequestException as e:
-            logger.error(f"Request failed for {url}: {str(e)}")
-            raise SecEdgarApiError(f"API request failed: {str(e)}") from e
+        response = self._request(url, params, **kwargs)
+        if response.status_code == 304:
+            return None
+
+        data = self._decode_json(response, url)
+        return data, response.headers.get("Last-Modified")
+
+    def get_cached(
+        self,
+        url: str,
+        namespace: str,
+        ttl: Optional[float] = None,
+        params: Optional[Dict[str, Any]] = None,
+    ) -> Dict[str, Any]:
+        """
+        Make HTTP GET request through the on-disk cache, if one is configured.
+
+        Expired entries are revalidated with ``If-Modified-Since`` so an
+        unchanged resource costs a ``304`` instead of a full download.
+
+        Args:
+            url: The URL to request
+            namespace: Cache namespace, usually the endpoint name
+            ttl: Seconds a cached response stays fresh; None never expires
+            params: Optional query parameters
+
+        Returns:
+            Parsed JSON response
+        """
+        if self.cache is None:
+            return self.get(url, params)
+
+        return self.cache.get_or_fetch(  # type: ignore[no-any-return]
+            namespace,
+            url,
+            lambda last_modified: self.get_if_modified(url, params, last_modified),
+            params=params,
+            ttl=ttl,
+        )
 
     def get_raw(
         self,
@@ -164,31 +461,51 @@ class HttpClient:
             NotFoundError: If resource is not found
             SecEdgarApiError: For other API errors
         """
-        self._rate_limit()
+        return self._request(url, params, **kwargs).content
 
-        try:
-            response = self.session.get(
-                url,
-                params=params,
-                timeout=self.timeout,
-                **kwargs,
-            )
+    @contextmanager
+    def stream(
+        self,
+        url: str,
+        params: Optional[Dict[str, Any]] = None,
+        **kwargs: Any,
+    ) -> Iterator[IO[bytes]]:
+        """
+        Make HTTP GET request and expose the body as a file-like stream.
 
-            if response.status_code == 429:
-                raise RateLimitError(
-                    "Rate limit exceeded. Please reduce request frequency."
-                )
-            elif response.status_code == 401:
-                raise AuthenticationError(
-                    "Authentication failed. Ensure User-Agent header is set correctly."
-                )
-            elif response.status_code == 404:
-                raise NotFoundError(f"Resource not found: {url}")
+        The body is decoded (gzip/deflate) on the fly and never buffered in
+        full, which makes it suitable for incremental parsers. The HTTP/2
+        client (``http2=True``) is the exception: httpx reads the whole body
+        before it is yielded as an in-memory stream.
 
-            response.raise_for_status()
+        Args:
+            url: The URL to request
+            params: Optional query parameters
+            **kwargs: Additional arguments to pass to requests
 
-            return response.content
+        Yields:
+            Readable binary file-like object over the response body
 
-        except requests.exceptions.RequestException as e:
-            logger.error(f"Request failed for {url}: {str(e)}")
-            raise SecEdgarApiError(f"API request failed: {str(e)}") from e
+        Raises:
+            RateLimitError: If rate limit is exceeded
+            AuthenticationError: If authentication fails
+            NotFoundError: If resource is not found
+            SecEdgarApiError: For other API errors
+
+        Example:
+            >>> with client.stream("https://www.sec.gov/files/company_tickers.json") as body:
+            ...     first_chunk = body.read(1024)
+            >>> with client.stream(form4_xml_url) as body:
+            ...     form = Form4Parser.parse_all_streaming(body)
+        """
+        if self._http2_client is not None:
+            # httpx responses are read eagerly by ``_request``
+            yield io.BytesIO(self._request(url, params, **kwargs).content)
+            return
+
+        response = self._request(url, params, stream=True, **kwargs)
+        response.raw.decode_content = True
+        try:
+            yield response.raw
+        finally:
+            response.close()
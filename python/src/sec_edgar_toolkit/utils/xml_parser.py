@@ -8,7 +8,9 @@ namespace support, and XPath functionality when lxml is available.
 from __future__ import annotations
 
 import logging
-from typing import Any, Dict, List, Optional, Union
+import re
+from functools import lru_cache
+from typing import IO, Any, Dict, Iterator, List, Optional, Tuple, Union
 
 try:
     from lxml import etree
@@ -24,6 +26,16 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+_XML_DECLARATION_RE = re.compile(r"\A\s*<\?xml\b[^>]*\?>")
+
+
+@lru_cache(maxsize=256)
+def _compile_xpath(
+    expression: str, namespaces: Optional[Tuple[Tuple[str, str], ...]]
+) -> Any:
+    """Compile an XPath expression once per expression and namespace map."""
+    return etree.XPath(expression, namespaces=dict(namespaces) if namespaces else None)
+
 
 class EnhancedXMLParser:
     """
@@ -43,6 +55,8 @@ class EnhancedXMLParser:
         remove_blank_text: bool = True,
         huge_tree: bool = False,
         encoding: Optional[str] = None,
+        resolve_entities: bool = True,
+        collect_ids: bool = True,
     ):
         """
         Initialize the XML parser.
@@ -52,11 +66,16 @@ class EnhancedXMLParser:
             remove_blank_text: Remove blank text nodes (lxml only)
             huge_tree: Enable parsing of huge documents (lxml only)
             encoding: Force specific encoding
+            resolve_entities: Replace entity references by their values
+                (lxml only)
+            collect_ids: Index ID attributes for ``getelementbyid`` (lxml only)
         """
         self.recover = recover
         self.remove_blank_text = remove_blank_text
         self.huge_tree = huge_tree
         self.encoding = encoding
+        self.resolve_entities = resolve_entities
+        self.collect_ids = collect_ids
 
         if LXML_AVAILABLE:
             self.parser = etree.XMLParser(
@@ -64,6 +83,8 @@ class EnhancedXMLParser:
                 remove_blank_text=remove_blank_text,
                 huge_tree=huge_tree,
                 encoding=encoding,
+                resolve_entities=resolve_entities,
+                collect_ids=collect_ids,
             )
         else:
             self.parser = None
@@ -86,33 +107,28 @@ class EnhancedXMLParser:
         Raises:
             Exception: If parsing fails
         """
-        if isinstance(xml_content, bytes) and self.encoding is None:
-            # Try to detect encoding
-            if xml_content.startswith(b"<?xml"):
-                try:
-                    encoding_start = xml_content.find(b'encoding="') + 10
-                    encoding_end = xml_content.find(b'"', encoding_start)
-                    if encoding_start > 10 and encoding_end > encoding_start:
-                        self.encoding = xml_content[encoding_start:encoding_end].decode(
-                            "ascii"
-                        )
-                except Exception:
-                    pass
-
-        if isinstance(xml_content, bytes):
-            xml_content = xml_content.decode(self.encoding or "utf-8")
-
         if LXML_AVAILABLE:
+            if isinstance(xml_content, str):
+                # lxml rejects str input that carries an encoding declaration
+                xml_content = _XML_DECLARATION_RE.sub("", xml_content, count=1)
+            # Bytes are parsed as-is, decoded per the declaration or ``encoding``
             return etree.fromstring(xml_content, parser=self.parser)
         else:
+            if isinstance(xml_content, bytes) and self.encoding is not None:
+                xml_content = xml_content.decode(self.encoding)
             return etree.fromstring(xml_content)
 
-    def parse_file(self, file_path: str) -> Element:
+    def parse_file(self, file_path: Union[str, IO[bytes]]) -> Element:
         """
         Parse XML from file.
 
+        The file is read in chunks, so a binary stream such as the body
+        yielded by ``HttpClient.stream`` is parsed without first being
+        buffered as a whole (except on the client's HTTP/2 path, which reads
+        the body into memory). Use ``iterparse`` to avoid building the tree too.
+
         Args:
-            file_path: Path to XML file
+            file_path: Path to XML file, or a binary file object
 
         Returns:
             Parsed XML root element
@@ -122,6 +138,59 @@ class EnhancedXMLParser:
         else:
             return etree.parse(file_path).getroot()
 
+    def iterparse(
+        self,
+        source: Union[str, IO[bytes]],
+        tag: Optional[Union[str, Tuple[str, ...]]] = None,
+        events: Tuple[str, ...] = ("end",),
+    ) -> Iterator[Tuple[str, Element]]:
+        """
+        Parse XML incrementally, releasing each element once it is consumed.
+
+        After an ``end`` event for a matching element has been handled, the
+        element is cleared and the siblings before it are removed, so memory
+        stays bounded by a single record instead of growing with the file.
+        Read everything needed from an element before advancing the iterator.
+
+        Args:
+            source: Path to an XML file, or a binary file object
+            tag: Only report elements with this tag (or one of these tags)
+            events: Events to report, as for ``iterparse``
+
+        Yields:
+            Tuples of event name and element
+
+        Example:
+            >>> for _, table in parser.iterparse(path, tag="infoTable"):
+            ...     holdings.append(extract(table))
+        """
+        if LXML_AVAILABLE:
+            context = etree.iterparse(
+                source,
+                events=events,
+                tag=tag,
+                recover=self.recover,
+                remove_blank_text=self.remove_blank_text,
+                huge_tree=self.huge_tree,
+                encoding=self.encoding,
+                resolve_entities=self.resolve_entities,
+                collect_ids=self.collect_ids,
+            )
+            for event, element in context:
+                yield event, element
+                if event == "end":
+                    element.clear(keep_tail=True)
+                    while element.getprevious() is not None:
+                        del element.getparent()[0]
+        else:
+            tags = {tag} if isinstance(tag, str) else set(tag or ())
+            for event, element in etree.iterparse(source, events=events):
+                if tags and element.tag not in tags:
+                    continue
+                yield event, element
+                if event == "end":
+                    element.clear()
+
     def xpath(
         self,
         element: Element,
@@ -140,7 +209,11 @@ class EnhancedXMLParser:
             List of matching elements or values
         """
         if LXML_AVAILABLE:
-            return element.xpath(expression, namespaces=namespaces)
+            # Compiled expressions are shared by every parser and thread
+            compiled = _compile_xpath(
+                expression, tuple(namespaces.items()) if namespaces else None
+            )
+            return compiled(element)  # type: ignore[no-any-return]
         else:
             # Limited XPath support with standard library
             if expression.startswith("//"):
@@ -255,34 +328,39 @@ class EnhancedXMLParser:
         Returns:
             Dictionary representation of the element
         """
-        result = {}
+        result: Dict[Any, Any] = {}
 
         # Add attributes
-        if element.attrib:
-            result["@attributes"] = dict(element.attrib)
+        attrib = element.attrib
+        if attrib:
+            result["@attributes"] = dict(attrib)
 
         # Add text content
-        if element.text and element.text.strip():
-            result["text"] = element.text.strip()
-
-        # Add children
-        children = {}
-        for child in element:
-            child_data = self.to_dict(child)
-            if child.tag in children:
-                # Convert to list if multiple children with same tag
-                if not isinstance(children[child.tag], list):
-                    children[child.tag] = [children[child.tag]]
-                children[child.tag].append(child_data)
-            else:
-                children[child.tag] = child_data
-
-        if children:
+        text = element.text
+        if text:
+            text = text.strip()
+            if text:
+                result["text"] = text
+
+        # Add children, read each lxml property once per child; child values
+        # are never lists, so a list marks a repeated tag
+        if len(element):
+            children: Dict[Any, Any] = {}
+            for child in element:
+                child_data = self.to_dict(child)
+                tag = child.tag
+                previous = children.get(tag)
+                if previous is None:
+                    children[tag] = child_data
+                elif isinstance(previous, list):
+                    previous.append(child_data)
+                else:
+                    children[tag] = [previous, child_data]
             result.update(children)
 
         # Simplify if only text content
         if len(result) == 1 and "text" in result:
-            return result["text"]
+            return result["text"]  # type: ignore[no-any-return]
 
         return result
 
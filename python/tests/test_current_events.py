@@ -0,0 +1,238 @@
+"""Tests for current events (8-K) parser."""
+
+import os
+from datetime import datetime
+from unittest.mock import patch
+
+import pytest
+
+from sec_edgar_toolkit.parsers import current_events
+from sec_edgar_toolkit.parsers.current_events import CurrentEventParser
+
+SAMPLE_8K = """<SEC-HEADER>
+CONFORMED SUBMISSION TYPE:	8-K
+CONFORMED PERIOD OF REPORT:	20240305
+FILED AS OF DATE:		20240308
+	COMPANY DATA:
+		COMPANY CONFORMED NAME:			Example Corp
+		CENTRAL INDEX KEY:			0000012345
+	FILING VALUES:
+		FORM TYPE:		8-K
+</SEC-HEADER>
+ITEM 1.01 Entry into a Material Definitive Agreement
+On March 5, 2024 the Company entered into a definitive agreement with Acme Holdings, valued at $250 million.
+ITEM 5.02 Departure of Directors or Certain Officers
+Jane Smith was appointed Chief Financial Officer (CFO) of the Company.
+ITEM 9.01 Financial Statements and Exhibits
+Exhibit 99.1 Press release.
+"""
+
+
+class TestCurrentEventParser:
+    """Test cases for CurrentEventParser."""
+
+    @pytest.fixture
+    def parser(self):
+        """Create parser instance with a synthetic 8-K."""
+        return CurrentEventParser(SAMPLE_8K)
+
+    @pytest.fixture
+    def exxon_8k_content(self):
+        """Load 8-K fixture."""
+        fixture_path = os.path.join(
+            os.path.dirname(__file__), "fixtures", "forms", "8-K", "exxon_8k_2024.txt"
+        )
+        with open(fixture_path, encoding="utf-8") as f:
+            return f.read()
+
+    def test_parse_all_basic_info(self, parser):
+        """Test parsing of header information."""
+        result = parser.parse_all()
+
+        assert result["form_type"] == "8-K"
+        assert result["cik"] == "0000012345"
+        assert result["company_name"] == "Example Corp"
+        assert result["filing_date"] == datetime(2024, 3, 8)
+
+    def test_header_skips_invalid_anchor_values(self):
+        """Test that a header anchor without a valid value is skipped."""
+        document = "FILED AS OF DATE: pending\n" + SAMPLE_8K
+        parser = CurrentEventParser(document)
+
+        assert parser.filing_date == datetime(2024, 3, 8)
+        assert parser.header["cik"] == "0000012345"
+
+    def test_cached_header_properties(self, parser):
+        """Test header, filing date and period are computed once."""
+        assert parser.filing_date == datetime(2024, 3, 8)
+        assert parser.reporting_period == "Q1 2024"
+        assert parser.header is parser.header
+
+    def test_current_events(self, parser):
+        """Test item extraction and classification."""
+        events = parser.get_current_events()
+
+        assert [event["item"] for event in events] == [
+            "Item 1.01",
+            "Item 5.02",
+            "Item 9.01",
+        ]
+        assert events[0]["type"] == "Material Agreement"
+        assert events[0]["significance"] == "medium"
+        assert events[0]["date"] == datetime(2024, 3, 8)
+        assert events[0]["details"]["full_text"].startswith("ITEM 1.01")
+        assert "Acme Holdings" in events[0]["details"]["full_text"]
+        assert "ITEM 5.02" not in events[0]["details"]["full_text"]
+
+    def test_material_agreements(self, parser):
+        """Test material agreement extraction."""
+        agreements = parser.get_material_agreements()
+
+        assert agreements
+        assert agreements[0]["parties"] == ["Acme Holdings"]
+        assert agreements[0]["value"] == 250_000_000
+
+    def test_executive_changes(self, parser):
+        """Test executive change extraction."""
+        changes = parser.get_executive_changes()
+
+        assert changes
+        assert changes[0]["type"] == "appointment"
+        assert changes[0]["effective_date"] == datetime(2024, 3, 8)
+
+    def test_sections_are_computed_once(self, parser):
+        """Test that section accessors are cached and shared with parse_all."""
+        with patch.object(
+            parser, "_extract_section", wraps=parser._extract_section
+        ) as extract:
+            agreements = parser.material_agreements
+            assert parser.get_material_agreements() is agreements
+            assert parser.parse_all()["material_agreements"] is agreements
+            assert extract.call_count == 4
+
+        assert parser.get_current_events() is parser.events
+
+    @pytest.mark.parametrize("use_jit", [True, False])
+    def test_score_filings(self, use_jit, exxon_8k_content):
+        """Test batch keyword scoring with and without Numba."""
+        if use_jit and current_events._jit_keyword_counter() is None:
+            pytest.skip("numba not installed")
+
+        filings = [
+            "Merger and acquisition. MERGER agreement.",
+            SAMPLE_8K,
+            exxon_8k_content,
+            "",
+        ]
+        high, medium = current_events._HIGH_KEYWORDS, current_events._MEDIUM_KEYWORDS
+        expected = [
+            {
+                "high": sum(raw.lower().count(k) for k in high),
+                "medium": sum(raw.lower().count(k) for k in medium),
+            }
+            for raw in filings
+        ]
+
+        with patch.object(
+            current_events,
+            "_jit_keyword_counter",
+            current_events._jit_keyword_counter if use_jit else lambda: None,
+        ):
+            scores = CurrentEventParser.score_filings(filings)
+
+        assert scores == expected
+        assert scores[0] == {"high": 3, "medium": 1}
+
+    def test_section_anchors_match_regex_fallback(self, exxon_8k_content):
+        """Test that the Aho-Corasick section scan agrees with the regexes."""
+        if not current_events.AHOCORASICK_AVAILABLE:
+            pytest.skip("pyahocorasick not installed")
+
+        documents = [
+            SAMPLE_8K,
+            exxon_8k_content,
+            "Departure of officers\nDirector news. Results of Operations; "
+            "Definitive Agreement with Beta Corp, then a MERGER.",
+            "",
+        ]
+        for document in documents:
+            parser = CurrentEventParser(document)
+            expected = parser._search_section_starts()
+            assert parser._section_starts == expected
+            with patch.object(current_events, "AHOCORASICK_AVAILABLE", False):
+                assert CurrentEventParser(document)._section_starts == expected
+
+    def test_bytes_input(self, exxon_8k_content):
+        """Test that UTF-8 bytes and text input parse identically."""
+        non_ascii = SAMPLE_8K.replace("Example Corp", "Soci\xe9t\xe9 \u2019s Corp")
+        for document in (SAMPLE_8K, non_ascii, exxon_8k_content):
+            from_text = CurrentEventParser(document)
+            from_bytes = CurrentEventParser(document.encode("utf-8"))
+            assert from_bytes.raw_content == document
+            assert from_bytes.header == from_text.header
+            assert from_bytes.get_current_events() == from_text.get_current_events()
+
+    def test_setting_raw_content_resets_parsed_data(self, exxon_8k_content):
+        """Test that assigning raw_content invalidates cached results."""
+        parser = CurrentEventParser(SAMPLE_8K)
+        events = parser.get_current_events()
+
+        parser.raw_content = exxon_8k_content
+        assert parser.raw_content == exxon_8k_content
+        assert parser.header == CurrentEventParser(exxon_8k_content).header
+        assert parser.get_current_events() != events
+
+    def test_non_latin1_text(self):
+        """Test that token offsets survive characters outside latin-1."""
+        document = SAMPLE_8K.replace("Example Corp", "Example\u2019s Corp").replace(
+            "ITEM 9.01", "ITEM\xa09.01"
+        )
+        parser = CurrentEventParser(document)
+
+        assert parser.header["company_name"] == "Example\u2019s Corp"
+        events = parser.get_current_events()
+        assert events[-1]["item"] == "Item 9.01"
+        assert events[-1]["details"]["full_text"].startswith("ITEM\xa09.01")
+
+    def test_item_bodies_end_at_next_heading(self):
+        """Test that each item body runs up to the next item heading."""
+        document = (
+            "ITEM 1.01 Entry into a Material Definitive Agreement\n"
+            "The agreement covers several line items.\n"
+            "ITEM 1.01 Entry into a Material Definitive Agreement\n"
+            "A second agreement.\n"
+        )
+        events = CurrentEventParser(document).get_current_events()
+
+        assert [event["details"]["full_text"] for event in events] == [
+            "ITEM 1.01 Entry into a Material Definitive Agreement\n"
+            "The agreement covers several line items.\n",
+            "ITEM 1.01 Entry into a Material Definitive Agreement\n"
+            "A second agreement.",
+        ]
+
+    def test_parse_date(self, parser):
+        """Test YYYYMMDD parsing on the fast path and the fallback."""
+        assert parser._parse_date("20241231") == datetime(2024, 12, 31)
+        assert parser._parse_date("20240101") == datetime(2024, 1, 1)
+        assert parser._parse_date("20240308xx") == datetime(2024, 3, 8)
+
+    def test_section_length_is_capped(self):
+        """Test that a section without a following item is capped."""
+        document = "Definitive Agreement with Beta Corp. " + "x" * 20000
+        parser = CurrentEventParser(document)
+        parser.MAX_SECTION_LENGTH = 500
+
+        section = parser._extract_section("agreement")
+        assert section.startswith("Definitive Agreement")
+        assert len(section) == 500
+
+    def test_filing_header(self, exxon_8k_content):
+        """Test header parsing on a real 8-K filing."""
+        result = CurrentEventParser(exxon_8k_content).parse_all()
+
+        assert result["form_type"] == "8-K"
+        assert result["cik"] == "0000066740"
+        assert result["company_name"] == "3M CO"
+        assert result["filing_date"] == datetime(2024, 3, 8)
+        assert isinstance(result["acquisitions"], list)
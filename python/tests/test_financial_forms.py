@@ -1,12 +1,49 @@
 """Tests for financial forms parser."""
 
 import os
+import re
 from datetime import datetime
+from unittest.mock import patch
 
 import pytest
 
+from sec_edgar_toolkit.parsers import financial_forms
 from sec_edgar_toolkit.parsers.financial_forms import FinancialFormParser
 
+SAMPLE_10K = """<SEC-HEADER>
+CONFORMED SUBMISSION TYPE:	10-K
+CONFORMED PERIOD OF REPORT:	20231231
+FILED AS OF DATE:		20240215
+</SEC-HEADER>
+<DOCUMENT>
+CONSOLIDATED BALANCE SHEETS (December 31, 2023)
+Cash and other current assets $1,200
+Property, plant and equipment, net $3,400
+Total liabilities $2,100
+Retained earnings $900
+</DOCUMENT>
+<DOCUMENT>
+CONSOLIDATED STATEMENTS OF OPERATIONS (Fiscal 2023)
+Net sales $5,000
+Gross profit $2,000
+Research and development $700
+</DOCUMENT>
+"""
+
+SAMPLE_IXBRL = """<XBRL>
+<html xmlns:ix="http://www.xbrl.org/2013/inlineXBRL"><body>
+<p>Revenue <ix:nonFraction name="us-gaap:Revenues" contextRef="c-2023"
+ unitRef="usd" decimals="-6">383,285</ix:nonFraction></p>
+<p>Shares <ix:nonFraction unitRef="shares" decimals="0" contextRef="c-2023"
+ name="dei:EntityCommonStockSharesOutstanding">15,552,752</ix:nonFraction></p>
+<p>Impairment <ix:nonFraction name="us-gaap:Impairment" contextRef="c-2022"
+ unitRef="usd" decimals="-6" format="ixt:fixed-zero">\u2014</ix:nonFraction></p>
+<p>Segments <ix:nonFraction name="us-gaap:Segments" contextRef="c-2023"
+ unitRef="number" decimals="INF" format="ixt-sec:numwordsen">five</ix:nonFraction></p>
+</body></html>
+</XBRL>
+"""
+
 
 class TestFinancialFormParser:
     """Test cases for FinancialFormParser."""
@@ -29,6 +66,253 @@ class TestFinancialFormParser:
         """Create parser instance with Apple 10-K data."""
         return FinancialFormParser(apple_10k_content)
 
+    def test_statement_line_items(self):
+        """Test that line items capture their dollar amounts."""
+        parser = FinancialFormParser(SAMPLE_10K)
+
+        balance_sheet = parser.parse_balance_sheet()
+        assert balance_sheet["assets"]["current_assets"][0]["value"] == 1200.0
+        assert balance_sheet["assets"]["non_current_assets"][0]["label"] == (
+            "Property, plant and equipment, net"
+        )
+        assert balance_sheet["liabilities"]["total_liabilities"]["value"] == 2100.0
+        assert balance_sheet["equity"]["retained_earnings"]["period"] == "2023"
+
+        income_statement = parser.parse_income_statement()
+        assert income_statement["revenue"]["value"] == 5000.0
+        assert income_statement["gross_profit"]["value"] == 2000.0
+        assert [item["value"] for item in income_statement["operating_expenses"]] == [
+            700.0
+        ]
+        assert income_statement["revenue"]["filed"] == datetime(2024, 2, 15)
+
+    def test_parse_number(self):
+        """Test number parsing of displayed amounts."""
+        parser = FinancialFormParser("")
+
+        assert parser._parse_number("$1,234") == 1234.0
+        assert parser._parse_number("$ 1,234.5") == 1234.5
+        assert parser._parse_number("(1,234)") == -1234.0
+        assert parser._parse_number("$") == 0.0
+        assert parser._parse_number("") == 0.0
+
+    def test_parse_date(self):
+        """Test YYYYMMDD parsing on the fast path and the fallback."""
+        parser = FinancialFormParser(SAMPLE_10K)
+
+        assert parser._parse_date("20231231") == datetime(2023, 12, 31)
+        assert parser._parse_date("20240101") == datetime(2024, 1, 1)
+        assert parser._parse_date("20240215xx") == datetime(2024, 2, 15)
+        assert parser.filing_date is parser.filing_date
+
+    def test_sections_are_computed_once(self):
+        """Test that parse_all reuses the cached statements and sections."""
+        parser = FinancialFormParser(SAMPLE_10K)
+
+        with patch.object(
+            parser, "_extract_statement_items", wraps=parser._extract_statement_items
+        ) as extract:
+            balance_sheet = parser.parse_balance_sheet()
+            result = parser.parse_all()
+            parser.parse_all()
+
+        assert extract.call_count == 3
+        assert result["balance_sheet"] is balance_sheet
+        assert parser.get_risk_factors() is parser.risk_factors
+        assert parser.header["filing_date"] is parser.filing_date
+
+    def test_split_before_matches_re_split(self):
+        """Test that boundary slicing gives the pieces re.split gave."""
+        text = "Intro\n\n\n12. First • second ·third\n\n1.2.3. done"
+        pieces = list(
+            financial_forms._split_before(financial_forms._RISK_BOUNDARY_RE, text)
+        )
+
+        assert [p for p in pieces if p] == [
+            p for p in re.split(r"(?=•|·|\d+\.|\n\n)", text) if p
+        ]
+        assert "".join(pieces) == text
+
+    def test_risk_factors_are_limited(self):
+        """Test that risk factor extraction stops after ten factors."""
+        factors = "".join(
+            f"{i}. Competition could reduce our margins and market share over time.\n"
+            for i in range(1, 31)
+        )
+        parser = FinancialFormParser("RISK FACTORS\n" + factors)
+
+        with patch.object(
+            parser, "_classify_risk", wraps=parser._classify_risk
+        ) as classify:
+            risk_factors = parser.get_risk_factors()
+
+        assert len(risk_factors) == 10
+        assert classify.call_count == 10
+        assert risk_factors[0]["description"].startswith("1. Competition")
+
+    def test_section_title(self):
+        """Test that the title is the first line of a plausible length."""
+        parser = FinancialFormParser("")
+
+        assert (
+            parser._extract_section_title(
+                "\nShort\n  Results of Operations  \nBody text\n" * 500
+            )
+            == "Results of Operations"
+        )
+        assert (
+            parser._extract_section_title("a\nb\nc\nd\ne\nFiscal 2023 Highlights\n")
+            == "Management Discussion"
+        )
+
+    def test_parallel_parse_all(self):
+        """Test that the thread pool path gives the sequential result."""
+        sequential = FinancialFormParser(SAMPLE_10K + SAMPLE_IXBRL).parse_all()
+        parser = FinancialFormParser(SAMPLE_10K + SAMPLE_IXBRL)
+
+        with patch.dict(
+            os.environ, {financial_forms.PARALLEL_ENV_VAR: "1"}
+        ), patch.object(
+            parser,
+            "_compute_sections_parallel",
+            wraps=parser._compute_sections_parallel,
+        ) as compute:
+            result = parser.parse_all()
+
+        compute.assert_called_once()
+        assert result == sequential
+        assert result["xbrl_facts"]
+
+    def test_section_anchors_match_regex(self, apple_10k_content):
+        """Test that literal anchor lookup finds the same start as a regex."""
+        documents = [
+            SAMPLE_10K,
+            "\u0130STANBUL OFFICE\n" + SAMPLE_10K.replace("BALANCE", "Balance"),
+            apple_10k_content,
+        ]
+        for name, anchors in financial_forms._SECTION_ANCHORS.items():
+            regex = re.compile(
+                "|".join(
+                    re.escape(anchor) if isinstance(anchor, str) else anchor.pattern
+                    for anchor in anchors
+                ),
+                re.IGNORECASE,
+            )
+            for document in documents:
+                match = regex.search(document)
+                expected = match.start() if match else -1
+                parser = FinancialFormParser(document)
+                assert parser._find_section_start(name) == expected
+
+    def test_risk_classification_matches_fallback(self, parser):
+        """Test that the Aho-Corasick risk classifier agrees with the loops."""
+        if not financial_forms.AHOCORASICK_AVAILABLE:
+            pytest.skip("pyahocorasick not installed")
+
+        texts = [
+            "Cyber attacks on customer systems could result in a material adverse "
+            "effect.",
+            "Changes in credit markets may affect our liquidity.",
+            "Supply chain disruptions could impact manufacturing.",
+            "Nothing to see here.",
+            *(factor["description"] for factor in parser.risk_factors),
+        ]
+        for text in texts:
+            expected = (
+                parser._assess_risk_severity(text),
+                parser._extract_risk_category(text),
+            )
+            assert parser._classify_risk(text) == expected
+            with patch.object(financial_forms, "AHOCORASICK_AVAILABLE", False):
+                assert parser._classify_risk(text) == expected
+
+        assert parser._classify_risk(texts[0]) == ("high", "Market Risk")
+
+    @pytest.mark.parametrize("use_lxml", [True, False])
+    def test_xbrl_facts_any_attribute_order(self, use_lxml):
+        """Test XBRL fact extraction with and without lxml."""
+        if use_lxml and not financial_forms.LXML_AVAILABLE:
+            pytest.skip("lxml not installed")
+
+        with patch.object(financial_forms, "LXML_AVAILABLE", use_lxml):
+            facts = FinancialFormParser(SAMPLE_10K + SAMPLE_IXBRL).xbrl_facts
+
+        assert [(fact["name"], fact["value"]) for fact in facts] == [
+            ("us-gaap:Revenues", 383285.0),
+            ("dei:EntityCommonStockSharesOutstanding", 15552752.0),
+            ("us-gaap:Impairment", 0.0),
+        ]
+        assert [fact["decimals"] for fact in facts] == [-6, 0, -6]
+        assert facts[1]["units"] == "shares"
+        assert facts[1]["context_ref"] == "c-2023"
+        assert facts[1]["period"] == "2023"
+
+    def test_nested_xbrl_facts_keep_their_text(self):
+        """Test that facts nested in other facts do not empty the outer ones."""
+        if not financial_forms.LXML_AVAILABLE:
+            pytest.skip("lxml not installed")
+
+        document = SAMPLE_10K + (
+            '<html xmlns:ix="http://www.xbrl.org/2013/inlineXBRL"><body><p>'
+            '<ix:nonFraction name="us-gaap:Assets" contextRef="c-2023" '
+            'unitRef="usd" decimals="-6"><ix:nonFraction name="us-gaap:Total" '
+            'contextRef="c-2023" unitRef="usd" decimals="-6">352,583'
+            "</ix:nonFraction></ix:nonFraction>"
+            '<ix:nonNumeric name="us-gaap:Note" contextRef="c-2023">Debt of '
+            '<ix:nonFraction name="us-gaap:Debt" contextRef="c-2023" '
+            'unitRef="usd" decimals="-6">95,281</ix:nonFraction> million'
+            "</ix:nonNumeric></p></body></html>"
+        )
+        facts = FinancialFormParser(document).xbrl_facts
+
+        assert [(fact["name"], fact["value"]) for fact in facts] == [
+            ("us-gaap:Total", 352583.0),
+            ("us-gaap:Assets", 352583.0),
+            ("us-gaap:Debt", 95281.0),
+        ]
+
+    def test_xbrl_facts_from_filing(self, parser):
+        """Test that facts are found on a real inline XBRL filing."""
+        facts = parser.get_xbrl_facts()
+
+        assert len(facts) > 900
+        assert all(fact["name"] and fact["context_ref"] for fact in facts)
+
+    def test_bytes_input(self):
+        """Test that bytes and text input parse identically."""
+        document = SAMPLE_10K + SAMPLE_IXBRL
+        from_bytes = FinancialFormParser(document.encode("utf-8"))
+
+        assert from_bytes.raw_content == document
+        assert from_bytes.parse_all() == FinancialFormParser(document).parse_all()
+
+        invalid = FinancialFormParser(b"\xff" + document.encode("utf-8"))
+        assert invalid.raw_content == document
+        assert invalid.xbrl_facts == from_bytes.xbrl_facts
+
+    def test_re2_patterns_match_re(self, apple_10k_content):
+        """Test that the RE2 patterns find the same matches as ``re``."""
+        if not financial_forms.RE2_AVAILABLE:
+            pytest.skip("google-re2 not installed")
+
+        patterns = [
+            *financial_forms._STATEMENT_PATTERNS.values(),
+            financial_forms._XBRL_TAG_RE,
+        ]
+        documents = [SAMPLE_10K, apple_10k_content[:2_000_000]]
+        for pattern in patterns:
+            with patch.object(financial_forms, "RE2_AVAILABLE", False):
+                fallback = financial_forms._compile_linear(pattern.pattern)
+            for document in documents:
+                expected = [
+                    (m.span(), m.lastgroup, m.groups())
+                    for m in fallback.finditer(document)
+                ]
+                assert [
+                    (m.span(), m.lastgroup, m.groups())
+                    for m in pattern.finditer(document)
+                ] == expected
+
     def test_parse_all_basic_info(self, parser):
         """Test parsing of basic document information."""
         result = parser.parse_all()
@@ -125,6 +409,25 @@ class TestFinancialFormParser:
             if value is not None:
                 assert isinstance(value, (int, float))
 
+    def test_financial_metrics_reuse_statements(self):
+        """Test that metrics are cached and accept parsed statements."""
+        parser = FinancialFormParser(SAMPLE_10K)
+        metrics = parser.get_financial_metrics()
+
+        assert parser.financial_metrics is metrics
+        assert parser.parse_all()["financial_metrics"] is metrics
+
+        balance_sheet = parser.balance_sheet
+        other = FinancialFormParser("")
+        with patch.object(
+            other, "_extract_statement_items", wraps=other._extract_statement_items
+        ) as extract:
+            assert (
+                other.get_financial_metrics(balance_sheet, parser.income_statement)
+                == metrics
+            )
+        extract.assert_not_called()
+
     def test_xbrl_facts(self, parser):
         """Test XBRL facts extraction."""
         xbrl_facts = parser.get_xbrl_facts()
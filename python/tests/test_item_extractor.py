@@ -0,0 +1,306 @@
+"""Tests for SEC filing item extractor."""
+
+from unittest.mock import patch
+
+import pytest
+
+from sec_edgar_toolkit.parsers import item_extractor
+from sec_edgar_toolkit.parsers.item_extractor import (
+    ExtractedItem,
+    FormType,
+    ItemDefinition,
+    ItemExtractor,
+)
+
+BODY = "The Company designs, manufactures and markets its products worldwide. " * 3
+
+SAMPLE_10K = f"""<html><body>
+<p>PART I</p>
+<h2>ITEM 1. BUSINESS</h2><p>{BODY}</p>
+
+
+<h2>ITEM 1A. RISK FACTORS</h2><p>{BODY}</p>
+<h2>ITEM 2. PROPERTIES</h2><p>None.</p>
+<h2>ITEM 3. LEGAL PROCEEDINGS</h2><p>{BODY}</p>
+</body></html>"""
+
+SAMPLE_10Q = f"""PART II. OTHER INFORMATION Item 1A. Risk Factors 20
+PART I. FINANCIAL INFORMATION
+Item 1. Financial Statements {BODY}
+Item 2. Management's Discussion and Analysis {BODY} See Part II, Item 1A.
+PART II. OTHER INFORMATION
+Item 1. Legal Proceedings {BODY}
+Item 1A. Risk Factors {BODY}
+"""
+
+SAMPLE_8K = f"""<p><b>Item 1.01</b> Entry into a Material Definitive Agreement.</p>
+<p>{BODY}</p>
+<p><b>Item 9.01</b> Financial Statements and Exhibits.</p>
+<p>{BODY}</p>"""
+
+
+class TestItemExtractor:
+    """Test cases for ItemExtractor."""
+
+    @pytest.fixture
+    def extractor(self):
+        """Create extractor instance."""
+        return ItemExtractor()
+
+    def test_extract_10k_items(self, extractor):
+        """Test item extraction from an HTML 10-K."""
+        items = extractor.extract_items(SAMPLE_10K, "10-K")
+
+        assert items["1"].startswith("ITEM 1. BUSINESS")
+        assert "<p>" not in items["1"]
+        assert "RISK FACTORS" not in items["1"]
+        assert items["1A"].startswith("ITEM 1A. RISK FACTORS")
+        assert items["2"] == "ITEM 2. PROPERTIES None."
+        assert items["3"].startswith("ITEM 3. LEGAL PROCEEDINGS")
+
+    def test_table_of_contents_entries_are_skipped(self, extractor):
+        """Test that items are taken from the body rather than the TOC."""
+        document = (
+            "TABLE OF CONTENTS Item 1A. Risk Factors Item 2. Properties PART I "
+            f"Item 1. Business {BODY * 3} Item 1A. Risk Factors {BODY} "
+            f"Item 2. Properties {BODY}"
+        )
+        items = extractor.extract_items(document, "10-K")
+
+        assert items["1A"].startswith("Item 1A. Risk Factors The Company")
+        assert items["2"].startswith("Item 2. Properties The Company")
+        assert extractor._extract_table_of_contents(document) == [("1A", 1)]
+
+    def test_titled_heading_wins_over_earlier_reference(self, extractor):
+        """Test that a heading with the item title beats a looser match."""
+        document = (
+            f"Item 1. Business See Item 7 and Item 7. below. {BODY} "
+            f"Item 7. Management's Discussion and Analysis {BODY}"
+        )
+        items = extractor.extract_items(document, "10-K")
+
+        assert items["7"].startswith("Item 7. Management's Discussion")
+
+    def test_extract_10q_items_by_part(self, extractor):
+        """Test that Part I and Part II items of a 10-Q do not collide."""
+        items = extractor.extract_items(SAMPLE_10Q, "10-Q")
+
+        assert list(items) == ["1", "2", "II.1", "II.1A"]
+        assert items["1"].startswith("Item 1. Financial Statements The Company")
+        assert items["II.1"].startswith("Item 1. Legal Proceedings The Company")
+        assert items["II.1A"].startswith("Item 1A. Risk Factors The Company")
+        assert extractor.extract_specific_items(SAMPLE_10Q, "10-Q", ["II.1A"]) == {
+            "II.1A": items["II.1A"]
+        }
+
+    def test_part_ii_references_do_not_move_the_part_boundary(self, extractor):
+        """Test that only a part followed by an item heading splits a 10-Q."""
+        reference = (
+            "There have been no material changes to the risk factors disclosed "
+            "in Part II of our Annual Report on Form 10-K."
+        )
+        document = SAMPLE_10Q.replace(
+            f"Item 1A. Risk Factors {BODY}", f"Item 1A. Risk Factors {reference}"
+        )
+        items = extractor.extract_items(document, "10-Q")
+
+        assert list(items) == ["1", "2", "II.1", "II.1A"]
+        assert items["II.1A"] == f"Item 1A. Risk Factors {reference}"
+
+    def test_10q_without_part_ii_heading(self, extractor):
+        """Test that Part II items are searched when no Part II heading exists."""
+        document = (
+            f"Item 2. Management's Discussion and Analysis {BODY} "
+            f"Item 1A. Risk Factors {BODY}"
+        )
+        items = extractor.extract_items(document, "10-Q")
+
+        assert items["2"].startswith("Item 2. Management's Discussion")
+        assert items["II.1A"].startswith("Item 1A. Risk Factors The Company")
+
+    def test_10q_without_part_ii_has_no_copied_items(self, extractor):
+        """Test that Part II items do not reuse Part I item headings."""
+        document = (
+            f"Item 1. Financial Statements {BODY} "
+            f"Item 2. Management's Discussion and Analysis {BODY} "
+            f"Item 3. Quantitative and Qualitative Disclosures {BODY} "
+            f"Item 4. Controls and Procedures {BODY}"
+        )
+        items = extractor.extract_items(document, "10-Q")
+
+        assert list(items) == ["1", "2", "3", "4"]
+        assert extractor.extract_specific_items(document, "10-Q", ["II.1"]) == {}
+
+    def test_extract_8k_items(self, extractor):
+        """Test item extraction from an 8-K."""
+        items = extractor.extract_items(SAMPLE_8K, FormType.FORM_8K)
+
+        assert items["1.01"].startswith("Item 1.01 Entry into a Material")
+        assert items["9.01"].startswith("Item 9.01 Financial Statements")
+
+    def test_filings_without_items_skip_cleaning(self, extractor):
+        """Test the early exit for filings without item headings."""
+        document = f"<p>Quarterly update</p><p>{BODY}</p>"
+
+        with patch.object(extractor, "_clean_content") as clean:
+            assert extractor.extract_items(document, "8-K") == {}
+            assert extractor.extract_items("", "10-K") == {}
+            clean.assert_not_called()
+
+        mda = f"<p>{BODY}</p><p>MD&A</p><p>{BODY}</p>"
+        assert extractor.extract_items(mda, "10-K")["7"].startswith("MD&A The")
+
+    def test_extract_specific_items(self, extractor):
+        """Test filtering the extracted items."""
+        items = extractor.extract_specific_items(SAMPLE_10K, "10-K", ["1A", "2"])
+        all_items = extractor.extract_items(SAMPLE_10K, "10-K")
+        assert items == {"1A": all_items["1A"], "2": all_items["2"]}
+
+    def test_clean_content(self, extractor):
+        """Test tag removal, whitespace collapse and item line breaks."""
+        cleaned = extractor._clean_content(
+            "<p>Intro  text</p>\n<b>Item 1.</b> Business"
+        )
+
+        assert cleaned == "Intro text \n\nItem 1. Business"
+        assert extractor._clean_content(" a\xa0<br/> \tb<i>c</i>\n") == "a b c"
+
+    def test_item_patterns_are_cached(self):
+        """Test that an item definition compiles its patterns once."""
+        item_def = ItemDefinition("7", "Management's Discussion", aliases=["MD&A"])
+        patterns = item_def.patterns
+
+        assert item_def.patterns is patterns
+        assert len(patterns) == 2
+        assert patterns[0].match("ITEM 7. management's discussion").lastgroup == (
+            "title"
+        )
+        assert patterns[0].match("Item 7. Overview").lastgroup == "heading"
+        assert patterns[0].match("Item 7: overview").lastgroup == "loose"
+        assert patterns[0].match("Item 70") is None
+        assert patterns[1].search("see md&a")
+        assert item_def == ItemDefinition(
+            "7", "Management's Discussion", aliases=["MD&A"]
+        )
+
+    def test_definitions_are_shared(self, extractor):
+        """Test that extractors share item definitions and their patterns."""
+        patterns = extractor.form_items[FormType.FORM_10K][0].patterns
+
+        assert ItemExtractor().form_items[FormType.FORM_10K][0].patterns is patterns
+        assert extractor.get_item_definitions("10-Q") is ItemExtractor.FORM_10Q_ITEMS
+
+    def test_item_end_bisection_matches_search(self, extractor):
+        """Test that precomputed boundaries give the searched item ends."""
+        content = extractor._clean_content(SAMPLE_10K + SAMPLE_8K) + (
+            " Item 7. Item 8: Back to back headings"
+        )
+        boundaries = [
+            match.start() for match in item_extractor._NEXT_ITEM_RE.finditer(content)
+        ]
+
+        for start in range(0, len(content), 7):
+            assert extractor._find_item_end(
+                content, start, [], boundaries
+            ) == extractor._find_item_end(content, start, [])
+
+    def test_long_numbers_do_not_end_items(self, extractor):
+        """Test that item-like numbers in tables are not item headings."""
+        content = f"Item 7. Overview {BODY} Item 2024: Totals 12Item 3. Costs {BODY}"
+
+        assert extractor._find_item_end(content, 0, []) == len(content)
+
+    def test_item_words_match_regex(self, extractor):
+        """Test that the literal item search finds every regex match."""
+        content = extractor._clean_content(SAMPLE_10K) + (
+            " \u0130TEM 4. \u0131tem 5: itemitem 6. ITEM\u0130tem 7."
+        )
+        expected = [
+            match.start() for match in item_extractor._ITEM_PREFIX_RE.finditer(content)
+        ]
+
+        found = [
+            pos
+            for pos in extractor._find_item_words(content)
+            if item_extractor._ITEM_PREFIX_RE.match(content, pos)
+        ]
+        assert found == expected
+        assert len(found) == 8
+
+    def test_item_breaks_match_regex(self, extractor):
+        """Test that item line breaks are inserted where the regex matches."""
+        text = "Intro ITEM 1. a \u0130tem 2. b item 3 c Item 4A. Item 5. itemitem 6."
+
+        assert extractor._clean_content(text) == (
+            item_extractor._ITEM_HEADING_RE.sub(r"\n\n\1", text)
+        )
+
+    @pytest.mark.parametrize(
+        "name,expected",
+        [
+            ("10-K", FormType.FORM_10K),
+            ("10k", FormType.FORM_10K),
+            ("10-K/A", FormType.FORM_10K),
+            ("8-K", FormType.FORM_8K),
+            ("40F", FormType.FORM_40F),
+        ],
+    )
+    def test_parse_form_type(self, extractor, name, expected):
+        """Test exact and variant form type spellings."""
+        assert extractor._parse_form_type(name) is expected
+
+    def test_parse_form_type_is_cached(self, extractor):
+        """Test that parsed form type names are cached."""
+        item_extractor._parse_form_type.cache_clear()
+        extractor._parse_form_type("10-Q/A")
+        extractor._parse_form_type("10-Q/A")
+
+        assert item_extractor._parse_form_type.cache_info().hits == 1
+
+    def test_post_process_collapses_blank_lines(self, extractor):
+        """Test that only runs of blank lines are collapsed."""
+        items = {
+            "1": ExtractedItem("1", "Business", f"Item 1.\n\n\n \n{BODY}", 0, 0),
+            "2": ExtractedItem("2", "Properties", f"\n\nItem 2. {BODY}", 0, 0),
+        }
+        processed = extractor._post_process_items(items, FormType.FORM_10K)
+
+        assert processed == {"1": f"Item 1.\n\n{BODY}", "2": f"\n\nItem 2. {BODY}"}
+
+    def test_extracted_item_has_no_dict(self):
+        """Test that extracted items use slots."""
+        item = ExtractedItem("1", "Business", "Item 1. Business", 0, 16)
+
+        assert not hasattr(item, "__dict__")
+        assert item == ExtractedItem("1", "Business", "Item 1. Business", 0, 16)
+
+    def test_re2_backend_matches_re(self, extractor):
+        """Test that the RE2 backend extracts the same items."""
+        if not item_extractor.RE2_AVAILABLE:
+            pytest.skip("google-re2 not installed")
+
+        re2_extractor = ItemExtractor(regex_backend="re2")
+        toc_document = (
+            "Table of Contents Item 1A. Risk Factors PART I "
+            f"Item 1. Business {BODY} Item 1A. Risk Factors {BODY}"
+        )
+        for document, form_type in [
+            (SAMPLE_10K, "10-K"),
+            (SAMPLE_10Q, "10-Q"),
+            (SAMPLE_8K, "8-K"),
+            (toc_document, "10-K"),
+        ]:
+            assert re2_extractor.extract_items(
+                document, form_type
+            ) == extractor.extract_items(document, form_type)
+        assert re2_extractor._extract_table_of_contents(toc_document) == [("1A", 1)]
+
+    def test_unknown_regex_backend(self):
+        """Test that unknown regex backends are rejected."""
+        with pytest.raises(ValueError):
+            ItemExtractor(regex_backend="pcre")
+
+    def test_unsupported_form_type(self, extractor):
+        """Test that unknown form types are rejected."""
+        with pytest.raises(ValueError):
+            extractor.extract_items(SAMPLE_10K, "S-1")
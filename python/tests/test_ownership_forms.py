@@ -2,14 +2,22 @@
 Tests for SEC ownership forms (Form 3, 4, and 5) XML parsing.
 """
 
+import gzip
 import os
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
+from unittest.mock import patch
+from xml.etree import ElementTree
 
 import pytest
+import responses
 
 from sec_edgar_toolkit.parsers import Form4Parser, Form5Parser, OwnershipFormParser
+from sec_edgar_toolkit.parsers import ownership_forms
 from sec_edgar_toolkit.parsers.ownership_forms import OwnershipFormParseError
+from sec_edgar_toolkit.utils import xml_parser
+from sec_edgar_toolkit.utils.http import HttpClient
 
 
 # Get the directory containing this test file
@@ -53,6 +61,79 @@ class TestOwnershipFormParser:
         parser = OwnershipFormParser(xml_bytes)
         assert parser.form_type == "4"
 
+    def test_parse_all_streaming(self, form4_xml):
+        """Test streaming parse from bytes and from a binary file."""
+        expected = OwnershipFormParser(form4_xml).parse_all()
+
+        assert OwnershipFormParser.parse_all_streaming(form4_xml.encode()) == expected
+        with open(FIXTURES_DIR / "form4_sample.xml", "rb") as f:
+            assert OwnershipFormParser.parse_all_streaming(f) == expected
+
+        with open(FIXTURES_DIR / "form4_sample.xml", "rb") as f:
+            parser = Form4Parser(f)
+        assert parser.parse_issuer_info()["name"] == "Apple Inc."
+        with pytest.raises(OwnershipFormParseError):
+            _ = parser.root
+
+    def test_parse_many(self, form4_xml, form5_xml, invalid_xml):
+        """Test parsing a batch of forms in worker processes."""
+        documents = [form4_xml, form5_xml.encode("utf-8"), form4_xml]
+        results = list(Form4Parser.parse_many(documents, workers=2, chunksize=1))
+
+        assert results == [OwnershipFormParser(doc).parse_all() for doc in documents]
+        with pytest.raises(OwnershipFormParseError):
+            list(OwnershipFormParser.parse_many([invalid_xml], workers=1))
+
+    def test_xml_parser_is_shared_per_thread(self, form4_xml, form5_xml):
+        """Test that parsers reuse one XML parser per thread."""
+        parser = OwnershipFormParser(form4_xml).parser
+        assert OwnershipFormParser(form5_xml).parser is parser
+
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            other = pool.submit(lambda: OwnershipFormParser(form4_xml).parser)
+            assert other.result() is not parser
+
+    def test_xpath_expressions_are_compiled_once(self, form4_xml):
+        """Test that EnhancedXMLParser.xpath reuses compiled expressions."""
+        parser = xml_parser.EnhancedXMLParser()
+        root = OwnershipFormParser(form4_xml).root
+        if not xml_parser.LXML_AVAILABLE:
+            pytest.skip("lxml not installed")
+
+        xml_parser._compile_xpath.cache_clear()
+        first = parser.xpath(root, "//issuerTradingSymbol/text()")
+        second = xml_parser.xpath(root, "//issuerTradingSymbol/text()")
+        namespaced = parser.xpath(root, "//x:issuer", {"x": "urn:example"})
+
+        assert first == second == ["AAPL"]
+        assert namespaced == []
+        assert xml_parser._compile_xpath.cache_info().hits == 1
+
+    def test_parse_string_honours_xml_declaration(self, form4_xml):
+        """Test parsing declared encodings from bytes and strings."""
+        parser = xml_parser.EnhancedXMLParser()
+        latin1 = '<?xml version="1.0" encoding="ISO-8859-1"?><name>Nestl\xe9</name>'
+
+        assert parser.parse_string(latin1.encode("latin-1")).text == "Nestl\xe9"
+        assert parser.parse_string(latin1).text == "Nestl\xe9"
+        assert parser.encoding is None
+        root = parser.parse_string(form4_xml)
+        assert root.findtext("issuer/issuerTradingSymbol") == "AAPL"
+
+    def test_external_entities_are_not_loaded(self, tmp_path):
+        """Test that external entities never read local files."""
+        secret = tmp_path / "secret.txt"
+        secret.write_text("SECRET")
+        xml = (
+            f'<!DOCTYPE ownershipDocument [<!ENTITY e SYSTEM "{secret.as_uri()}">]>'
+            "<ownershipDocument><documentType>4</documentType>"
+            "<issuer><issuerName>Acme&e;</issuerName></issuer></ownershipDocument>"
+        )
+        parser = OwnershipFormParser(xml)
+
+        assert "SECRET" not in parser.parse_issuer_info()["name"]
+        assert "SECRET" not in parser.root.findtext("issuer/issuerName")
+
     def test_init_with_invalid_xml(self, invalid_xml):
         """Test parser initialization with invalid XML raises exception."""
         with pytest.raises(OwnershipFormParseError):
@@ -179,6 +260,49 @@ class TestOwnershipFormParser:
         assert len(data['non_derivative_holdings']) == 1
         assert len(data['derivative_transactions']) == 1
 
+    def test_streaming_matches_standard_library(self, form4_xml, form5_xml):
+        """Test that the single-pass parse agrees with and without lxml."""
+        for xml in (form4_xml, form5_xml):
+            expected = OwnershipFormParser(xml).parse_all()
+            with patch.object(ownership_forms, "LXML_AVAILABLE", False), patch.object(
+                ownership_forms, "etree", ElementTree
+            ), patch.object(xml_parser, "LXML_AVAILABLE", False), patch.object(
+                xml_parser, "etree", ElementTree
+            ):
+                assert OwnershipFormParser(xml).parse_all() == expected
+
+    def test_child_paths_are_compiled_once(self, form4_xml):
+        """Test that relative paths are compiled to XPath and reused."""
+        if not ownership_forms.LXML_AVAILABLE:
+            pytest.skip("lxml not installed")
+
+        OwnershipFormParser(form4_xml)
+        xpath = ownership_forms._TEXT_XPATHS["transactionShares/value"]
+        parser = OwnershipFormParser(form4_xml)
+
+        assert ownership_forms._TEXT_XPATHS["transactionShares/value"] is xpath
+        assert parser.parse_non_derivative_transactions()[0]["shares"] == 1000.0
+
+    def test_repeated_records_in_document_order(self, form4_xml):
+        """Test that every transaction is kept, in document order."""
+        start = form4_xml.index("<nonDerivativeTransaction>")
+        end = form4_xml.index("</nonDerivativeTransaction>") + len(
+            "</nonDerivativeTransaction>"
+        )
+        transaction = form4_xml[start:end]
+        xml = form4_xml.replace(
+            transaction,
+            "".join(
+                transaction.replace(">1000<", f">{shares}<") for shares in range(50)
+            ),
+        )
+        parser = OwnershipFormParser(xml.encode("utf-8"))
+
+        assert [t["shares"] for t in parser.parse_non_derivative_transactions()] == [
+            float(shares) for shares in range(50)
+        ]
+        assert parser.parse_issuer_info()["name"] == "Apple Inc."
+
     def test_date_parsing_multiple_formats(self):
         """Test parsing dates in different formats."""
         parser = OwnershipFormParser("<test><documentType>4</documentType></test>")
@@ -197,6 +321,16 @@ class TestOwnershipFormParser:
             result = parser._get_date(elem)
             assert result == expected
 
+    def test_iso_date_fast_path(self):
+        """Test that ISO dates skip strptime and invalid ones still fail."""
+        parser = OwnershipFormParser("<test><documentType>4</documentType></test>")
+
+        with patch.object(ownership_forms, "datetime", wraps=datetime) as dt:
+            assert parser._parse_date("2024-01-15") == datetime(2024, 1, 15)
+            dt.strptime.assert_not_called()
+        assert parser._parse_date("2024-13-01") is None
+        assert parser._parse_date("2024-1-5") == datetime(2024, 1, 5)
+
     def test_date_parsing_invalid_format(self):
         """Test parsing invalid date formats returns None."""
         parser = OwnershipFormParser("<test><documentType>4</documentType></test>")
@@ -207,6 +341,73 @@ class TestOwnershipFormParser:
         result = parser._get_date(elem)
         assert result is None
 
+    def test_boolean_flags_accept_one(self, form4_xml):
+        """Test that flags given as 1/0 are read like true/false."""
+        xml = form4_xml.replace(
+            "<isDirector>true</isDirector>", "<isDirector>1</isDirector>"
+        ).replace("<isOfficer>true</isOfficer>", "<isOfficer>TRUE</isOfficer>")
+        relationship = OwnershipFormParser(xml).parse_reporting_owner_info()[
+            "relationship"
+        ]
+
+        assert relationship["is_director"] is True
+        assert relationship["is_officer"] is True
+        assert relationship["is_ten_percent_owner"] is False
+        assert ownership_forms._is_true("tRUE") is True
+        assert ownership_forms._is_true("0") is False
+
+    def test_non_derivative_transaction_columns(self, form4_xml):
+        """Test the column-wise view of non-derivative transactions."""
+        if not ownership_forms.NUMPY_AVAILABLE:
+            pytest.skip("numpy not installed")
+
+        parser = OwnershipFormParser(form4_xml)
+        transactions = parser.parse_non_derivative_transactions()
+        columns = parser.parse_non_derivative_transactions_columns()
+
+        assert columns["shares"].dtype == "float64"
+        assert columns["shares"].tolist() == [t["shares"] for t in transactions]
+        assert columns["code"] == [t["code"] for t in transactions]
+        assert columns["transaction_date"].tolist() == [
+            t["transaction_date"].date() for t in transactions
+        ]
+
+        derivative = parser.parse_derivative_transactions_columns()
+        assert derivative["underlying_security_shares"].tolist() == [
+            t["underlying_security"]["shares"]
+            for t in parser.parse_derivative_transactions()
+        ]
+
+        bare = OwnershipFormParser(
+            "<ownershipDocument><documentType>4</documentType>"
+            "<nonDerivativeTransaction/></ownershipDocument>"
+        ).parse_non_derivative_transactions_columns()
+        assert len(bare["price_per_share"]) == 1
+        assert bare["price_per_share"][0] != bare["price_per_share"][0]
+        assert bare["security_title"] == [None]
+        assert str(bare["transaction_date"][0]) == "NaT"
+
+    def test_records_only_include_present_groups(self):
+        """Test that field groups are set only when their element exists."""
+        parser = OwnershipFormParser(
+            "<ownershipDocument><documentType>4</documentType>"
+            "<derivativeTransaction>"
+            "<transactionAmounts><transactionShares><value>10</value>"
+            "</transactionShares></transactionAmounts>"
+            "<underlyingSecurity><underlyingSecurityTitle><value>Common</value>"
+            "</underlyingSecurityTitle></underlyingSecurity>"
+            "</derivativeTransaction></ownershipDocument>"
+        )
+
+        assert parser.parse_derivative_transactions() == [
+            {
+                "shares": 10.0,
+                "total_value": 0.0,
+                "acquired_disposed_code": "",
+                "underlying_security": {"title": "Common", "shares": 0.0},
+            }
+        ]
+
     def test_get_text_with_none_element(self):
         """Test _get_text method with None element."""
         parser = OwnershipFormParser("<test><documentType>4</documentType></test>")
@@ -269,6 +470,23 @@ class TestForm5Parser:
 class TestIntegration:
     """Integration tests for the ownership form parsers."""
 
+    @responses.activate
+    def test_parse_from_http_stream(self, form4_xml):
+        """Test parsing a gzip-encoded response body as it streams in."""
+        url = "https://www.sec.gov/Archives/edgar/data/320193/form4.xml"
+        responses.add(
+            responses.GET,
+            url,
+            body=gzip.compress(form4_xml.encode("utf-8")),
+            headers={"Content-Encoding": "gzip"},
+        )
+
+        client = HttpClient("TestApp/1.0 (test@example.com)")
+        with client, client.stream(url) as body:
+            data = Form4Parser.parse_all_streaming(body)
+
+        assert data == Form4Parser(form4_xml).parse_all()
+
     def test_form4_complete_parsing(self, form4_xml):
         """Test complete Form 4 parsing workflow."""
         parser = Form4Parser(form4_xml)
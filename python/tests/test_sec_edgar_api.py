@@ -7,6 +7,7 @@ including tests for all endpoints, error handling, rate limiting, and caching.
 
 from __future__ import annotations
 
+import sys
 import time
 from typing import Any, Dict
 from unittest.mock import patch
@@ -24,6 +25,7 @@ from sec_edgar_toolkit import (
     SecEdgarApi,
     SecEdgarApiError,
 )
+from sec_edgar_toolkit.endpoints.company import AHOCORASICK_AVAILABLE
 
 
 class TestSecEdgarApi:
@@ -98,6 +100,19 @@ class TestSecEdgarApi:
         assert len(responses.calls) == 2
         assert result1 == result3
 
+    @responses.activate
+    def test_get_company_tickers_invalid_json(self, api_client: SecEdgarApi) -> None:
+        """Test that a malformed tickers payload raises SecEdgarApiError."""
+        responses.add(
+            responses.GET,
+            api_client.company.COMPANY_TICKERS_URL,
+            body='{"fields": ["cik", "name"], "data": [[1, ',
+            status=200,
+        )
+
+        with pytest.raises(SecEdgarApiError, match="API request failed"):
+            api_client.get_company_tickers()
+
     @responses.activate
     def test_get_company_by_ticker_found(
         self, api_client: SecEdgarApi, mock_company_tickers: Dict[str, Any]
@@ -170,6 +185,14 @@ class TestSecEdgarApi:
         assert company is not None
         assert company["cik_str"] == "0000320193"
 
+    def test_pad_cik(self) -> None:
+        """Test CIK padding for strings, ints and other integer types."""
+        from sec_edgar_toolkit.utils.cik import pad_cik
+
+        np = pytest.importorskip("numpy")
+        assert pad_cik("320193") == pad_cik(320193) == "0000320193"
+        assert pad_cik(np.int64(320193)) == "0000320193"
+
     @responses.activate
     def test_get_company_by_cik_not_found(
         self, api_client: SecEdgarApi, mock_company_tickers: Dict[str, Any]
@@ -211,6 +234,32 @@ class TestSecEdgarApi:
         results = api_client.search_companies("Tesla")
         assert len(results) == 0
 
+    @pytest.mark.parametrize("use_automaton", [True, False])
+    @responses.activate
+    def test_search_companies_many(
+        self,
+        api_client: SecEdgarApi,
+        mock_company_tickers: Dict[str, Any],
+        use_automaton: bool,
+    ) -> None:
+        """Test searching several company names in one pass."""
+        responses.add(
+            responses.GET,
+            api_client.company.COMPANY_TICKERS_URL,
+            json=mock_company_tickers,
+            status=200,
+        )
+
+        with patch(
+            "sec_edgar_toolkit.endpoints.company.AHOCORASICK_AVAILABLE",
+            use_automaton and AHOCORASICK_AVAILABLE,
+        ):
+            results = api_client.search_companies_many(["Inc", "apple", "Tesla"])
+
+        assert [c["ticker"] for c in results["Inc"]] == ["AAPL", "GOOGL"]
+        assert [c["ticker"] for c in results["apple"]] == ["AAPL"]
+        assert results["Tesla"] == []
+
     @responses.activate
     def test_get_company_submissions_success(
         self, api_client: SecEdgarApi, mock_company_submissions: CompanySubmissions
@@ -496,6 +545,7 @@ class TestSecEdgarApi:
 
         with patch.object(api_client.http_client.session, 'get') as mock_get:
             mock_get.return_value.json.return_value = {"data": []}
+            mock_get.return_value.content = b'{"data": []}'
             mock_get.return_value.status_code = 200
 
             start = time.time()
@@ -506,6 +556,26 @@ class TestSecEdgarApi:
             # Should have waited at least rate_limit_delay between requests
             assert elapsed >= api_client.http_client.rate_limit_delay
 
+    def test_rate_limit_token_bucket(self) -> None:
+        """Test bursts and queued waits of the rate-limit token bucket."""
+        from sec_edgar_toolkit.utils import HttpClient
+
+        clock = [100.0]
+        with patch("sec_edgar_toolkit.utils.http.time.monotonic", lambda: clock[0]):
+            client = HttpClient(
+                "TestApp/1.0 (test@test.com)", rate_limit_delay=0.1, rate_limit_burst=3
+            )
+            waits = [client._reserve_request() for _ in range(5)]
+            assert waits == pytest.approx([0.0, 0.0, 0.0, 0.1, 0.2])
+
+            # Idle time refills the bucket, but never above the burst size
+            clock[0] += 10
+            waits = [client._reserve_request() for _ in range(4)]
+            assert waits == pytest.approx([0.0, 0.0, 0.0, 0.1])
+
+            client.rate_limit_delay = 0
+            assert client._reserve_request() == 0.0
+
     def test_error_handling_rate_limit(self, api_client: SecEdgarApi) -> None:
         """Test handling of rate limit errors."""
         # Override the session to remove 429 from retry status codes
@@ -588,6 +658,252 @@ class TestSecEdgarApi:
         assert api_client.http_client.session.headers["Accept"] == "application/json"
         assert "gzip" in api_client.http_client.session.headers["Accept-Encoding"]
 
+    def test_close_releases_session(self) -> None:
+        """Test that the client can be used as a context manager."""
+        api = SecEdgarApi("TestApp/1.0 (test@test.com)")
+        with patch.object(api.http_client.session, "close") as mock_close, api:
+            pass
+        mock_close.assert_called_once()
+
+    @responses.activate
+    def test_stream_error_closes_response(self) -> None:
+        """Test that a streamed error response is closed before raising."""
+        import requests
+
+        from sec_edgar_toolkit.utils import HttpClient
+
+        url = "http://test.com/missing"
+        responses.add(responses.GET, url, status=404)
+        client = HttpClient("TestApp/1.0 (test@test.com)", rate_limit_delay=0)
+
+        with patch.object(
+            requests.Response, "close", autospec=True
+        ) as mock_close, pytest.raises(NotFoundError), client.stream(url):
+            pass
+        mock_close.assert_called_once()
+
+    def test_shared_http_client_is_reused(self) -> None:
+        """Test that a caller-supplied client is shared and left open."""
+        from sec_edgar_toolkit.utils import HttpClient
+
+        http_client = HttpClient("TestApp/1.0 (test@test.com)")
+        api = SecEdgarApi("TestApp/1.0 (test@test.com)", http_client=http_client)
+        assert api.company.http_client is http_client
+        assert api.filings.http_client is http_client
+        assert api.xbrl.http_client is http_client
+
+        with patch.object(http_client.session, "close") as mock_close:
+            api.close()
+        mock_close.assert_not_called()
+
+    @responses.activate
+    def test_cached_company_facts(self, tmp_path: Any) -> None:
+        """Test that cached responses skip the network until they expire."""
+        url = "https://data.sec.gov/api/xbrl/companyfacts/CIK0000789019.json"
+        responses.add(
+            responses.GET,
+            url,
+            json={"entityName": "MICROSOFT CORP"},
+            headers={"Last-Modified": "Mon, 04 Mar 2024 00:00:00 GMT"},
+            status=200,
+        )
+        api = SecEdgarApi(
+            "TestApp/1.0 (test@test.com)", cache=True, cache_dir=str(tmp_path)
+        )
+
+        assert api.get_company_facts("789019")["entityName"] == "MICROSOFT CORP"
+        assert api.get_company_facts("789019")["entityName"] == "MICROSOFT CORP"
+        assert len(responses.calls) == 1
+
+        # Expired entries are revalidated with If-Modified-Since
+        responses.replace(responses.GET, url, status=304)
+        api.xbrl.COMPANY_FACTS_TTL = 0
+        assert api.get_company_facts("789019")["entityName"] == "MICROSOFT CORP"
+        assert len(responses.calls) == 2
+        assert (
+            responses.calls[1].request.headers["If-Modified-Since"]
+            == "Mon, 04 Mar 2024 00:00:00 GMT"
+        )
+
+    def test_endpoint_urls_match_urljoin(self, api_client: SecEdgarApi) -> None:
+        """Test that endpoint URLs are identical to the urljoin-built ones."""
+        from urllib.parse import urljoin
+
+        data_url = "https://data.sec.gov/"
+        base_url = "https://data.sec.gov/api/xbrl/"
+        calls = [
+            (
+                lambda: api_client.get_company_submissions(320193),
+                urljoin(data_url, "submissions/CIK0000320193.json"),
+            ),
+            (
+                lambda: api_client.get_filing("320193", "0000320193-23-000077"),
+                urljoin(
+                    data_url,
+                    "Archives/edgar/data/0000320193/000032019323000077/"
+                    "0000320193-23-000077-index.json",
+                ),
+            ),
+            (
+                lambda: api_client.get_company_facts("320193"),
+                urljoin(data_url, "api/xbrl/companyfacts/CIK0000320193.json"),
+            ),
+            (
+                lambda: api_client.get_company_concept(
+                    "320193", "us-gaap", "AccountsPayableCurrent"
+                ),
+                urljoin(
+                    base_url,
+                    "companyconcept/CIK0000320193/us-gaap/AccountsPayableCurrent.json",
+                ),
+            ),
+            (
+                lambda: api_client.get_frames("us-gaap", "Revenues", "USD", 2023, 1),
+                urljoin(base_url, "frames/us-gaap/Revenues/USD/CY2023Q1.json"),
+            ),
+        ]
+
+        for call, expected in calls:
+            with patch.object(
+                api_client.http_client, "get_cached", return_value={}
+            ) as mock_get:
+                call()
+            assert mock_get.call_args[0][0] == expected
+
+    @responses.activate
+    def test_company_facts_memoized(self, api_client: SecEdgarApi) -> None:
+        """Test that recent company facts are served from memory with LRU eviction."""
+        for cik in ("0000000001", "0000000002"):
+            responses.add(
+                responses.GET,
+                f"https://data.sec.gov/api/xbrl/companyfacts/CIK{cik}.json",
+                json={"cik": cik},
+                status=200,
+            )
+        api_client.xbrl.memory_cache_size = 1
+
+        assert api_client.get_company_facts(1) == {"cik": "0000000001"}
+        assert api_client.get_company_facts("0000000001") == {"cik": "0000000001"}
+        assert len(responses.calls) == 1
+
+        api_client.get_company_facts(2)
+        api_client.get_company_facts(1)
+        assert len(responses.calls) == 3
+
+    @responses.activate
+    def test_company_concept_unit_filter_keeps_cache(
+        self, api_client: SecEdgarApi
+    ) -> None:
+        """Test that filtering by unit does not alter the memoized payload."""
+        responses.add(
+            responses.GET,
+            "https://data.sec.gov/api/xbrl/companyconcept/CIK0000320193/us-gaap/Assets.json",
+            json={"units": {"USD": [1], "EUR": [2]}},
+            status=200,
+        )
+
+        filtered = api_client.get_company_concept("320193", "us-gaap", "Assets", "USD")
+        full = api_client.get_company_concept("320193", "us-gaap", "Assets")
+
+        assert filtered["units"] == {"USD": [1]}
+        assert full["units"] == {"USD": [1], "EUR": [2]}
+        assert len(responses.calls) == 1
+
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    @responses.activate
+    def test_json_decoding(self, api_client: SecEdgarApi, use_orjson: bool) -> None:
+        """Test JSON decoding with and without orjson."""
+        from sec_edgar_toolkit.utils import http
+
+        if use_orjson and not http.ORJSON_AVAILABLE:
+            pytest.skip("orjson not installed")
+
+        responses.add(
+            responses.GET,
+            "https://data.sec.gov/good.json",
+            json={"name": "APPLE INC", "values": [1, 2.5, None]},
+            status=200,
+        )
+        responses.add(
+            responses.GET, "https://data.sec.gov/bad.json", body="not json", status=200
+        )
+
+        with patch.object(http, "ORJSON_AVAILABLE", use_orjson):
+            data = api_client.http_client.get("https://data.sec.gov/good.json")
+            assert data == {"name": "APPLE INC", "values": [1, 2.5, None]}
+            with pytest.raises(SecEdgarApiError):
+                api_client.http_client.get("https://data.sec.gov/bad.json")
+
+    def test_aget_many_concepts(self, api_client: SecEdgarApi) -> None:
+        """Test concurrent concept fetches over the shared async client."""
+        import asyncio
+
+        httpx = pytest.importorskip("httpx")
+
+        requested = []
+
+        def handler(request: Any) -> Any:
+            requested.append(str(request.url))
+            return httpx.Response(
+                200, json={"tag": request.url.path, "units": {"USD": [1], "EUR": [2]}}
+            )
+
+        http_client = api_client.http_client
+        http_client.rate_limit_delay = 0
+        http_client._async_client = httpx.AsyncClient(
+            transport=httpx.MockTransport(handler)
+        )
+
+        async def run() -> Any:
+            try:
+                return await api_client.xbrl.aget_many_concepts(
+                    320193,
+                    [("us-gaap", "Assets", "USD"), ("us-gaap", "Revenues", None)],
+                    max_concurrency=2,
+                )
+            finally:
+                await api_client.aclose()
+
+        assets, revenues = asyncio.run(run())
+
+        assert assets["units"] == {"USD": [1]}
+        assert revenues["units"] == {"USD": [1], "EUR": [2]}
+        assert sorted(requested) == [
+            "https://data.sec.gov/api/xbrl/companyconcept/CIK0000320193/us-gaap/Assets.json",
+            "https://data.sec.gov/api/xbrl/companyconcept/CIK0000320193/us-gaap/Revenues.json",
+        ]
+        assert http_client._async_client is None
+
+    def test_http2_without_httpx_falls_back_to_requests(self) -> None:
+        """Test that requesting HTTP/2 without httpx keeps the requests session."""
+        with patch("sec_edgar_toolkit.utils.http.HTTPX_AVAILABLE", False):
+            api = SecEdgarApi("TestApp/1.0 (test@test.com)", http2=True)
+        assert api.http_client._http2_client is None
+
+    def test_async_client_pool_limits(self) -> None:
+        """Test that the async connection pool honours max_connections."""
+        from sec_edgar_toolkit.utils import HttpClient
+
+        pytest.importorskip("httpx")
+        client = HttpClient("TestApp/1.0 (test@test.com)", max_connections=7)
+        async_client = client._get_async_client()
+        assert async_client._transport._pool._max_connections == 7
+
+    def test_http2_pool_limits_and_missing_h2(self) -> None:
+        """Test HTTP/2 pool sizing and the fallback when h2 is not installed."""
+        from sec_edgar_toolkit.utils import HttpClient
+
+        pytest.importorskip("h2")
+        client = HttpClient(
+            "TestApp/1.0 (test@test.com)", http2=True, max_connections=7
+        )
+        assert client._http2_client._transport._pool._max_connections == 7
+
+        with patch.dict(sys.modules, {"h2": None}):
+            client = HttpClient("TestApp/1.0 (test@test.com)", http2=True)
+        assert client._http2_client is None
+        assert client._http2 is False
+
     def test_filter_filings_empty(self, api_client: SecEdgarApi) -> None:
         """Test filtering with empty filings."""
         from sec_edgar_toolkit.utils.filters import FilingFilter
@@ -652,6 +968,38 @@ class TestSecEdgarApi:
         assert result["accessionNumber"] == ["002"]
         assert result["form"] == ["10-Q"]
 
+    @pytest.mark.parametrize("numpy_available", [True, False])
+    def test_filter_filings_large_input(self, numpy_available: bool) -> None:
+        """Test that vectorized and row-by-row filtering agree."""
+        from sec_edgar_toolkit.utils import filters
+
+        if numpy_available and not filters.NUMPY_AVAILABLE:
+            pytest.skip("numpy not installed")
+
+        count = 1000
+        filings = {
+            "accessionNumber": [f"{i:06d}" for i in range(count)],
+            "form": ["10-K" if i % 4 == 0 else "10-Q" for i in range(count)],
+            "filingDate": [f"20{10 + i % 14}-0{1 + i % 9}-15" for i in range(count)],
+            "primaryDocument": [f"doc{i}.htm" for i in range(count)],
+        }
+        expected = [
+            acc
+            for acc, form, date in zip(
+                filings["accessionNumber"], filings["form"], filings["filingDate"]
+            )
+            if form == "10-K" and "2015-01-01" <= date <= "2020-06-30"
+        ]
+
+        with patch.object(filters, "NUMPY_AVAILABLE", numpy_available):
+            result = filters.FilingFilter.filter_filings(
+                filings, "10-K", "2015-01-01", "2020-06-30"
+            )
+
+        assert result["accessionNumber"] == expected
+        assert len(result["primaryDocument"]) == len(expected)
+        assert all(isinstance(acc, str) for acc in result["accessionNumber"])
+
 
 class TestTypeDefinitions:
     """Test type definitions and TypedDict structures."""